@@ -0,0 +1,18 @@
+"""
+Command line entry of the package, inspect maya ascii files without the GUI
+
+```
+python -m mayaAsciiViewer shot.ma --json
+```
+"""
+
+import multiprocessing
+import sys
+
+from mayaAsciiViewer import asciiInspect
+
+
+if __name__ == '__main__':
+    # inspecting many files runs them in worker processes
+    multiprocessing.freeze_support()
+    sys.exit(asciiInspect.main())
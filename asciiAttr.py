@@ -0,0 +1,382 @@
+"""
+Module for parsing the sub statements of an ascii block and decoding the
+numeric values of 'setAttr' into numpy arrays
+
+Scripting:
+```
+detail = block.asc.read_bytes(block.offset, block.size)
+for statement in iter_statements(detail):
+    print(statement.attr, statement.size)
+
+arrays = get_arrays(detail)
+print(arrays['.vt'].shape)  # (vertex count, 3)
+```
+
+Example:
+```
+createNode mesh -n "pCubeShape1" -p "pCube1";
+    setAttr -s 8 ".vt[0:7]"  -0.5 -0.5 0.5 0.5 -0.5 0.5 -0.5 0.5 0.5 0.5 0.5 0.5
+         -0.5 0.5 -0.5 0.5 0.5 -0.5 -0.5 -0.5 -0.5 0.5 -0.5 -0.5;
+    setAttr -s 12 ".ed[0:11]"  0 1 0 2 3 0 4 5 0 6 7 0 0 2 0 1 3 0 2 4 0
+         3 5 0 4 6 0 5 7 0 6 0 0 7 1 0;
+```
+
+Statements are located by their headers only, values stay as byte ranges
+of the detail until they are decoded, and decoding converts the whole
+value range with a single numpy call.
+"""
+
+import re
+from collections import namedtuple, OrderedDict
+
+import numpy as np
+
+
+# a statement starts on a line with a single indentation
+NEXT_RE = re.compile(br'\n\t(?!\t)')
+COMMAND_RE = re.compile(br'\t(\w+)')
+SET_ATTR_RE = re.compile(
+    br'\tsetAttr'
+    br'(?P<flags>(?:\s+-\w+(?:\s+[^-"\s]\S*)?)*)'
+    br'\s+"(?P<attr>[^"]*)"'
+    br'(?:\s+-type\s+"(?P<typ>[^"]*)")?'
+)
+SIZE_RE = re.compile(br'-s\s+(\d+)')
+RANGE_RE = re.compile(r'\[(\d+)(?::(\d+))?\]$')
+FACE_RE = re.compile(br'\bf\s+(\d+)([-\d\s]*)')
+
+# dtype and component count of fixed size data types
+FIXED_TYPES = {
+    'short2': (np.int16, 2),
+    'short3': (np.int16, 3),
+    'long2': (np.int32, 2),
+    'long3': (np.int32, 3),
+    'float2': (np.float32, 2),
+    'float3': (np.float32, 3),
+    'double2': (np.float64, 2),
+    'double3': (np.float64, 3),
+    'double4': (np.float64, 4),
+    'matrix': (np.float64, 16),
+}
+
+# dtype and component count of data types prefixed with an element count
+COUNTED_TYPES = {
+    'doubleArray': (np.float64, 1),
+    'Int32Array': (np.int32, 1),
+    'vectorArray': (np.float64, 3),
+    'pointArray': (np.float64, 4),
+}
+
+# attributes holding integers when no data type is given
+INT_ATTRS = {'.ed'}
+
+BOOLEANS = {b'yes': 1, b'no': 0, b'on': 1, b'off': 0, b'true': 1, b'false': 0}
+
+# transformation matrix stored as its components, e.g. bind poses
+# -type "matrix" "xform" scale(3) rotate(3) rotateOrder translate(3)
+#     shear(3) scalePivot(3) scalePivotTranslate(3) rotatePivot(3)
+#     rotatePivotTranslate(3) rotateAxis(4) jointOrient(4)
+#     inverseParentScale(3) compensateForParentScale
+XFORM = b'"xform"'
+XFORM_WIDTH = 37
+
+
+StatementBase = namedtuple('StatementBase',
+                           ['command', 'attr', 'typ', 'length', 'start',
+                            'value', 'end'])
+
+
+class Statement(StatementBase):
+    """
+    A sub statement of an ascii block, positions are byte offsets into the
+    block detail
+    """
+    __slots__ = ()
+
+    def __new__(
+        cls,
+        command,
+        attr='',
+        typ='',
+        length=None,
+        start=0,
+        value=0,
+        end=0
+    ):
+        """
+        Initialization
+
+        Example:
+        ```
+            setAttr -s 3 ".ktv[0:2]"  1 0 10 2.5 20 2.5;
+        ```
+
+        :param command: str. mel command name (i.e. setAttr)
+        :param attr: str. attribute name (i.e. .ktv[0:2])
+        :param typ: str. data type given by '-type'
+        :param length: int. array length given by '-s'
+        :param start: int. start position of the statement
+        :param value: int. start position of the values
+        :param end: int. end position of the statement
+        """
+        return super(Statement, cls).__new__(
+            cls, command, attr, typ, length, start, value, end)
+
+    @property
+    def size(self):
+        """
+        Size of the full statement in bytes
+
+        :return: int.
+        """
+        return self.end - self.start
+
+    @property
+    def base(self):
+        """
+        Attribute name without the trailing index (i.e. .ktv)
+
+        :return: str.
+        """
+        return RANGE_RE.sub('', self.attr)
+
+    @property
+    def count(self):
+        """
+        Number of elements given by the trailing index range of the
+        attribute, [0:2] has 3 elements and [5] has 1 element
+
+        :return: int or None. element count, None if there is no index
+        """
+        match = RANGE_RE.search(self.attr)
+        if not match:
+            return None
+        first, last = match.groups()
+        if last is None:
+            return 1
+        return int(last) - int(first) + 1
+
+
+def iter_statements(detail):
+    """
+    Iterate sub statements of a block by scanning the headers, the values
+    are not read
+
+    :param detail: bytes or memoryview. raw content of an ascii block
+    :return: generator of Statement.
+    """
+    match = NEXT_RE.search(detail)
+    while match:
+        start = match.start() + 1
+        match = NEXT_RE.search(detail, start)
+        end = match.start() + 1 if match else len(detail)
+
+        header = SET_ATTR_RE.match(detail, start, end)
+        if header:
+            length = SIZE_RE.search(header.group('flags'))
+            yield Statement(
+                'setAttr',
+                header.group('attr').decode('utf-8', 'replace'),
+                (header.group('typ') or b'').decode('utf-8', 'replace'),
+                int(length.group(1)) if length else None,
+                start,
+                header.end(),
+                end
+            )
+            continue
+
+        command = COMMAND_RE.match(detail, start, end)
+        yield Statement(
+            command.group(1).decode('utf-8', 'replace') if command else '',
+            start=start,
+            value=command.end() if command else start,
+            end=end
+        )
+
+
+def get_value(detail, statement):
+    """
+    Get the raw value of a statement, without the trailing ';'
+
+    :param detail: bytes or memoryview. raw content of an ascii block
+    :param statement: Statement. statement of the block
+    :return: bytes. raw value
+    """
+    value = bytes(detail[statement.value:statement.end])
+    return value.rstrip().rstrip(b';').strip()
+
+
+def from_string(value, dtype):
+    """
+    Decode whitespace separated numbers
+
+    :param value: bytes. raw numbers
+    :param dtype: np.dtype. type of the numbers
+    :return: np.ndarray or None. None if the value holds anything else
+             than numbers
+    """
+    try:
+        return np.fromstring(value, dtype=dtype, sep=' ')
+    except ValueError:
+        return None
+
+
+def get_xform(value):
+    """
+    Decode an 'xform' matrix, the trailing flag is stored as the last
+    component
+
+    Example:
+    ```
+    "xform" 1 1 1 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0
+        0 0 0 0 0 0 0 0 0 0 1 0 0 0 1 1 1 1 yes
+    ```
+
+    :param value: bytes. raw matrix value
+    :return: np.ndarray or None. components of the matrix
+    """
+    numbers, _, flag = value[len(XFORM):].rstrip().rpartition(b' ')
+    if flag not in BOOLEANS:
+        return None
+    array = from_string(numbers, np.float64)
+    if array is None or len(array) != XFORM_WIDTH - 1:
+        return None
+    return np.append(array, BOOLEANS[flag])
+
+
+def get_poly_faces(value):
+    """
+    Decode the face records of 'polyFaces' data
+
+    Example:
+    ```
+    f 3 0 4 -3
+    mu 0 3 0 1 2
+    ```
+
+    :param value: bytes. raw polyFaces value
+    :return: tuple (np.ndarray, np.ndarray). edge count of each face,
+             and the concatenated face edge indices
+    """
+    counts = list()
+    edges = list()
+    for match in FACE_RE.finditer(value):
+        counts.append(match.group(1))
+        edges.append(match.group(2))
+    return (
+        np.fromstring(b' '.join(counts), dtype=np.int32, sep=' '),
+        np.fromstring(b' '.join(edges), dtype=np.int32, sep=' ')
+    )
+
+
+def to_array(detail, statement):
+    """
+    Decode the value of a 'setAttr' statement into a numpy array, elements
+    of a ranged attribute (e.g. .vt[0:7]) or data types with multiple
+    components (e.g. double3) are decoded as rows
+
+    :param detail: bytes. raw content of an ascii block
+    :param statement: Statement. statement of the block
+    :return: np.ndarray, tuple or None. None if the value is not numeric,
+             'polyFaces' values are a tuple (counts, edges) of
+             get_poly_faces()
+    """
+    if statement.command != 'setAttr':
+        return None
+
+    value = get_value(detail, statement)
+    if not value:
+        return None
+
+    count = statement.count
+    if statement.typ == 'polyFaces':
+        return get_poly_faces(value)
+
+    if statement.typ == 'matrix' and value.startswith(XFORM):
+        array = get_xform(value)
+        if array is None:
+            return None
+        return array.reshape(1, -1) if count else array
+
+    if statement.typ in COUNTED_TYPES:
+        dtype, width = COUNTED_TYPES[statement.typ]
+        array = from_string(value, dtype)
+        if array is None or (len(array) - 1) % width:
+            return None
+        array = array[1:]
+        return array.reshape(-1, width) if width > 1 else array
+
+    if statement.typ in FIXED_TYPES:
+        dtype, width = FIXED_TYPES[statement.typ]
+        array = from_string(value, dtype)
+        if array is None or len(array) % width:
+            return None
+        if statement.typ == 'matrix':
+            return array.reshape(-1, 4, 4) if count else array.reshape(4, 4)
+        return array.reshape(-1, width) if count else array
+
+    if statement.typ:
+        return None
+
+    # booleans and enum names
+    if value[:1].isalpha():
+        tokens = value.split()
+        if not all(token in BOOLEANS for token in tokens):
+            return None
+        return np.array([BOOLEANS[token] for token in tokens], dtype=np.int8)
+
+    dtype = np.int32 if statement.base in INT_ATTRS else np.float64
+    array = from_string(value, dtype)
+    if array is None:
+        return None
+    if count and len(array) % count == 0 and len(array) > count:
+        return array.reshape(count, -1)
+    return array
+
+
+def get_arrays(detail, attrs=None):
+    """
+    Decode all numeric 'setAttr' values of a block, arrays split into
+    multiple statements (e.g. .vt[0:165] and .vt[166:331]) are concatenated
+
+    :param detail: bytes. raw content of an ascii block
+    :param attrs: list of str. attribute names without index to decode
+                  (e.g. ['.vt', '.ed']), decode all attributes by default
+    :return: OrderedDict. attribute name to np.ndarray, or to a tuple
+             (counts, edges) for 'polyFaces'
+    """
+    chunks = OrderedDict()
+    for statement in iter_statements(detail):
+        if statement.command != 'setAttr':
+            continue
+        if attrs is not None and statement.base not in attrs:
+            continue
+
+        array = to_array(detail, statement)
+        if array is None:
+            continue
+        chunks.setdefault(statement.base, list()).append(array)
+
+    results = OrderedDict()
+    for attr, arrays in chunks.items():
+        if len(arrays) == 1:
+            results[attr] = arrays[0]
+        elif isinstance(arrays[0], tuple):
+            results[attr] = tuple(np.concatenate(parts) for parts in zip(*arrays))
+        elif len(set(array.shape[1:] for array in arrays)) == 1:
+            results[attr] = np.concatenate(arrays)
+        else:
+            results[attr] = np.concatenate([a.ravel() for a in arrays])
+    return results
+
+
+def read_arrays(block, attrs=None):
+    """
+    Read and decode all numeric 'setAttr' values of an ascii block
+
+    :param block: AsciiBlock. ascii block with a valid offset
+    :param attrs: list of str. attribute names without index to decode
+    :return: OrderedDict. attribute name to np.ndarray, or to a tuple
+             (counts, edges) for 'polyFaces'
+    """
+    return get_arrays(block.asc.read_bytes(block.offset, block.size), attrs)
@@ -34,7 +34,8 @@ from collections import namedtuple
 
 
 AsciiBase = namedtuple('AsciiBase',
-                       ['asc', 'index', 'desc', 'size', 'command', 'args'])
+                       ['asc', 'index', 'desc', 'size', 'command', 'args',
+                        'offset', 'digest'])
 
 
 def get_distribution(blocks):
@@ -72,7 +73,9 @@ class AsciiBlock(AsciiBase):
         desc='',
         size=0,
         command='',
-        args=None
+        args=None,
+        offset=-1,
+        digest=None
     ):
         """
         Initialization
@@ -98,8 +101,12 @@ class AsciiBlock(AsciiBase):
         :param command: str. parent mel command's name (i.e. createNode)
         :param args: list. parent mel command's arguments (i.e. [transform,
                      -s, -n, "persp"])
+        :param offset: int. start byte position of the current data in file
+        :param digest: bytes. hash of the full mel commands data, only
+                       computed when requested by the loader
         """
-        return super(AsciiBlock, cls).__new__(cls, asc, index, desc, size, command, args)
+        return super(AsciiBlock, cls).__new__(
+            cls, asc, index, desc, size, command, args, offset, digest)
 
     def __str__(self):
         return '{}({}, {}, {})'.format(
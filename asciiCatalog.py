@@ -0,0 +1,610 @@
+"""
+Module for keeping a persistent SQLite catalog of many maya ascii files,
+library wide questions are answered from the catalog without reopening
+any file
+
+Scripting:
+```
+catalog = Catalog(r'C:/library.db')
+catalog.update(expand_paths([r'C:/library']), workers=8)
+
+catalog.find_requires('mtoa', '3.')           # scenes requiring mtoa 3.x
+catalog.find_references('rigs/hero_rig.ma')   # scenes referencing a rig
+catalog.find_heavy('animCurve%', 1 << 30)     # over 1 GB of anim curves
+catalog.find_geometry(1000000)                 # meshes over 1M vertices
+catalog.find_edits(1 << 20)                    # over 1 MB of reference edits
+catalog.find_redundant(10000)                  # many redundant keys
+catalog.close()
+```
+
+Command line:
+```
+python -m mayaAsciiViewer.asciiCatalog library.db update /library
+python -m mayaAsciiViewer.asciiCatalog library.db requires mtoa --version 3.
+python -m mayaAsciiViewer.asciiCatalog library.db heavy "animCurve%" 1073741824
+python -m mayaAsciiViewer.asciiCatalog library.db geometry 1000000
+```
+
+Each scene row keeps the file size and modification time it was scanned
+with, unchanged files are skipped on update and deleted files are removed.
+Anim curves, geometries and reference edits are stored per item with the
+results of their extractors. Catalogs written by an older schema are
+rescanned on their next update. Files are summarized in worker
+processes and the main process is the single writer, results are inserted
+in bulk with one transaction per batch of scenes.
+"""
+
+import argparse
+import multiprocessing
+import os
+import sqlite3
+from collections import OrderedDict
+from concurrent import futures
+
+from . import asciiBlock, asciiInspect, asciiLoader
+from .block import animation, geometry, referenceEdit
+
+
+# scenes written per transaction
+BATCH_SIZE = 64
+# bumped when the tables change, older catalogs are rescanned
+SCHEMA_VERSION = 2
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS scene (
+    id INTEGER PRIMARY KEY,
+    path TEXT UNIQUE NOT NULL,
+    disk_size INTEGER NOT NULL,
+    mtime REAL NOT NULL,
+    size INTEGER,
+    blocks INTEGER,
+    nodes INTEGER,
+    node_size INTEGER,
+    connection_size INTEGER,
+    other_size INTEGER,
+    min REAL,
+    max REAL,
+    start REAL,
+    end REAL,
+    error TEXT
+);
+CREATE TABLE IF NOT EXISTS requirement (
+    scene_id INTEGER NOT NULL REFERENCES scene(id) ON DELETE CASCADE,
+    name TEXT,
+    version TEXT
+);
+CREATE TABLE IF NOT EXISTS info (
+    scene_id INTEGER NOT NULL REFERENCES scene(id) ON DELETE CASCADE,
+    keyword TEXT,
+    value TEXT
+);
+CREATE TABLE IF NOT EXISTS reference (
+    scene_id INTEGER NOT NULL REFERENCES scene(id) ON DELETE CASCADE,
+    path TEXT,
+    ref_node TEXT,
+    namespace TEXT,
+    typ TEXT
+);
+CREATE TABLE IF NOT EXISTS audio (
+    scene_id INTEGER NOT NULL REFERENCES scene(id) ON DELETE CASCADE,
+    name TEXT,
+    path TEXT
+);
+CREATE TABLE IF NOT EXISTS type_size (
+    scene_id INTEGER NOT NULL REFERENCES scene(id) ON DELETE CASCADE,
+    typ TEXT,
+    count INTEGER,
+    size INTEGER
+);
+CREATE TABLE IF NOT EXISTS anim_curve (
+    scene_id INTEGER NOT NULL REFERENCES scene(id) ON DELETE CASCADE,
+    name TEXT,
+    typ TEXT,
+    keys INTEGER,
+    start REAL,
+    end REAL,
+    static INTEGER,
+    redundant INTEGER
+);
+CREATE TABLE IF NOT EXISTS geometry (
+    scene_id INTEGER NOT NULL REFERENCES scene(id) ON DELETE CASCADE,
+    name TEXT,
+    typ TEXT,
+    vertices INTEGER,
+    edges INTEGER,
+    faces INTEGER,
+    uv_sets INTEGER,
+    uvs INTEGER,
+    size INTEGER,
+    vertex_size INTEGER,
+    edge_size INTEGER,
+    face_size INTEGER,
+    uv_size INTEGER
+);
+CREATE TABLE IF NOT EXISTS reference_edit (
+    scene_id INTEGER NOT NULL REFERENCES scene(id) ON DELETE CASCADE,
+    ref_node TEXT,
+    path TEXT,
+    namespace TEXT,
+    edits INTEGER,
+    set_attr INTEGER,
+    connect_attr INTEGER,
+    disconnect_attr INTEGER,
+    parent INTEGER,
+    add_attr INTEGER,
+    other INTEGER,
+    size INTEGER
+);
+CREATE INDEX IF NOT EXISTS requirement_name ON requirement(name);
+CREATE INDEX IF NOT EXISTS info_keyword ON info(keyword);
+CREATE INDEX IF NOT EXISTS reference_path ON reference(path);
+CREATE INDEX IF NOT EXISTS type_size_typ ON type_size(typ, size);
+CREATE INDEX IF NOT EXISTS requirement_scene ON requirement(scene_id);
+CREATE INDEX IF NOT EXISTS info_scene ON info(scene_id);
+CREATE INDEX IF NOT EXISTS reference_scene ON reference(scene_id);
+CREATE INDEX IF NOT EXISTS audio_scene ON audio(scene_id);
+CREATE INDEX IF NOT EXISTS type_size_scene ON type_size(scene_id);
+CREATE INDEX IF NOT EXISTS geometry_vertices ON geometry(vertices);
+CREATE INDEX IF NOT EXISTS reference_edit_size ON reference_edit(size);
+CREATE INDEX IF NOT EXISTS anim_curve_scene ON anim_curve(scene_id);
+CREATE INDEX IF NOT EXISTS geometry_scene ON geometry(scene_id);
+CREATE INDEX IF NOT EXISTS reference_edit_scene ON reference_edit(scene_id);
+"""
+
+
+def get_stat(path):
+    """
+    Get the size and modification time used to detect changed files
+
+    :param path: str. file path
+    :return: tuple (int, float) or None. size in bytes and modification
+             time, None if the file does not exist
+    """
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return stat.st_size, stat.st_mtime
+
+
+def get_type_sizes(blocks):
+    """
+    Get the node count and size of every node type
+
+    :param blocks: list of AsciiBlock.
+                   normally generated from 'asciiLoader.py'
+    :return: list of tuple (str, int, int). type, count and size in bytes
+    """
+    typs = OrderedDict()
+    for block in blocks:
+        if not isinstance(block, asciiBlock.NodeBlock):
+            continue
+        count, size = typs.get(block.typ, (0, 0))
+        typs[block.typ] = (count + 1, size + block.size)
+    return [(typ, count, size) for typ, (count, size) in typs.items()]
+
+
+def escape_like(text):
+    """
+    Escape the wildcards of a SQL LIKE pattern, used with ESCAPE '\\'
+
+    :param text: str. literal text
+    :return: str. text matching itself in a LIKE pattern
+    """
+    return text.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
+
+
+def scan(path):
+    """
+    Summarize a file for the catalog, errors are reported instead of raised
+
+    :param path: str. maya ascii file path
+    :return: dict. report of asciiInspect with the 'type_sizes' of all
+             types and the rows of the 'anim_curves', 'geometries' and
+             'reference_edits', or the path and error message, both with
+             the 'stat' of the file before it was read, None if the file
+             was deleted
+    """
+    stat = get_stat(path)
+    if stat is None:
+        return {'path': path, 'error': 'File not found', 'stat': None}
+    try:
+        blocks = asciiLoader.Loader().load(path)
+        report = asciiInspect.get_report(path, blocks)
+        report['type_sizes'] = get_type_sizes(blocks)
+        report['anim_curves'] = [
+            tuple(curve) for curve in animation.AnimCurve.from_blocks(blocks)]
+        report['geometries'] = [
+            tuple(geo) for geo in geometry.Geometry.from_blocks(blocks)]
+        report['reference_edits'] = [
+            tuple(edit)
+            for edit in referenceEdit.ReferenceEdit.from_blocks(blocks)]
+    except Exception as e:
+        report = {'path': path, 'error': '{}: {}'.format(type(e).__name__, e)}
+    report['stat'] = stat
+    return report
+
+
+class Catalog(object):
+    """
+    A SQLite database of maya ascii file summaries
+    """
+    def __init__(self, path):
+        """
+        Initialization
+
+        :param path: str. database file path, created when missing
+        """
+        self.__path = path
+        self.__conn = sqlite3.connect(path)
+        self.__conn.execute('PRAGMA foreign_keys = ON')
+        self.__conn.execute('PRAGMA journal_mode = WAL')
+        self.__conn.executescript(SCHEMA)
+
+        version, = self.__conn.execute('PRAGMA user_version').fetchone()
+        if version < SCHEMA_VERSION:
+            # rows scanned without the newer tables are stale
+            with self.__conn:
+                self.__conn.execute('UPDATE scene SET mtime = -1')
+            self.__conn.execute(
+                'PRAGMA user_version = {}'.format(SCHEMA_VERSION))
+
+    @property
+    def path(self):
+        return self.__path
+
+    def close(self):
+        self.__conn.close()
+
+    def get_stale(self, paths):
+        """
+        Get the files that are not in the catalog or changed since scanned,
+        files that do not exist are left out
+
+        :param paths: list of str. file paths
+        :return: list of str. paths to scan
+        """
+        known = dict(
+            (path, (disk_size, mtime)) for path, disk_size, mtime in
+            self.__conn.execute('SELECT path, disk_size, mtime FROM scene')
+        )
+        stale = list()
+        for path in paths:
+            stat = get_stat(path)
+            if stat is not None and known.get(path) != stat:
+                stale.append(path)
+        return stale
+
+    def update(self, paths, workers=None):
+        """
+        Scan new and changed files into the catalog, given files which no
+        longer exist are removed
+
+        :param paths: list of str. file paths
+        :param workers: int or None. number of processes, None for the number
+                        of cpus, 1 to scan in the current process
+        :return: int. number of files scanned
+        """
+        paths = [os.path.abspath(path) for path in paths]
+        self.remove([path for path in paths if not os.path.exists(path)])
+        paths = self.get_stale(paths)
+        pending = list()
+
+        if workers == 1 or len(paths) < 2:
+            reports = (scan(path) for path in paths)
+            executor = None
+        else:
+            executor = futures.ProcessPoolExecutor(workers)
+            jobs = [executor.submit(scan, path) for path in paths]
+            reports = (job.result() for job in futures.as_completed(jobs))
+
+        try:
+            for report in reports:
+                pending.append(report)
+                if len(pending) >= BATCH_SIZE:
+                    self.write(pending)
+                    pending = list()
+            self.write(pending)
+        finally:
+            if executor:
+                executor.shutdown()
+        return len(paths)
+
+    def write(self, reports):
+        """
+        Insert or replace file reports in a single transaction
+
+        :param reports: list of dict. reports from scan()
+        """
+        if not reports:
+            return
+
+        requirements = list()
+        infos = list()
+        references = list()
+        audios = list()
+        type_sizes = list()
+        anim_curves = list()
+        geometries = list()
+        reference_edits = list()
+        with self.__conn:
+            self.__conn.executemany(
+                'DELETE FROM scene WHERE path = ?',
+                [(report['path'],) for report in reports])
+
+            for report in reports:
+                # deleted while scanning
+                if report['stat'] is None:
+                    continue
+
+                disk_size, mtime = report['stat']
+                if 'error' in report:
+                    cursor = self.__conn.execute(
+                        'INSERT INTO scene (path, disk_size, mtime, error) '
+                        'VALUES (?, ?, ?, ?)',
+                        (report['path'], disk_size, mtime, report['error']))
+                    continue
+
+                distribution = dict(report['distribution'])
+                conf = report['config'] or dict()
+                cursor = self.__conn.execute(
+                    'INSERT INTO scene (path, disk_size, mtime, size, blocks, '
+                    'nodes, node_size, connection_size, other_size, '
+                    'min, max, start, end) '
+                    'VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)',
+                    (report['path'], disk_size, mtime, report['size'],
+                     report['blocks'], report['nodes'],
+                     distribution['node'], distribution['connection'],
+                     distribution['other'], conf.get('min'), conf.get('max'),
+                     conf.get('start'), conf.get('end')))
+
+                scene_id = cursor.lastrowid
+                requirements.extend(
+                    (scene_id, r['name'], r['version'])
+                    for r in report['requires'])
+                infos.extend(
+                    (scene_id, i['keyword'], i['value'])
+                    for i in report['info'])
+                references.extend(
+                    (scene_id, r['path'], r['ref_node'], r['namespace'],
+                     r['typ'])
+                    for r in report['references'])
+                audios.extend(
+                    (scene_id, a['name'], a['path'])
+                    for a in report['audio'])
+                type_sizes.extend(
+                    (scene_id,) + tuple(entry)
+                    for entry in report['type_sizes'])
+                anim_curves.extend(
+                    (scene_id,) + tuple(entry)
+                    for entry in report['anim_curves'])
+                geometries.extend(
+                    (scene_id,) + tuple(entry)
+                    for entry in report['geometries'])
+                reference_edits.extend(
+                    (scene_id,) + tuple(entry)
+                    for entry in report['reference_edits'])
+
+            self.__conn.executemany(
+                'INSERT INTO requirement VALUES (?, ?, ?)', requirements)
+            self.__conn.executemany(
+                'INSERT INTO info VALUES (?, ?, ?)', infos)
+            self.__conn.executemany(
+                'INSERT INTO reference VALUES (?, ?, ?, ?, ?)', references)
+            self.__conn.executemany(
+                'INSERT INTO audio VALUES (?, ?, ?)', audios)
+            self.__conn.executemany(
+                'INSERT INTO type_size VALUES (?, ?, ?, ?)', type_sizes)
+            self.__conn.executemany(
+                'INSERT INTO anim_curve VALUES (?, ?, ?, ?, ?, ?, ?, ?)',
+                anim_curves)
+            self.__conn.executemany(
+                'INSERT INTO geometry VALUES '
+                '(?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)',
+                geometries)
+            self.__conn.executemany(
+                'INSERT INTO reference_edit VALUES '
+                '(?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)',
+                reference_edits)
+
+    def remove_missing(self):
+        """
+        Remove the files that no longer exist from the catalog
+
+        :return: int. number of files removed
+        """
+        return self.remove([
+            path for path, in self.__conn.execute('SELECT path FROM scene')
+            if not os.path.exists(path)
+        ])
+
+    def remove(self, paths):
+        """
+        Remove files from the catalog
+
+        :param paths: list of str. file paths
+        :return: int. number of files removed
+        """
+        with self.__conn:
+            cursor = self.__conn.executemany(
+                'DELETE FROM scene WHERE path = ?', [(path,) for path in paths])
+        return max(cursor.rowcount, 0)
+
+    def query(self, sql, parameters=()):
+        """
+        Run a read query against the catalog
+
+        :param sql: str. SQL statement
+        :param parameters: tuple. statement parameters
+        :return: list of tuple. result rows
+        """
+        return self.__conn.execute(sql, parameters).fetchall()
+
+    def find_requires(self, name, version=''):
+        """
+        Find the scenes requiring a plugin
+
+        :param name: str. plugin name (e.g. "mtoa")
+        :param version: str. version prefix (e.g. "3.")
+        :return: list of tuple (str, str). scene path and required version
+        """
+        return self.query(
+            'SELECT scene.path, requirement.version FROM requirement '
+            'JOIN scene ON scene.id = requirement.scene_id '
+            'WHERE requirement.name = ? '
+            "AND requirement.version LIKE ? ESCAPE '\\' "
+            'ORDER BY scene.path',
+            (name, escape_like(version) + '%'))
+
+    def find_references(self, path):
+        """
+        Find the scenes referencing a file
+
+        :param path: str. referenced path or the end of it
+                     (e.g. "rigs/hero_rig.ma")
+        :return: list of tuple (str, str). scene path and namespace
+        """
+        return self.query(
+            'SELECT scene.path, reference.namespace FROM reference '
+            'JOIN scene ON scene.id = reference.scene_id '
+            "WHERE reference.path LIKE ? ESCAPE '\\' ORDER BY scene.path",
+            ('%' + escape_like(path),))
+
+    def find_heavy(self, typ, size):
+        """
+        Find the scenes whose nodes of certain types exceed a size
+
+        :param typ: str. node type, SQL LIKE pattern (e.g. "animCurve%")
+        :param size: int. minimum total size in bytes of the nodes
+        :return: list of tuple (str, int). scene path and size of the nodes,
+                 largest first
+        """
+        return self.query(
+            'SELECT scene.path, SUM(type_size.size) AS total FROM type_size '
+            'JOIN scene ON scene.id = type_size.scene_id '
+            'WHERE type_size.typ LIKE ? '
+            'GROUP BY scene.id HAVING total >= ? ORDER BY total DESC',
+            (typ, size))
+
+    def find_geometry(self, vertices):
+        """
+        Find the geometries with many vertices
+
+        :param vertices: int. minimum vertex count
+        :return: list of tuple (str, str, int). scene path, geometry name
+                 and vertex count, largest first
+        """
+        return self.query(
+            'SELECT scene.path, geometry.name, geometry.vertices '
+            'FROM geometry JOIN scene ON scene.id = geometry.scene_id '
+            'WHERE geometry.vertices >= ? ORDER BY geometry.vertices DESC',
+            (vertices,))
+
+    def find_edits(self, size):
+        """
+        Find the reference nodes with heavy reference edits
+
+        :param size: int. minimum size in bytes of the edits
+        :return: list of tuple (str, str, int, int). scene path, reference
+                 node, edit count and size, largest first
+        """
+        return self.query(
+            'SELECT scene.path, reference_edit.ref_node, reference_edit.edits, '
+            'reference_edit.size FROM reference_edit '
+            'JOIN scene ON scene.id = reference_edit.scene_id '
+            'WHERE reference_edit.size >= ? ORDER BY reference_edit.size DESC',
+            (size,))
+
+    def find_redundant(self, keys):
+        """
+        Find the scenes with many redundant animation keys
+
+        :param keys: int. minimum number of redundant keys
+        :return: list of tuple (str, int, int). scene path, redundant keys
+                 and static curves, most redundant first
+        """
+        return self.query(
+            'SELECT scene.path, SUM(anim_curve.redundant) AS total, '
+            'SUM(anim_curve.static) FROM anim_curve '
+            'JOIN scene ON scene.id = anim_curve.scene_id '
+            'GROUP BY scene.id HAVING total >= ? ORDER BY total DESC',
+            (keys,))
+
+
+def main(argv=None):
+    """
+    Command line entry, update or query a catalog
+
+    :param argv: list of str. command line arguments
+    """
+    parser = argparse.ArgumentParser(
+        description='Catalog maya ascii files in a SQLite database')
+    parser.add_argument('database', help='catalog .db file')
+    commands = parser.add_subparsers(dest='command')
+    commands.required = True
+
+    update = commands.add_parser('update', help='scan new and changed files')
+    update.add_argument('paths', nargs='+',
+                        help='.ma files, directories or glob patterns')
+    update.add_argument('--workers', type=int, default=None,
+                        help='number of processes, defaults to the cpu count')
+
+    requires = commands.add_parser('requires',
+                                   help='scenes requiring a plugin')
+    requires.add_argument('name', help='plugin name')
+    requires.add_argument('--version', default='', help='version prefix')
+
+    references = commands.add_parser('references',
+                                     help='scenes referencing a file')
+    references.add_argument('path', help='referenced path or its end')
+
+    heavy = commands.add_parser('heavy',
+                                help='scenes with heavy nodes of a type')
+    heavy.add_argument('typ', help='node type, SQL LIKE pattern')
+    heavy.add_argument('size', type=int, help='minimum size in bytes')
+
+    geometries = commands.add_parser('geometry',
+                                     help='geometries with many vertices')
+    geometries.add_argument('vertices', type=int, help='minimum vertex count')
+
+    edits = commands.add_parser('edits',
+                                help='reference nodes with heavy edits')
+    edits.add_argument('size', type=int, help='minimum size in bytes')
+
+    redundant = commands.add_parser('redundant',
+                                    help='scenes with redundant keys')
+    redundant.add_argument('keys', type=int,
+                           help='minimum number of redundant keys')
+    args = parser.parse_args(argv)
+
+    catalog = Catalog(args.database)
+    try:
+        if args.command == 'update':
+            removed = catalog.remove_missing()
+            scanned = catalog.update(
+                asciiInspect.expand_paths(args.paths), args.workers)
+            print('scanned {} files, removed {} missing files'.format(
+                scanned, removed))
+            return
+
+        if args.command == 'requires':
+            rows = catalog.find_requires(args.name, args.version)
+        elif args.command == 'references':
+            rows = catalog.find_references(args.path)
+        elif args.command == 'heavy':
+            rows = catalog.find_heavy(args.typ, args.size)
+        elif args.command == 'geometry':
+            rows = catalog.find_geometry(args.vertices)
+        elif args.command == 'edits':
+            rows = catalog.find_edits(args.size)
+        else:
+            rows = catalog.find_redundant(args.keys)
+        for row in rows:
+            print('\t'.join(str(value) for value in row))
+    finally:
+        catalog.close()
+
+
+if __name__ == '__main__':
+    multiprocessing.freeze_support()
+    main()
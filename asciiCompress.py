@@ -0,0 +1,377 @@
+"""
+Module for reading compressed maya ascii files as seekable streams
+
+Example
+```python
+index = SeekIndex()
+with open_stream(r'C:/shot.ma.gz', index) as f:
+    for line in f:  # first pass, records checkpoints in the index
+        pass
+
+with open_stream(r'C:/shot.ma.gz', index) as f:
+    f.seek(1024 * 1024 * 1024)  # resumes from the nearest checkpoint
+    print(f.readline())
+```
+
+Compressed data can only be decoded forward, so while the file is read from
+the start the decompressor state is saved every `CHECKPOINT_SPAN` bytes of
+output. Seeking resumes from the nearest checkpoint before the target
+instead of decompressing from the start of the file.
+
+gzip checkpoints are copies of the zlib decompressor, zstd decompressors
+can not be copied so zstd checkpoints are only taken at frame boundaries,
+files written in many frames (e.g. `zstd -B`) are seekable while single
+frame files are decoded from the start. zstd support requires the optional
+`zstandard` package.
+"""
+
+import bisect
+import io
+import zlib
+from collections import namedtuple
+
+
+GZIP = 'gzip'
+ZSTD = 'zstd'
+EXTENSIONS = {
+    '.gz': GZIP,
+    '.zst': ZSTD,
+    '.zstd': ZSTD,
+}
+
+# uncompressed bytes between two checkpoints
+CHECKPOINT_SPAN = 4 * 1024 * 1024
+# compressed bytes read at a time
+READ_SIZE = 256 * 1024
+# buffer of the stream returned by open_stream
+BUFFER_SIZE = 1024 * 1024
+
+
+CheckpointBase = namedtuple('CheckpointBase',
+                            ['position', 'line', 'source', 'state'])
+
+
+def get_compression(path):
+    """
+    Get the compression of a file from its extension
+
+    :param path: str. file path
+    :return: str or None. GZIP, ZSTD or None if not compressed
+    """
+    for ext, compression in EXTENSIONS.items():
+        if path.lower().endswith(ext):
+            return compression
+    return None
+
+
+def new_decompressor(compression):
+    """
+    Create a decompressor for the start of a gzip member or a zstd frame
+
+    :param compression: str. GZIP or ZSTD
+    :return: decompressor object with 'decompress', 'eof' and 'unused_data'
+    """
+    if compression == GZIP:
+        return zlib.decompressobj(zlib.MAX_WBITS | 16)
+
+    # imported on demand, it is optional and slow to import
+    try:
+        import zstandard
+    except ImportError:
+        raise ImportError('zstandard is required to read zstd files')
+    return zstandard.ZstdDecompressor().decompressobj()
+
+
+class Checkpoint(CheckpointBase):
+    """
+    A position of the uncompressed stream where decoding can resume
+    """
+    __slots__ = ()
+
+    def __new__(cls, position, line, source, state=None):
+        """
+        Initialization
+
+        :param position: int. uncompressed byte position
+        :param line: int. number of line breaks before the position
+        :param source: int. compressed byte position to resume reading
+        :param state: decompressor or None. copy of the decompressor at the
+                      position, None to start a new gzip member or zstd frame
+        """
+        return super(Checkpoint, cls).__new__(
+            cls, position, line, source, state)
+
+
+class SeekIndex(object):
+    """
+    Checkpoints of a compressed file, sorted by position
+    """
+    def __init__(self):
+        """
+        Initialization
+        """
+        self.__checkpoints = [Checkpoint(0, 0, 0)]
+        self.__positions = [0]
+        self.__lines = [0]
+        self.__size = None
+
+    @property
+    def size(self):
+        """
+        Uncompressed size, known once the file has been read to the end
+
+        :return: int or None.
+        """
+        return self.__size
+
+    @property
+    def checkpoints(self):
+        return self.__checkpoints
+
+    @property
+    def is_complete(self):
+        return self.__size is not None
+
+    def add(self, checkpoint):
+        """
+        Add a checkpoint after the last one
+
+        :param checkpoint: Checkpoint.
+        """
+        if checkpoint.position <= self.__positions[-1]:
+            return
+        self.__checkpoints.append(checkpoint)
+        self.__positions.append(checkpoint.position)
+        self.__lines.append(checkpoint.line)
+
+    def complete(self, size):
+        """
+        Mark the index complete once the end of the file is reached
+
+        :param size: int. uncompressed size
+        """
+        self.__size = size
+
+    def find(self, position):
+        """
+        Find the last checkpoint at or before a position
+
+        :param position: int. uncompressed byte position
+        :return: Checkpoint.
+        """
+        i = bisect.bisect_right(self.__positions, position) - 1
+        return self.__checkpoints[max(i, 0)]
+
+    def find_line(self, line):
+        """
+        Find the last checkpoint at or before the start of a line
+
+        :param line: int. number of line breaks before the line
+        :return: Checkpoint.
+        """
+        i = bisect.bisect_left(self.__lines, line) - 1
+        return self.__checkpoints[max(i, 0)]
+
+
+class DecompressReader(io.RawIOBase):
+    """
+    Raw seekable stream of the uncompressed content of a file, checkpoints
+    are recorded into the index while reading through an incomplete index
+    """
+    def __init__(self, path, compression, index):
+        """
+        Initialization
+
+        :param path: str. compressed file path
+        :param compression: str. GZIP or ZSTD
+        :param index: SeekIndex. checkpoints shared by all readers of
+                      the file
+        """
+        super(DecompressReader, self).__init__()
+        self.__file = open(path, 'rb')
+        self.__compression = compression
+        self.__index = index
+        self.__restore(index.find(0))
+
+    @property
+    def source_position(self):
+        """
+        Compressed bytes read so far
+
+        :return: int.
+        """
+        return self.__file.tell()
+
+    @property
+    def line(self):
+        """
+        Number of line breaks before the current position
+
+        :return: int.
+        """
+        return self.__line
+
+    def __restore(self, checkpoint):
+        """
+        Resume decoding from a checkpoint
+
+        :param checkpoint: Checkpoint.
+        """
+        self.__file.seek(checkpoint.source)
+        if checkpoint.state is None:
+            self.__decompressor = new_decompressor(self.__compression)
+        else:
+            self.__decompressor = checkpoint.state.copy()
+        self.__position = checkpoint.position
+        self.__line = checkpoint.line
+        self.__buffer = b''
+        self.__cursor = 0
+        self.__eof = False
+        self.__last = checkpoint.position
+
+    def __fill(self):
+        """
+        Decompress the next chunk of data into the buffer
+
+        :return: bool. False at the end of the file
+        """
+        self.__buffer = b''
+        self.__cursor = 0
+        while not self.__buffer:
+            data = self.__file.read(READ_SIZE)
+            if not data:
+                self.__eof = True
+                if not self.__index.is_complete:
+                    self.__index.complete(self.__position)
+                return False
+
+            chunks = list()
+            while data:
+                chunks.append(self.__decompressor.decompress(data))
+                if not self.__decompressor.eof:
+                    break
+                # next gzip member or zstd frame
+                data = self.__decompressor.unused_data
+                self.__decompressor = new_decompressor(self.__compression)
+                if self.__compression == ZSTD:
+                    self.__checkpoint(
+                        sum(len(chunk) for chunk in chunks), chunks,
+                        self.__file.tell() - len(data), None)
+            self.__buffer = b''.join(chunks)
+
+            if self.__compression == GZIP and self.__buffer:
+                self.__checkpoint(
+                    len(self.__buffer), [self.__buffer],
+                    self.__file.tell(), self.__decompressor)
+        return True
+
+    def __checkpoint(self, size, chunks, source, decompressor):
+        """
+        Record a checkpoint after the decoded chunks, when the index is
+        incomplete and the last checkpoint is far enough
+
+        :param size: int. size of the decoded chunks
+        :param chunks: list of bytes. data decoded since the current position
+        :param source: int. compressed position to resume from
+        :param decompressor: decompressor or None. state to copy
+        """
+        position = self.__position + size
+        if self.__index.is_complete or position - self.__last < CHECKPOINT_SPAN:
+            return
+        if position <= self.__index.find(position).position:
+            return
+
+        line = self.__line + sum(chunk.count(b'\n') for chunk in chunks)
+        state = decompressor.copy() if decompressor is not None else None
+        self.__index.add(Checkpoint(position, line, source, state))
+        self.__last = position
+
+    def readable(self):
+        return True
+
+    def seekable(self):
+        return True
+
+    def readinto(self, b):
+        """
+        Override
+        """
+        if self.__cursor >= len(self.__buffer) and \
+                (self.__eof or not self.__fill()):
+            return 0
+
+        start = self.__cursor
+        size = min(len(b), len(self.__buffer) - start)
+        b[:size] = self.__buffer[start:start+size]
+        self.__cursor += size
+        self.__position += size
+        self.__line += self.__buffer.count(b'\n', start, start+size)
+        return size
+
+    def tell(self):
+        """
+        Override
+        """
+        return self.__position
+
+    def seek(self, offset, whence=io.SEEK_SET):
+        """
+        Override, seeking restarts from the nearest checkpoint before the
+        target when it is behind or past the next checkpoint, and skips
+        forward from there
+
+        :param offset: int. uncompressed byte position
+        :param whence: int. only io.SEEK_SET and io.SEEK_CUR are supported
+        :return: int. new position
+        """
+        if whence == io.SEEK_CUR:
+            offset += self.__position
+        elif whence != io.SEEK_SET:
+            raise io.UnsupportedOperation('Can not seek from the end')
+
+        checkpoint = self.__index.find(offset)
+        if offset < self.__position or checkpoint.position > self.__position:
+            self.__restore(checkpoint)
+
+        while self.__position < offset:
+            if self.__cursor >= len(self.__buffer) and \
+                    (self.__eof or not self.__fill()):
+                break
+            start = self.__cursor
+            size = min(offset - self.__position, len(self.__buffer) - start)
+            self.__line += self.__buffer.count(b'\n', start, start+size)
+            self.__cursor += size
+            self.__position += size
+        return self.__position
+
+    def seek_line(self, line):
+        """
+        Move to the nearest checkpoint before the start of a line, lines
+        are then read forward with `line` giving the current line count
+
+        :param line: int. number of line breaks before the line
+        :return: int. number of line breaks before the new position
+        """
+        checkpoint = self.__index.find_line(line)
+        if line < self.__line or checkpoint.line > self.__line:
+            self.__restore(checkpoint)
+        return self.__line
+
+    def close(self):
+        """
+        Override
+        """
+        self.__file.close()
+        super(DecompressReader, self).close()
+
+
+def open_stream(path, index):
+    """
+    Open a compressed file as a buffered binary stream
+
+    :param path: str. compressed file path
+    :param index: SeekIndex. checkpoints of the file
+    :return: io.BufferedReader.
+    """
+    return io.BufferedReader(
+        DecompressReader(path, get_compression(path), index), BUFFER_SIZE)
@@ -0,0 +1,243 @@
+"""
+Module for comparing two maya ascii files block by block
+
+Scripting:
+```
+# nodes ranked by how much they grew or shrank between two versions
+diffs = diff_files(r'C:/shot_v001.ma', r'C:/shot_v002.ma')
+for diff in diffs[:10]:
+    print(diff.status, diff.name, diff.delta)
+```
+
+Command line:
+```
+python -m mayaAsciiViewer.asciiDiff shot_v001.ma shot_v002.ma --top 20
+```
+
+Example:
+```
+createNode transform -n "pCube1";                               (unchanged)
+    rename -uid "6F3C5D2A-4B1E-9A7C-3E8D-0B2F4A6C8D1E";
+createNode mesh -n "pCubeShape1" -p "pCube1";                   (changed)
+    setAttr -s 8 ".vt[0:7]"  -0.5 -0.5 0.5 0.5 -0.5 0.5 ...
+```
+
+Blocks of both files are hashed while they are scanned, and aligned by
+their command and node path, unchanged blocks are recognized by their hash
+alone so the content of the files is never read twice.
+"""
+
+import argparse
+import json
+from collections import namedtuple, OrderedDict
+
+from . import asciiBlock, asciiLoader
+
+
+ADDED = 'added'
+REMOVED = 'removed'
+CHANGED = 'changed'
+
+
+BlockDiffBase = namedtuple('BlockDiffBase',
+                           ['status',
+                            'command',
+                            'name',
+                            'typ',
+                            'old_size',
+                            'new_size',
+                            'delta',
+                            'index']
+                           )
+
+
+def get_key(block):
+    """
+    Get the key aligning a block with the same block of another file
+
+    :param block: AsciiBlock.
+    :return: tuple. identity of the block in a file
+    """
+    if isinstance(block, asciiBlock.NodeBlock):
+        return block.command, block.parent, block.name
+    elif isinstance(block, asciiBlock.ConnectionBlock):
+        return block.command, block.source, block.dest
+    elif isinstance(block, asciiBlock.RequirementBlock):
+        return block.command, block.name
+    elif isinstance(block, asciiBlock.InfoBlock):
+        return block.command, block.keyword
+    elif isinstance(block, asciiBlock.FileBlock):
+        return block.command, block.ref_node or block.path
+    return block.command, block.desc
+
+
+def get_name(block):
+    """
+    Get the display name of a block
+
+    :param block: AsciiBlock.
+    :return: str. node name, or the block description
+    """
+    if isinstance(block, asciiBlock.NodeBlock):
+        return block.name
+    return block.desc.strip()
+
+
+def get_typ(block):
+    """
+    Get the node type of a block
+
+    :param block: AsciiBlock.
+    :return: str. node type, empty for blocks other than 'createNode'
+    """
+    if isinstance(block, asciiBlock.NodeBlock):
+        return block.typ
+    return ''
+
+
+def get_keyed(blocks):
+    """
+    Key the blocks of a file, repeated keys (e.g. 'select' blocks) are told
+    apart by their occurrence
+
+    :param blocks: list of AsciiBlock.
+    :return: OrderedDict. key with occurrence to block
+    """
+    keyed = OrderedDict()
+    occurrences = dict()
+    for block in blocks:
+        if block.offset < 0:
+            continue
+        key = get_key(block)
+        occurrence = occurrences.get(key, 0)
+        occurrences[key] = occurrence + 1
+        keyed[key + (occurrence,)] = block
+    return keyed
+
+
+def diff(old_blocks, new_blocks):
+    """
+    Compare the blocks of two files, both loaded with digests
+
+    :param old_blocks: list of AsciiBlock. blocks of the old file
+    :param new_blocks: list of AsciiBlock. blocks of the new file
+    :return: list of BlockDiff. added, removed and changed blocks ranked
+             by the magnitude of their size delta
+    """
+    olds = get_keyed(old_blocks)
+    news = get_keyed(new_blocks)
+
+    results = list()
+    for key, new_block in news.items():
+        old_block = olds.get(key)
+        if old_block is None:
+            status = ADDED
+            old_size = 0
+        elif old_block.digest is None or old_block.digest != new_block.digest:
+            status = CHANGED
+            old_size = old_block.size
+        else:
+            continue
+
+        results.append(BlockDiff(
+            status,
+            new_block.command,
+            get_name(new_block),
+            get_typ(new_block),
+            old_size,
+            new_block.size,
+            new_block.size - old_size,
+            new_block.index
+        ))
+
+    for key, old_block in olds.items():
+        if key in news:
+            continue
+        results.append(BlockDiff(
+            REMOVED,
+            old_block.command,
+            get_name(old_block),
+            get_typ(old_block),
+            old_block.size,
+            0,
+            -old_block.size,
+            -1
+        ))
+
+    return sorted(results, key=lambda result: abs(result.delta), reverse=True)
+
+
+def diff_files(old_path, new_path, loader=None):
+    """
+    Load and compare two maya ascii files
+
+    :param old_path: str. old .ma full path
+    :param new_path: str. new .ma full path
+    :param loader: asciiLoader.Loader. loader with its signals connected,
+                   a new loader is used if not provided
+    :return: list of BlockDiff. added, removed and changed blocks ranked
+             by the magnitude of their size delta
+    """
+    loader = loader or asciiLoader.Loader()
+    old_blocks = loader.load(old_path, digest=True)
+    new_blocks = loader.load(new_path, digest=True)
+    return diff(old_blocks, new_blocks)
+
+
+def get_deltas(diffs):
+    """
+    Get the size delta of the blocks of the new file
+
+    :param diffs: list of BlockDiff.
+    :return: dict. block line index in the new file to size delta
+    """
+    return dict((d.index, d.delta) for d in diffs if d.index >= 0)
+
+
+class BlockDiff(BlockDiffBase):
+    @classmethod
+    def from_blocks(cls, old_blocks, new_blocks):
+        """
+        Create block diff data objects from the ascii data blocks of two
+        files
+
+        :param old_blocks: list of AsciiBlock. blocks of the old file
+        :param new_blocks: list of AsciiBlock. blocks of the new file
+        :return: list of BlockDiff. ranked by the magnitude of size delta
+        """
+        return diff(old_blocks, new_blocks)
+
+
+def main(argv=None):
+    """
+    Command line entry, print the differences between two files
+
+    :param argv: list of str. command line arguments
+    """
+    parser = argparse.ArgumentParser(
+        description='Compare two maya ascii files block by block')
+    parser.add_argument('old', help='old .ma file')
+    parser.add_argument('new', help='new .ma file')
+    parser.add_argument('--top', type=int, default=50,
+                        help='number of differences to print, 0 for all')
+    parser.add_argument('--json', action='store_true',
+                        help='print the differences as json')
+    args = parser.parse_args(argv)
+
+    diffs = diff_files(args.old, args.new)
+    total = sum(d.delta for d in diffs)
+    if args.top > 0:
+        diffs = diffs[:args.top]
+
+    if args.json:
+        print(json.dumps([d._asdict() for d in diffs], indent=2))
+        return
+
+    print('{:>8} {:>12} {:<24} {}'.format('status', 'delta', 'type', 'name'))
+    for d in diffs:
+        print('{:>8} {:>12} {:<24} {}'.format(d.status, d.delta, d.typ, d.name))
+    print('total delta: {} bytes'.format(total))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,206 @@
+"""
+Module for finding nodes holding byte-identical copies of the same data
+
+Scripting:
+```
+# groups of identical nodes and the bytes instancing them would reclaim
+duplicates = Duplicate.from_blocks(blocks)
+for duplicate in duplicates:
+    print(duplicate.typ, duplicate.copies, duplicate.reclaimable)
+print(get_savings(duplicates))
+```
+
+Example:
+```
+createNode mesh -n "rockShape1" -p "rock1";
+    rename -uid "A1D0E7C2-4F3B-8E51-2C6D-93B7F0E1A4C8";
+    setAttr -s 8 ".vt[0:7]"  -0.5 -0.5 0.5 0.5 -0.5 0.5 ...
+createNode mesh -n "rockShape2" -p "rock2";
+    rename -uid "0B5E2F91-47C3-D6A0-1E8B-5C2A7F4D9E36";
+    setAttr -s 8 ".vt[0:7]"  -0.5 -0.5 0.5 0.5 -0.5 0.5 ...
+```
+
+The two blocks above only differ by their 'createNode' and 'rename -uid'
+lines, so their bodies are identical. Nodes are first grouped by type and
+body size, only nodes sharing a group are read and hashed. The candidates
+are split into contiguous runs of at least `CHUNK_BYTES` hashed in a thread
+pool, so a few huge meshes are hashed in parallel, each worker hashes the
+memory mapped bytes of its run without copying them.
+"""
+
+import hashlib
+import re
+from collections import namedtuple, OrderedDict
+from concurrent import futures
+from operator import attrgetter
+
+from . import asciiBlock, asciiLoader
+
+
+# first line of a block naming the node, followed by its uid assignments
+HEADER_RE = re.compile(br'[^\n]*\n(?:\s*rename -uid [^\n]*(?:\n|\Z))*')
+
+# minimum number of bytes hashed by a worker
+CHUNK_BYTES = 8 * 1024 * 1024
+
+
+DuplicateBase = namedtuple('DuplicateBase',
+                           ['name',
+                            'typ',
+                            'copies',
+                            'size',
+                            'reclaimable',
+                            'nodes']
+                           )
+
+
+def get_body_start(detail):
+    """
+    Get the position where the body of a block starts, after the header
+    naming the node and the uid assignment
+
+    :param detail: bytes or memoryview. raw content of an ascii block
+    :return: int. byte position of the content that identifies the node
+             data, the size of the block if it has no body
+    """
+    match = HEADER_RE.match(detail)
+    return match.end() if match else len(detail)
+
+
+def hash_bodies(asc, blocks):
+    """
+    Hash the bodies of many blocks of a file, the bodies are hashed from the
+    views of the memory mapped file without being copied
+
+    :param asc: asciiLoader.Ascii. the file of the blocks
+    :param blocks: list of NodeBlock. blocks in file order
+    :return: list of bytes. digest of each block body
+    """
+    digests = list()
+    for _block, detail in asc.iter_bytes(blocks):
+        with memoryview(detail) as view, view[get_body_start(view):] as body:
+            digests.append(hashlib.md5(body).digest())
+    return digests
+
+
+def get_chunks(blocks):
+    """
+    Split blocks into runs of contiguous blocks holding at least
+    CHUNK_BYTES each, a block larger than that is a run of its own
+
+    :param blocks: list of NodeBlock. blocks in file order
+    :return: list of list of NodeBlock. runs of blocks in file order
+    """
+    chunks = list()
+    chunk = list()
+    size = 0
+    for block in blocks:
+        chunk.append(block)
+        size += block.size
+        if size >= CHUNK_BYTES:
+            chunks.append(chunk)
+            chunk = list()
+            size = 0
+    if chunk:
+        chunks.append(chunk)
+    return chunks
+
+
+def get_candidates(blocks, min_size):
+    """
+    Group nodes that could hold identical bodies by node type and body
+    size, nodes alone in their group are discarded without being read
+
+    :param blocks: list of AsciiBlock.
+    :param min_size: int. minimum node size in bytes
+    :return: list of NodeBlock. candidate nodes sorted by byte offset
+    """
+    groups = dict()
+    for block in blocks:
+        if not isinstance(block, asciiBlock.NodeBlock):
+            continue
+        if block.offset < 0 or block.size < min_size:
+            continue
+        header = len(block.desc.encode(asciiLoader.ENCODING))
+        groups.setdefault((block.typ, block.size - header), list()).append(block)
+
+    candidates = [
+        block
+        for group in groups.values() if len(group) > 1
+        for block in group
+    ]
+    return sorted(candidates, key=attrgetter('offset'))
+
+
+def get_duplicates(blocks, min_size=1024, workers=None):
+    """
+    Find groups of nodes with byte-identical bodies
+
+    :param blocks: list of AsciiBlock.
+                   normally generated from 'asciiLoader.py'
+    :param min_size: int. minimum node size in bytes, smaller nodes are
+                     not considered heavy data
+    :param workers: int. number of worker threads, hashed in the current
+                    thread if it is 0
+    :return: list of list of NodeBlock. nodes of each duplicate group in
+             file order
+    """
+    candidates = get_candidates(blocks, min_size)
+    if not candidates:
+        return list()
+
+    asc = candidates[0].asc
+    chunks = get_chunks(candidates)
+    if workers == 0 or len(chunks) < 2:
+        digests = hash_bodies(asc, candidates)
+    else:
+        with futures.ThreadPoolExecutor(workers) as executor:
+            # hashlib and memory mapped reads release the GIL
+            digests = [
+                digest
+                for chunk in executor.map(lambda c: hash_bodies(asc, c), chunks)
+                for digest in chunk
+            ]
+
+    groups = OrderedDict()
+    for block, digest in zip(candidates, digests):
+        groups.setdefault((block.typ, digest), list()).append(block)
+    return [group for group in groups.values() if len(group) > 1]
+
+
+def get_savings(duplicates):
+    """
+    Get the total size of the redundant copies
+
+    :param duplicates: list of Duplicate.
+    :return: int. size in bytes that could be reclaimed by instancing or
+             referencing a single copy
+    """
+    return sum(duplicate.reclaimable for duplicate in duplicates)
+
+
+class Duplicate(DuplicateBase):
+    @classmethod
+    def from_blocks(cls, blocks, min_size=1024, workers=None):
+        """
+        Create duplicate data objects from ascii data blocks
+
+        :param blocks: list of AsciiBlock.
+                       normally generated from 'asciiLoader.py'
+        :param min_size: int. minimum node size in bytes
+        :param workers: int. number of worker threads
+        :return: list of Duplicate. duplicate groups ranked by the bytes
+                 they could reclaim
+        """
+        results = list()
+        for group in get_duplicates(blocks, min_size, workers):
+            first = group[0]
+            results.append(cls(
+                first.name,
+                first.typ,
+                len(group),
+                first.size,
+                sum(block.size for block in group[1:]),
+                ', '.join(block.name for block in group[1:])
+            ))
+        return sorted(results, key=attrgetter('reclaimable'), reverse=True)
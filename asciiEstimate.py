@@ -0,0 +1,365 @@
+"""
+Module for estimating the size distribution of a maya ascii file from
+random samples, giving an overview of huge files before they are loaded
+
+Scripting:
+```
+sampler = Sampler(r'C:/cache.ma', seed=0)
+sampler.sample(256)
+for estimate in sampler.get_distribution():
+    print(estimate.name, estimate.size, estimate.low, estimate.high)
+sampler.close()
+```
+
+Command line:
+```
+python -m mayaAsciiViewer.asciiEstimate C:/cache.ma --windows 512 --top 10
+```
+
+Byte windows are read at random positions through a memory map. Each
+window is snapped to block boundaries: the block owning its first byte is
+found by searching backwards for the previous unindented line, and the
+blocks starting inside it are classified by the first line of their
+command, the same way the loader splits blocks. Only the bytes inside the
+window are attributed, so every byte of the file is equally likely to be
+sampled, and the share of a category is the ratio of its sampled bytes
+to all sampled bytes. Confidence intervals come from the variance of
+that ratio between windows.
+
+Owners of windows deep inside blocks larger than MAX_SNAP are taken from
+the closest block start found by earlier windows. Compressed files can
+not be read at random positions and are not supported.
+"""
+
+import argparse
+import bisect
+import math
+import mmap
+import os
+import random
+import re
+from collections import namedtuple
+
+from . import asciiCompress, asciiLoader
+
+
+# bytes read per window, and windows drawn by default
+WINDOW_SIZE = 64 * 1024
+WINDOWS = 256
+# furthest distance searched backwards for the block owning a window
+MAX_SNAP = 1024 * 1024
+# longest first line read to classify a block
+LINE_LIMIT = 4096
+# normal quantile of the confidence intervals, 95%
+Z = 1.96
+
+# a line break followed by an unindented line starts a new block
+BLOCK_START_RE = re.compile(b'\n[^\t]')
+
+# categories of asciiBlock.get_distribution
+NODE = 'node'
+CONNECTION = 'connection'
+OTHER = 'other'
+
+EstimateBase = namedtuple('EstimateBase', ['name', 'size', 'low', 'high'])
+
+
+class Estimate(EstimateBase):
+    @classmethod
+    def from_samples(cls, name, samples, counts, total):
+        """
+        Create an estimate of the size of a category with its confidence
+        interval
+
+        :param name: str. category name
+        :param samples: list of int. sampled bytes of each window
+        :param counts: list of int. bytes of the category in each window
+        :param total: int. file size in bytes
+        :return: Estimate.
+        """
+        sampled = float(sum(samples))
+        if not sampled:
+            return cls(name, 0, 0, total)
+
+        share = sum(counts) / sampled
+        n = len(samples)
+        residuals = sum(
+            (count - share * sample) ** 2
+            for count, sample in zip(counts, samples)
+        )
+        if n > 1 and residuals:
+            error = math.sqrt(residuals / (n * (n - 1))) / (sampled / n)
+        else:
+            # a category never or always sampled has no variance, it is
+            # bounded by the rule of three instead
+            error = min(3.0 / n, 1.0) / Z
+
+        return cls(
+            name,
+            int(share * total),
+            int(max(share - Z * error, 0.0) * total),
+            int(min(share + Z * error, 1.0) * total)
+        )
+
+
+def classify(line):
+    """
+    Classify a block by the first line of its command
+
+    :param line: bytes. first line of the block
+    :return: tuple (str, str). category and node type, the type is empty
+             for blocks other than 'createNode'
+    """
+    tokens = line.split(None, 2)
+    command = tokens[0] if tokens else b''
+    if command == b'createNode':
+        typ = tokens[1].decode(asciiLoader.ENCODING, 'replace') \
+            if len(tokens) > 1 else ''
+        return NODE, typ.rstrip(';')
+    elif command == b'connectAttr':
+        return CONNECTION, ''
+    return OTHER, ''
+
+
+class Sampler(object):
+    """
+    Random byte windows of a file, more windows can be drawn at any time
+    to refine the estimates
+    """
+    def __init__(self, path, window_size=WINDOW_SIZE, seed=None):
+        """
+        Initialization
+
+        :param path: str. maya ascii file path
+        :param window_size: int. bytes read per window
+        :param seed: int or None. seed of the window positions
+        """
+        if asciiCompress.get_compression(path):
+            raise ValueError(
+                'Compressed file {} can not be sampled'.format(path))
+
+        self.__path = path
+        self.__size = os.path.getsize(path)
+        self.__window_size = window_size
+        self.__random = random.Random(seed)
+
+        self.__file = open(path, 'rb')
+        self.__buf = None
+        if self.__size:
+            self.__buf = mmap.mmap(
+                self.__file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        # sampled bytes and bytes by (category, type) of each window
+        self.__samples = list()
+        self.__counts = list()
+        # sorted starts of the last block found in each window, and their
+        # categories
+        self.__starts = list()
+        self.__keys = list()
+
+    @property
+    def path(self):
+        return self.__path
+
+    @property
+    def size(self):
+        return self.__size
+
+    @property
+    def windows(self):
+        return len(self.__samples)
+
+    def close(self):
+        if self.__buf is not None:
+            self.__buf.close()
+        self.__file.close()
+
+    def sample(self, count=WINDOWS):
+        """
+        Read more random windows
+
+        :param count: int. number of windows to read
+        """
+        if not self.__size:
+            return
+
+        for _ in range(count):
+            # windows may overlap the file ends so every byte is as likely
+            # to be sampled
+            start = self.__random.randrange(
+                1 - self.__window_size, self.__size)
+            low = max(start, 0)
+            high = min(start + self.__window_size, self.__size)
+            self.__samples.append(high - low)
+            self.__counts.append(self.__read_window(low, high))
+
+    def get_distribution(self):
+        """
+        Estimate the size of nodes, connections and other blocks
+
+        :return: list of Estimate. in the order of asciiBlock.get_distribution
+        """
+        counts = self.__get_counts(lambda key: key[0])
+        return [
+            Estimate.from_samples(
+                name, self.__samples, counts.get(name, self.__zeros()),
+                self.__size)
+            for name in (NODE, CONNECTION, OTHER)
+        ]
+
+    def get_type_distribution(self, top=-1):
+        """
+        Estimate the size of node types ranked by size
+
+        :param top: int. how many types to be listed
+        :return: list of Estimate.
+        """
+        counts = self.__get_counts(
+            lambda key: key[1] if key[0] == NODE else None)
+        counts.pop(None, None)
+        estimates = [
+            Estimate.from_samples(typ, self.__samples, typ_counts, self.__size)
+            for typ, typ_counts in counts.items()
+        ]
+        estimates.sort(key=lambda estimate: estimate.size, reverse=True)
+        return estimates[0:top]
+
+    def __zeros(self):
+        return [0] * len(self.__samples)
+
+    def __get_counts(self, group):
+        """
+        Group the sampled bytes of every window
+
+        :param group: function. group name of a (category, type) key
+        :return: dict. group name to its bytes in each window
+        """
+        counts = dict()
+        for i, window in enumerate(self.__counts):
+            for key, size in window.items():
+                name = group(key)
+                if name not in counts:
+                    counts[name] = self.__zeros()
+                counts[name][i] += size
+        return counts
+
+    def __read_window(self, low, high):
+        """
+        Attribute the bytes of a window to the blocks they belong to
+
+        :param low: int. window start position
+        :param high: int. window end position
+        :return: dict. bytes by (category, type)
+        """
+        counts = dict()
+        owner = self.__find_owner(low)
+        position = low
+        for match in BLOCK_START_RE.finditer(self.__buf, low, high):
+            start = match.start() + 1
+            if start >= high:
+                break
+            if start > position:
+                counts[owner] = counts.get(owner, 0) + start - position
+            owner = self.__classify_at(start)
+            position = start
+        counts[owner] = counts.get(owner, 0) + high - position
+
+        if position > low:
+            i = bisect.bisect_left(self.__starts, position)
+            self.__starts.insert(i, position)
+            self.__keys.insert(i, owner)
+        return counts
+
+    def __find_owner(self, position):
+        """
+        Find the category of the block owning a position
+
+        :param position: int. byte position
+        :return: tuple (str, str). category and node type
+        """
+        if position == 0:
+            return self.__classify_at(0)
+
+        distance = WINDOW_SIZE // 16
+        while True:
+            low = max(position - distance, 0)
+            start = None
+            # the match ends at the first byte of the block
+            for match in BLOCK_START_RE.finditer(self.__buf, low, position + 1):
+                start = match.start() + 1
+            if start is not None:
+                return self.__classify_at(start)
+            if low == 0:
+                return self.__classify_at(0)
+            if distance >= MAX_SNAP:
+                break
+            distance *= 2
+
+        # the block is too large to find its start, take the closest block
+        # start found so far
+        i = bisect.bisect_right(self.__starts, position) - 1
+        if i >= 0:
+            return self.__keys[i]
+        return OTHER, ''
+
+    def __classify_at(self, start):
+        """
+        Classify the block starting at a position
+
+        :param start: int. block start position
+        :return: tuple (str, str). category and node type
+        """
+        end = self.__buf.find(b'\n', start, start + LINE_LIMIT)
+        if end < 0:
+            end = min(start + LINE_LIMIT, self.__size)
+        return classify(self.__buf[start:end])
+
+
+def format_estimate(estimate):
+    """
+    :param estimate: Estimate.
+    :return: str. estimate with its confidence interval
+    """
+    return '{:<24} {:>12} [{} - {}]'.format(
+        estimate.name,
+        estimate.size,
+        estimate.low,
+        estimate.high
+    )
+
+
+def main(argv=None):
+    """
+    Command line entry, print the estimated size distribution of a file
+
+    :param argv: list of str. command line arguments
+    """
+    parser = argparse.ArgumentParser(
+        description='Estimate the size distribution of a maya ascii file')
+    parser.add_argument('path', help='.ma file')
+    parser.add_argument('--windows', type=int, default=WINDOWS,
+                        help='random windows to read')
+    parser.add_argument('--window-size', type=int, default=WINDOW_SIZE,
+                        help='bytes read per window')
+    parser.add_argument('--top', type=int, default=10,
+                        help='node types to list')
+    parser.add_argument('--seed', type=int, default=None,
+                        help='seed of the window positions')
+    args = parser.parse_args(argv)
+
+    sampler = Sampler(args.path, args.window_size, args.seed)
+    try:
+        sampler.sample(args.windows)
+        print('{} windows of {} bytes, 95% intervals'.format(
+            sampler.windows, args.window_size))
+        for estimate in sampler.get_distribution():
+            print(format_estimate(estimate))
+        print('')
+        for estimate in sampler.get_type_distribution(args.top):
+            print(format_estimate(estimate))
+    finally:
+        sampler.close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,222 @@
+"""
+Module for inspecting maya ascii files without the GUI, many files can be
+inspected in parallel across processes
+
+Scripting:
+```
+report = inspect(r'C:/shot.ma')
+print(report['size'], report['types'][:3])
+
+for report in iter_reports(expand_paths(['/shows/abc/**/*.ma']), workers=8):
+    print(report['path'], report.get('error'))
+```
+
+Command line:
+```
+python -m mayaAsciiViewer shot.ma
+python -m mayaAsciiViewer "/shows/abc/**/*.ma" --workers 16 --json > audit.json
+```
+
+Each report holds what the viewer docks show: size distribution, top node
+types, requires, file info, references, audio and playback configuration.
+Files are loaded and summarized in worker processes and only the small
+reports are sent back. A file failing to load is reported with an 'error'
+entry instead of stopping the batch.
+"""
+
+import argparse
+import glob
+import json
+import multiprocessing
+import os
+import sys
+from concurrent import futures
+
+from . import asciiBlock, asciiCompress, asciiLoader
+from .block import audio, config, info, reference, requirement
+from .dag import dagNode
+
+
+# number of node types in a report
+TOP_TYPES = 10
+
+
+def expand_paths(patterns):
+    """
+    Expand files, directories and glob patterns into maya ascii file paths,
+    directories are searched recursively
+
+    :param patterns: list of str. file paths, directories or glob patterns
+    :return: list of str. sorted unique file paths
+    """
+    extensions = ['.ma'] + ['.ma' + ext for ext in asciiCompress.EXTENSIONS]
+    paths = set()
+    for pattern in patterns:
+        if os.path.isdir(pattern):
+            for root, _, files in os.walk(pattern):
+                paths.update(
+                    os.path.join(root, f) for f in files
+                    if f.lower().endswith(tuple(extensions)))
+        elif glob.has_magic(pattern):
+            paths.update(
+                path for path in glob.glob(pattern, recursive=True)
+                if os.path.isfile(path))
+        else:
+            paths.add(pattern)
+    return sorted(paths)
+
+
+def inspect(path):
+    """
+    Summarize a maya ascii file
+
+    :param path: str. maya ascii file path
+    :return: dict. json serializable report of the file
+    """
+    return get_report(path, asciiLoader.Loader().load(path))
+
+
+def get_report(path, blocks):
+    """
+    Summarize the ascii blocks of a maya ascii file
+
+    :param path: str. maya ascii file path
+    :param blocks: list of AsciiBlock. blocks loaded from the file
+    :return: dict. json serializable report of the file
+    """
+    nodes = [b for b in blocks if isinstance(b, asciiBlock.NodeBlock)]
+    conf = config.Config.from_blocks(blocks)
+
+    return {
+        'path': path,
+        'size': blocks[0].asc.size if blocks else 0,
+        'blocks': len(blocks),
+        'nodes': len(nodes),
+        'distribution': asciiBlock.get_distribution(blocks),
+        'types': dagNode.get_distribution(nodes, top=TOP_TYPES),
+        'requires': [r._asdict() for r in
+                     requirement.Requirement.from_blocks(blocks)],
+        'info': [i._asdict() for i in info.Info.from_blocks(blocks)],
+        'references': [r._asdict() for r in
+                       reference.Reference.from_blocks(blocks)],
+        'audio': [a._asdict() for a in audio.Audio.from_blocks(blocks)],
+        'config': conf._asdict() if conf else None,
+    }
+
+
+def safe_inspect(path):
+    """
+    Summarize a maya ascii file, errors are reported instead of raised
+
+    :param path: str. maya ascii file path
+    :return: dict. report of the file, or its path and error message
+    """
+    try:
+        return inspect(path)
+    except Exception as e:
+        return {'path': path, 'error': '{}: {}'.format(type(e).__name__, e)}
+
+
+def iter_reports(paths, workers=None):
+    """
+    Summarize maya ascii files across worker processes
+
+    :param paths: list of str. maya ascii file paths
+    :param workers: int or None. number of processes, None for the number
+                    of cpus, 1 to inspect in the current process
+    :return: generator of dict. reports in completion order
+    """
+    if workers == 1 or len(paths) < 2:
+        for path in paths:
+            yield safe_inspect(path)
+        return
+
+    with futures.ProcessPoolExecutor(workers) as executor:
+        jobs = [executor.submit(safe_inspect, path) for path in paths]
+        for job in futures.as_completed(jobs):
+            yield job.result()
+
+
+def format_report(report):
+    """
+    Format a report as text tables
+
+    :param report: dict. report from inspect()
+    :return: str. formatted report
+    """
+    lines = [report['path']]
+    if 'error' in report:
+        lines.append('  error: {}'.format(report['error']))
+        return '\n'.join(lines)
+
+    lines.append('  size: {} bytes, {} blocks, {} nodes'.format(
+        report['size'], report['blocks'], report['nodes']))
+
+    lines.append('  distribution:')
+    for name, size in report['distribution']:
+        lines.append('    {:<24} {:>12}'.format(name, size))
+
+    lines.append('  types:')
+    for typ, size in report['types']:
+        lines.append('    {:<24} {:>12}'.format(typ, size))
+
+    if report['config']:
+        lines.append('  playback: min {min} max {max} start {start} '
+                     'end {end}'.format(**report['config']))
+
+    lines.append('  requires:')
+    for entry in report['requires']:
+        lines.append('    {:<24} {}'.format(entry['name'], entry['version']))
+
+    lines.append('  info:')
+    for entry in report['info']:
+        lines.append('    {:<24} {}'.format(entry['keyword'], entry['value']))
+
+    lines.append('  references:')
+    for entry in report['references']:
+        lines.append('    {:<24} {}'.format(entry['namespace'], entry['path']))
+
+    lines.append('  audio:')
+    for entry in report['audio']:
+        lines.append('    {:<24} {}'.format(entry['name'], entry['path']))
+    return '\n'.join(lines)
+
+
+def main(argv=None):
+    """
+    Command line entry, print a report of each file
+
+    :param argv: list of str. command line arguments
+    :return: int. exit code, 1 if any file failed
+    """
+    parser = argparse.ArgumentParser(
+        prog='mayaAsciiViewer',
+        description='Inspect maya ascii files without the GUI')
+    parser.add_argument('paths', nargs='+',
+                        help='.ma files, directories or glob patterns')
+    parser.add_argument('--workers', type=int, default=None,
+                        help='number of processes, defaults to the cpu count')
+    parser.add_argument('--json', action='store_true',
+                        help='print the reports as json')
+    args = parser.parse_args(argv)
+
+    paths = expand_paths(args.paths)
+    failed = 0
+    reports = list()
+    for report in iter_reports(paths, args.workers):
+        failed += 'error' in report
+        if args.json:
+            reports.append(report)
+        else:
+            print(format_report(report))
+            sys.stdout.flush()
+
+    if args.json:
+        reports.sort(key=lambda report: report['path'])
+        print(json.dumps(reports, indent=2))
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    multiprocessing.freeze_support()
+    sys.exit(main())
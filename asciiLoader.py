@@ -9,19 +9,42 @@ blocks = loader.load(mfile)
 
 `progress_changed` signal can be connected to progress bar to reflect load
 progress and `event_occurred` can be connected to status bar to display
-event message
+event message, both are plain python signals so loading does not need Qt.
+Progress is throttled (see 'asciiProgress.py') and `rate_changed` reports
+the bytes read per second and the seconds left
+
+gzip (.ma.gz) and zstd (.ma.zst) compressed files are decompressed while
+they are scanned, see 'asciiCompress.py'
+
+With a memory `budget`, multi-line node and attribute descriptions are
+trimmed and the blocks are spilled to a memory-mapped file once the budget
+is reached, see 'asciiSpill.py'
 """
 
-import math
+import hashlib
+import io
+import mmap
 import os
 import time
 
-from Qt import QtCore
+from . import asciiBlock, asciiCompress, asciiProgress, asciiSignal, asciiSpill
+from . import asciiTrace
+
 
-from . import asciiBlock
+# text encoding used to decode block descriptions
+ENCODING = 'utf-8'
 
+# estimated memory of a loaded block besides its description, in bytes
+BLOCK_COST = 600
+# share of the memory budget after which multi-line descriptions are
+# trimmed to their first line
+TRIM_RATIO = 0.5
+# commands describing the file itself (e.g. plugins, references), their
+# descriptions are never trimmed
+HEADER_COMMANDS = (b'requires ', b'file ', b'fileInfo ', b'currentUnit ')
 
-def new(asc, index, desc, size):
+
+def new(asc, index, desc, size, offset=-1, digest=None):
     """
     Factor function to create different sub-types of AsciiBlock instances
 
@@ -29,6 +52,8 @@ def new(asc, index, desc, size):
     :param index: int. the starting line number of the block
     :param desc: str. the starting line describing the block
     :param size: int. the entire size in byte of the data block
+    :param offset: int. the starting byte position of the block
+    :param digest: bytes. hash of the full block content
     :return: AsciiBlock. an instance of a sub-type of AsciiBlock
     """
     command, args = tokenize_command(desc)
@@ -38,7 +63,9 @@ def new(asc, index, desc, size):
         desc,
         size,
         command,
-        args
+        args,
+        offset,
+        digest
     ]
 
     if command == 'createNode':
@@ -55,6 +82,17 @@ def new(asc, index, desc, size):
         return asciiBlock.AsciiBlock(*args)
 
 
+def decode(desc):
+    """
+    Decode the raw bytes of a block description into text with unix line
+    endings
+
+    :param desc: bytes. raw mel command
+    :return: str. mel command
+    """
+    return desc.decode(ENCODING, 'replace').replace('\r\n', '\n')
+
+
 def tokenize_command(line):
     """
     Tokenize mel command into list of arguments for easier processing
@@ -100,70 +138,157 @@ def tokenize_command(line):
     return command, args
 
 
-class Loader(QtCore.QObject):
+class Loader(object):
     """
     Loader for ascii data blocks
     this should be the standard way of loading ascii file into individual
     data blocks
     """
-    progress_changed = QtCore.Signal(int)
-    event_occurred = QtCore.Signal(str)
+    def __init__(self):
+        """
+        Initialization
+        """
+        self.progress_changed = asciiSignal.Signal(int)
+        self.rate_changed = asciiSignal.Signal(float, float)
+        self.event_occurred = asciiSignal.Signal(str)
 
-    def load(self, path):
+    def load(self, path, digest=False, budget=None, spill_dir=None):
         """
         Create a network of Ascii blocks from a path
 
         57% faster than .readline()
 
         :param path: str. .ma full path
-        :return: list of AsciiData. data network
+        :param digest: bool. whether to hash the content of each block
+                       during the scan, used for comparing files
+        :param budget: int or None. estimated memory in bytes the blocks
+                       may use before they are trimmed and spilled to disk,
+                       unlimited if None. only the blocks follow it, not
+                       the Dag tree or graphs built from them later
+        :param spill_dir: str or None. directory of the spilled index, the
+                          system temporary directory if None
+        :return: list of AsciiData or SpilledBlocks. data network
         """
         start_time = time.time()
         self.event_occurred.emit('Reading File')
-        blocks = list()
-
-        with open(path) as f:
+        # raw (index, desc, size, offset, digest) of each block
+        records = list()
+        # estimated memory of the records, and their writer once spilled
+        memory = 0
+        trim = False
+        spill = None
+
+        with asciiTrace.span('read', os.path.basename(path)) as read_span:
             asc = Ascii(path)
-            total_size = float(asc.size)
-            buf_index = -1
-            buf_desc = ''
-            buf_size = 0
-
-            cache_size = 0  # total file size read into cache
-            for index, line in enumerate(f):
-                # empty line
-                if not line:
-                    continue
-
-                # comment
-                if line.startswith('\\'):
-                    continue
-
-                # new node happens when lines aren't indented
-                if not line.startswith('\t'):
-                    # create node based on previous buffer
-                    block = new(asc, buf_index, buf_desc, buf_size)
-                    blocks.append(block)
-
-                    # update load status
-                    cache_size += buf_size
-                    progress = int(math.ceil(cache_size / total_size * 100))
-                    self.progress_changed.emit(progress)
-
-                    # store the current node into buffer
-                    buf_index = index+1
-                    buf_size = len(line)
-                    buf_desc = line
-
-                    is_open = True
-                else:
-                    if is_open:
-                        buf_desc += line
-                    buf_size += len(line)
-
-                # handling multi-line nodes
-                if is_open and line.endswith(';\n'):
-                    is_open = False
+            with asciiTrace.span('scan') as scan_span, asc.open() as f:
+                progress = asciiProgress.Progress(asc.disk_size)
+                progress.progress_changed.connect(self.progress_changed.emit)
+                progress.rate_changed.connect(self.rate_changed.emit)
+                next_report = progress.start()
+                # progress of compressed files follows the compressed bytes read
+                source = f.raw if asc.compression else None
+                buf_index = -1
+                buf_desc = b''
+                buf_size = 0
+                buf_offset = -1
+                buf_hash = None
+
+                cache_size = 0  # total file size read into cache
+                position = 0  # byte position of the current line
+                for index, line in enumerate(f):
+                    line_start = position
+                    position += len(line)
+
+                    # empty line
+                    if not line:
+                        continue
+
+                    # comment
+                    if line.startswith(b'\\'):
+                        continue
+
+                    # new node happens when lines aren't indented
+                    if not line.startswith(b'\t'):
+                        # store the previous buffer as a block record
+                        record = (
+                            buf_index,
+                            buf_desc,
+                            buf_size,
+                            buf_offset,
+                            buf_hash.digest() if buf_hash else None
+                        )
+                        if spill:
+                            spill.add(*record)
+                        else:
+                            records.append(record)
+
+                        # degrade once the estimated memory grows too large
+                        if budget and not spill:
+                            memory += BLOCK_COST + 2 * len(buf_desc)
+                            if memory > budget:
+                                spill = asciiSpill.SpillWriter(spill_dir)
+                                for record in records:
+                                    spill.add(*record)
+                                records = list()
+                                self.event_occurred.emit('Memory budget reached, spilling blocks to disk')
+                            elif not trim and memory > budget * TRIM_RATIO:
+                                trim = True
+                                self.event_occurred.emit('Memory budget half used, trimming descriptions')
+
+                        # update load status, the report position is kept
+                        # in uncompressed bytes to compare with cache_size
+                        cache_size += buf_size
+                        if cache_size >= next_report:
+                            read_size = source.source_position if source else cache_size
+                            next_report = progress.update(read_size) + \
+                                cache_size - read_size
+
+                        # store the current node into buffer
+                        buf_index = index+1
+                        buf_size = len(line)
+                        buf_desc = line
+                        buf_offset = line_start
+                        if digest:
+                            buf_hash = hashlib.md5(line)
+
+                        is_open = True
+                        can_trim = trim and \
+                            not line.startswith(HEADER_COMMANDS)
+                    else:
+                        if is_open and can_trim:
+                            # keep the terminator so the first line still
+                            # tokenizes as a complete command
+                            buf_desc = buf_desc.rstrip(b'\r\n') + b';\n'
+                            is_open = False
+                        elif is_open:
+                            buf_desc += line
+                        if buf_hash:
+                            buf_hash.update(line)
+                        buf_size += len(line)
+
+                    # handling multi-line nodes
+                    if is_open and line.endswith((b';\n', b';\r\n')):
+                        is_open = False
+                progress.finish()
+                scan_span.add(bytes=position, blocks=len(records))
+
+            if spill:
+                # spilled blocks are tokenized when they are accessed
+                blocks = asciiSpill.SpilledBlocks(
+                    spill,
+                    lambda index, desc, size, offset, hashed: new(
+                        asc, index, decode(desc), size, offset, hashed)
+                )
+            else:
+                with asciiTrace.span('tokenize') as tokenize_span:
+                    blocks = [
+                        new(asc, index, decode(desc), size, offset, hashed)
+                        for index, desc, size, offset, hashed in records
+                    ]
+                    tokenize_span.add(
+                        bytes=sum(len(record[1]) for record in records),
+                        blocks=len(blocks))
+            read_span.add(bytes=position, blocks=len(blocks))
 
         time_elapsed = round(time.time() - start_time, 3)
         self.event_occurred.emit('File Load Complete: {}s'.format(time_elapsed))
@@ -185,10 +310,18 @@ class Ascii(object):
 
         self.__path = path
         self.__name = os.path.basename(self.__path)
-        self.__ext = os.path.splitext(self.__name)[-1]
-        self.__base = os.path.splitext(self.__name)[0]
         self.__dir = os.path.dirname(self.__path)
 
+        # name without the compression extension (e.g. .ma.gz)
+        self.__compression = asciiCompress.get_compression(self.__path)
+        self.__index = None
+        stem = self.__name
+        if self.__compression:
+            stem = os.path.splitext(self.__name)[0]
+            self.__index = asciiCompress.SeekIndex()
+        self.__ext = os.path.splitext(stem)[-1]
+        self.__base = os.path.splitext(stem)[0]
+
         if self.ext != '.ma':
             raise TypeError('File {} is not an Maya Ascii type'.format(self.__path))
 
@@ -215,14 +348,60 @@ class Ascii(object):
         return self.__path
 
     @property
-    def size(self):
+    def compression(self):
+        return self.__compression
+
+    @property
+    def disk_size(self):
         return int(os.path.getsize(self.__path))
 
+    @property
+    def size(self):
+        """
+        Uncompressed size of the file, for compressed files this is only
+        known after the file has been scanned once
+
+        :return: int. size in bytes
+        """
+        if self.__index and self.__index.size is not None:
+            return self.__index.size
+        return self.disk_size
+
+    def open(self):
+        """
+        Open the uncompressed content of the file as a binary stream,
+        streams of compressed files seek from the nearest checkpoint
+        recorded by the first full read
+
+        :return: io.BufferedIOBase. seekable binary stream
+        """
+        if self.__compression:
+            return asciiCompress.open_stream(self.__path, self.__index)
+        return open(self.__path, 'rb')
+
+    def __open_text(self, num):
+        """
+        Open the file as a text stream close before a line
+
+        :param num: int. line number
+        :return: tuple (io.TextIOBase, int). text stream and the line number
+                 of its first line
+        """
+        if not self.__compression:
+            return open(self.__path), 1
+
+        raw = asciiCompress.DecompressReader(
+            self.__path, self.__compression, self.__index)
+        count = raw.seek_line(num - 1) + 1
+        stream = io.TextIOWrapper(
+            io.BufferedReader(raw), encoding=ENCODING, errors='replace')
+        return stream, count
+
     def update_line(self):
         """
         Update ascii file line count
         """
-        with open(self.__path) as f:
+        with self.open() as f:
             for count, _line in enumerate(f):
                 pass
             self._lineCount = count
@@ -247,9 +426,9 @@ class Ascii(object):
         :param num: int. line number
         :return: str. full description of the ascii block
         """
-        with open(self.__path) as f:
+        f, count = self.__open_text(num)
+        with f:
             line = f.readline()
-            count = 1
             is_start = False
             record_buf = ''
 
@@ -272,3 +451,67 @@ class Ascii(object):
                 line = f.readline()
 
         return record_buf
+
+    def read_bytes(self, offset, size):
+        """
+        Read the raw bytes of an ascii block, unlike `read_detail()` this
+        seeks directly to the block instead of reading line by line
+
+        :param offset: int. starting byte position of the block
+        :param size: int. size of the block in bytes
+        :return: bytes. full raw content of the ascii block
+        """
+        with self.open() as f:
+            f.seek(offset)
+            return f.read(size)
+
+    def iter_bytes(self, blocks):
+        """
+        Read the raw bytes of many ascii blocks in a single forward pass
+        over the file
+
+        Uncompressed files are memory mapped and each block is a memoryview
+        of the map, blocks are not copied and the pages already passed are
+        reclaimed by the operating system, so huge blocks do not add to the
+        resident memory. Compressed streams can not be mapped, each block
+        is decompressed into bytes.
+
+        :param blocks: list of AsciiBlock. blocks of the current file
+        :return: generator of tuple (AsciiBlock, memoryview or bytes). block
+                 and its raw content, in file order. views are only valid
+                 until the generator is closed, slices which need bytes
+                 methods are converted with bytes()
+        """
+        blocks = sorted(
+            (b for b in blocks if b.offset >= 0),
+            key=lambda block: block.offset
+        )
+        if self.__compression:
+            with self.open() as f:
+                for block in blocks:
+                    if f.tell() != block.offset:
+                        f.seek(block.offset)
+                    yield block, f.read(block.size)
+            return
+
+        with open(self.__path, 'rb') as f:
+            if not os.fstat(f.fileno()).st_size:
+                # an empty file can not be mapped
+                for block in blocks:
+                    yield block, b''
+                return
+            buf = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        if hasattr(mmap, 'MADV_SEQUENTIAL'):
+            buf.madvise(mmap.MADV_SEQUENTIAL)
+        view = memoryview(buf)
+        try:
+            for block in blocks:
+                yield block, view[block.offset:block.offset + block.size]
+        finally:
+            view.release()
+            try:
+                buf.close()
+            except BufferError:
+                # views kept by the caller, unmapped once they are released
+                pass
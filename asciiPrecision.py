@@ -0,0 +1,283 @@
+"""
+Module for measuring the bytes spent on floating point literals and
+estimating the savings of writing them with fewer significant digits
+
+Scripting:
+```
+profiles = get_precision(blocks, digits=6)
+for profile in profiles[:10]:
+    print(profile.typ, profile.attr, profile.size, profile.savings)
+print(get_estimate(blocks, profiles))
+```
+
+Example:
+```
+createNode transform -s -n "persp";
+    setAttr ".t" -type "double3" -319.18663032960933 136.34364156607776 410.86015622114041 ;
+```
+
+With 6 significant digits the values above would be written as
+-319.187 136.344 410.86, the 55 bytes of literals shrink to 21 bytes. Only
+literals with a decimal point or an exponent are counted, integers can not
+be shortened. Literals are collected in a single pass over the file, long
+numeric arrays are tokenized on their bytes with numpy, and rounded lengths
+are computed in batches.
+"""
+
+import re
+from collections import namedtuple
+from operator import attrgetter
+
+import numpy as np
+
+from . import asciiBlock, asciiAttr, asciiProfiler
+
+
+FLOAT_RE = re.compile(
+    br'(?<![\w.])[-+]?(?:\d+\.\d*|\.\d+|\d+(?=[eE]))(?:[eE][-+]?\d+)?(?![\w.])')
+
+# data types holding text rather than numbers
+TEXT_TYPES = {'string', 'stringArray', 'dataReferenceEdits'}
+# data types holding only integer records (e.g. 'f 3 0 4 -3')
+INDEX_TYPES = {'polyFaces'}
+# data types mixing numbers with words, always tokenized with the regex
+MIXED_PREFIX = 'nurbs'
+
+# literals converted at a time
+BATCH_SIZE = 1 << 20
+
+# values at least this long are tokenized on their bytes with numpy
+ARRAY_SIZE = 1024
+
+
+NumericProfileBase = namedtuple('NumericProfileBase',
+                                ['typ',
+                                 'attr',
+                                 'count',
+                                 'size',
+                                 'rounded_size',
+                                 'savings']
+                                )
+
+
+def get_rounded_lengths(values, digits):
+    """
+    Get the length of float values written with a number of significant
+    digits, trailing zeros removed, in the shorter of fixed and scientific
+    notation
+
+    :param values: np.ndarray. float values
+    :param digits: int. number of significant digits
+    :return: np.ndarray. length of each value in bytes
+    """
+    magnitudes = np.abs(values)
+    nonzero = magnitudes > 0
+    exps = np.zeros(len(values), dtype=np.int64)
+    exps[nonzero] = np.floor(np.log10(magnitudes[nonzero]))
+
+    # significand as an integer of 'digits' digits
+    with np.errstate(over='ignore', invalid='ignore'):
+        significands = np.rint(
+            magnitudes / np.power(10.0, exps - digits + 1))
+    carry = significands >= 10 ** digits
+    exps[carry] += 1
+    significands[carry] = 10 ** (digits - 1)
+    significands = np.nan_to_num(significands).astype(np.int64)
+
+    kept = np.full(len(values), digits, dtype=np.int64)
+    for _ in range(digits - 1):
+        zeros = (significands % 10 == 0) & (kept > 1)
+        if not zeros.any():
+            break
+        significands[zeros] //= 10
+        kept[zeros] -= 1
+
+    # fixed notation, 123.456 or 0.00123
+    decimals = np.where(exps >= 0, np.maximum(kept - exps - 1, 0), kept - exps - 1)
+    integers = np.maximum(exps + 1, 1)
+    lengths = integers + np.where(decimals > 0, decimals + 1, 0)
+
+    # scientific notation, 1.23e-05
+    lengths = np.minimum(lengths, kept + (kept > 1) + 4)
+
+    lengths[~nonzero] = 1
+    return lengths + (values < 0)
+
+
+def get_literals(value):
+    """
+    Tokenize a numeric value on its bytes, without creating a string for
+    each token
+
+    :param value: bytes. raw value of a statement, without the trailing ';'
+    :return: tuple (np.ndarray, np.ndarray) or None. length and value of
+             each float literal, None if the value holds non numeric tokens
+    """
+    buf = np.frombuffer(value, dtype=np.uint8)
+    solid = np.concatenate(([False], buf > 32, [False]))
+    edges = np.flatnonzero(solid[1:] != solid[:-1])
+    starts, ends = edges[::2], edges[1::2]
+
+    try:
+        values = np.fromstring(value, dtype=np.float64, sep=' ')
+    except ValueError:
+        # numpy 2 raises on words instead of stopping at them
+        return None
+    if len(values) != len(starts):
+        return None
+
+    # a decimal point or an exponent makes a float literal
+    marks = np.concatenate(([0], np.cumsum(
+        (buf == ord('.')) | (buf == ord('e')) | (buf == ord('E')))))
+    floats = marks[ends] > marks[starts]
+    return (ends - starts)[floats], values[floats]
+
+
+def get_precision(blocks, digits=6):
+    """
+    Get the bytes spent on float literals by (node type, attribute) pairs
+    in a single forward pass over the file
+
+    :param blocks: list of AsciiBlock.
+                   normally generated from 'asciiLoader.py'
+    :param digits: int. number of significant digits to estimate for
+    :return: list of NumericProfile. profiles ranked by savings
+    """
+    ids = dict()
+    counts = list()
+    sizes = list()
+    rounded = list()
+    literals = list()
+    literal_ids = list()
+    # (ids, lengths, values) of literals already tokenized with numpy
+    arrays = list()
+
+    def flush():
+        if literals:
+            tokens = np.array(literals)
+            arrays.append((
+                np.array(literal_ids, dtype=np.int64),
+                np.char.str_len(tokens),
+                tokens.astype(np.float64)
+            ))
+        if not arrays:
+            return
+
+        keys, lengths, values = (np.concatenate(part) for part in zip(*arrays))
+        shortened = np.minimum(get_rounded_lengths(values, digits), lengths)
+
+        batch_counts = np.bincount(keys, minlength=len(ids))
+        batch_sizes = np.bincount(keys, lengths, len(ids))
+        batch_rounded = np.bincount(keys, shortened, len(ids))
+        for i in np.flatnonzero(batch_counts):
+            counts[i] += int(batch_counts[i])
+            sizes[i] += int(batch_sizes[i])
+            rounded[i] += int(batch_rounded[i])
+
+        del literals[:]
+        del literal_ids[:]
+        del arrays[:]
+
+    detail_blocks = [
+        block for block in blocks
+        if block.offset >= 0 and block.command in asciiProfiler.DETAIL_COMMANDS
+    ]
+    if detail_blocks:
+        asc = detail_blocks[0].asc
+        pending = 0  # literals held in arrays
+        for block, detail in asc.iter_bytes(detail_blocks):
+            if isinstance(block, asciiBlock.NodeBlock):
+                typ = block.typ
+            else:
+                typ = block.command
+
+            for statement in asciiAttr.iter_statements(detail):
+                if statement.command != 'setAttr' or \
+                        statement.typ in TEXT_TYPES or \
+                        statement.typ in INDEX_TYPES:
+                    continue
+
+                parsed = None
+                if statement.end - statement.value >= ARRAY_SIZE and \
+                        not statement.typ.startswith(MIXED_PREFIX):
+                    parsed = get_literals(asciiAttr.get_value(detail, statement))
+                if parsed is None:
+                    tokens = FLOAT_RE.findall(
+                        detail, statement.value, statement.end)
+                else:
+                    tokens = parsed[0]
+                if not len(tokens):
+                    continue
+
+                key = (typ, asciiProfiler.get_attr_key(statement))
+                if key not in ids:
+                    ids[key] = len(ids)
+                    counts.append(0)
+                    sizes.append(0)
+                    rounded.append(0)
+
+                if parsed is None:
+                    literals.extend(tokens)
+                    literal_ids.extend([ids[key]] * len(tokens))
+                else:
+                    arrays.append((
+                        np.full(len(tokens), ids[key], dtype=np.int64),
+                        parsed[0],
+                        parsed[1]
+                    ))
+                    pending += len(tokens)
+
+            if len(literals) + pending >= BATCH_SIZE:
+                flush()
+                pending = 0
+        flush()
+
+    results = [
+        NumericProfile(
+            typ,
+            attr,
+            counts[i],
+            sizes[i],
+            rounded[i],
+            sizes[i] - rounded[i]
+        )
+        for (typ, attr), i in ids.items()
+    ]
+    return sorted(results, key=attrgetter('savings'), reverse=True)
+
+
+def get_savings(profiles):
+    """
+    Get the total bytes saved by rounding
+
+    :param profiles: list of NumericProfile.
+    :return: int. size in bytes that rounding would save
+    """
+    return sum(profile.savings for profile in profiles)
+
+
+def get_estimate(blocks, profiles):
+    """
+    Estimate the file size after rounding
+
+    :param blocks: list of AsciiBlock. blocks of the file
+    :param profiles: list of NumericProfile. profiles of the same blocks
+    :return: int. estimated file size in bytes
+    """
+    if not blocks:
+        return 0
+    return blocks[0].asc.size - get_savings(profiles)
+
+
+class NumericProfile(NumericProfileBase):
+    @classmethod
+    def from_blocks(cls, blocks, digits=6):
+        """
+        Create numeric profile objects from ascii data blocks
+
+        :param blocks: list of AsciiBlock.
+                       normally generated from 'asciiLoader.py'
+        :param digits: int. number of significant digits to estimate for
+        :return: list of NumericProfile. profiles ranked by savings
+        """
+        return get_precision(blocks, digits)
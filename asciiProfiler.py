@@ -0,0 +1,157 @@
+"""
+Module for attributing the size of a maya ascii file to individual
+attributes of node types
+
+Scripting:
+```
+profiles, heavies = get_profile(blocks, top=20)
+for profile in profiles[:10]:
+    print(profile.typ, profile.attr, profile.size)
+```
+
+Example:
+```
+createNode animCurveTL -n "pCube1_translateX";
+    rename -uid "9E8D1C4F-4B5A-A2A8-6A42-1F8A9C5D2B7E";
+    setAttr ".tan" 18;
+    setAttr -s 4 ".ktv[0:3]"  1 0 10 2.5 20 2.5 30 2.5;
+```
+
+The block above is attributed to ('animCurveTL', 'createNode'),
+('animCurveTL', 'rename'), ('animCurveTL', '.tan') and ('animCurveTL', '.ktv'),
+indices are removed from attribute names so chunks and elements of the same
+attribute are aggregated together. Blocks other than 'createNode' and
+'select' are attributed to their command as a whole.
+"""
+
+import heapq
+import re
+from collections import namedtuple
+from operator import attrgetter
+
+from . import asciiBlock, asciiAttr
+
+
+INDEX_RE = re.compile(r'\[[^\]]*\]')
+
+# commands whose blocks hold attribute statements
+DETAIL_COMMANDS = {'createNode', 'select'}
+
+
+AttrProfileBase = namedtuple('AttrProfileBase',
+                             ['typ', 'attr', 'count', 'size', 'percent'])
+HeavyAttrBase = namedtuple('HeavyAttrBase', ['node', 'typ', 'attr', 'size'])
+
+
+def get_attr_key(statement):
+    """
+    Get the aggregation key of a statement
+
+    :param statement: asciiAttr.Statement.
+    :return: str. attribute name without indices (e.g. '.uvst.uvsp'), or
+             the command name if the statement has no attribute
+    """
+    if statement.attr:
+        return INDEX_RE.sub('', statement.attr)
+    return statement.command
+
+
+def get_profile(blocks, top=20):
+    """
+    Attribute the size of all blocks to (node type, attribute) pairs in a
+    single forward pass over the file, only one block is held in memory
+    at a time and the heaviest attributes are kept in a bounded heap
+
+    :param blocks: list of AsciiBlock.
+                   normally generated from 'asciiLoader.py'
+    :param top: int. number of heaviest node attributes to keep
+    :return: tuple (list of AttrProfile, list of HeavyAttr). profiles ranked
+             by size, and the heaviest node attributes ranked by size
+    """
+    totals = dict()
+    counts = dict()
+    heap = list()
+    sequence = 0
+
+    def add(key, size):
+        totals[key] = totals.get(key, 0) + size
+        counts[key] = counts.get(key, 0) + 1
+
+    detail_blocks = list()
+    for block in blocks:
+        if block.offset < 0:
+            continue
+        if block.command in DETAIL_COMMANDS:
+            detail_blocks.append(block)
+        else:
+            add((block.command, ''), block.size)
+
+    if detail_blocks:
+        asc = detail_blocks[0].asc
+        for block, detail in asc.iter_bytes(detail_blocks):
+            if isinstance(block, asciiBlock.NodeBlock):
+                typ, name = block.typ, block.name
+            else:
+                typ, name = block.command, block.args[-1] if block.args else ''
+
+            # size of each attribute of the current node
+            node_sizes = dict()
+            head = len(detail)
+            for statement in asciiAttr.iter_statements(detail):
+                head = min(head, statement.start)
+                attr = get_attr_key(statement)
+                node_sizes[attr] = node_sizes.get(attr, 0) + statement.size
+            node_sizes[block.command] = node_sizes.get(block.command, 0) + head
+
+            for attr, size in node_sizes.items():
+                add((typ, attr), size)
+
+                entry = (size, sequence, name, typ, attr)
+                sequence += 1
+                if len(heap) < top:
+                    heapq.heappush(heap, entry)
+                elif size > heap[0][0]:
+                    heapq.heapreplace(heap, entry)
+
+    total_size = float(blocks[0].asc.size) if blocks else 1.0
+    profiles = sorted(
+        [
+            AttrProfile(typ, attr, counts[(typ, attr)], size,
+                        round(size / total_size * 100, 3))
+            for (typ, attr), size in totals.items()
+        ],
+        key=attrgetter('size'),
+        reverse=True
+    )
+    heavies = [
+        HeavyAttr(name, typ, attr, size)
+        for size, _, name, typ, attr in sorted(heap, reverse=True)
+    ]
+    return profiles, heavies
+
+
+class AttrProfile(AttrProfileBase):
+    @classmethod
+    def from_blocks(cls, blocks):
+        """
+        Create attribute profile objects from ascii data blocks
+
+        :param blocks: list of AsciiBlock.
+                       normally generated from 'asciiLoader.py'
+        :return: list of AttrProfile. profiles ranked by size
+        """
+        return get_profile(blocks)[0]
+
+
+class HeavyAttr(HeavyAttrBase):
+    @classmethod
+    def from_blocks(cls, blocks, top=20):
+        """
+        Create the heaviest node attribute objects from ascii data blocks
+
+        :param blocks: list of AsciiBlock.
+                       normally generated from 'asciiLoader.py'
+        :param top: int. number of heaviest node attributes
+        :return: list of HeavyAttr. heaviest node attributes ranked by size
+        """
+        return get_profile(blocks, top)[1]
@@ -0,0 +1,108 @@
+"""
+Module for throttled progress reporting with throughput and time left
+
+Example
+```python
+progress = Progress(total_size)
+progress.progress_changed.connect(lambda percent: print(percent))
+progress.rate_changed.connect(lambda rate, eta: print(rate, eta))
+
+next_report = progress.start()
+for block in blocks:
+    done += block.size
+    if done >= next_report:
+        next_report = progress.update(done)
+progress.finish()
+```
+
+The caller compares its position with the next report position, a plain
+integer comparison, and only calls `update` once it is reached. Signals are
+emitted at most once per `step` percent of progress and at most once every
+`interval` seconds, so a fast loop reports a handful of times while a slow
+one still reports at every step.
+"""
+
+import time
+
+from . import asciiSignal
+
+
+# seconds between two reports
+INTERVAL = 0.1
+# percent of progress between two reports
+STEP = 1
+
+
+class Progress(object):
+    """
+    Progress of a task over a known amount of work
+    """
+    def __init__(self, total, interval=INTERVAL, step=STEP):
+        """
+        Initialization
+
+        :param total: int. amount of work (e.g. bytes or nodes)
+        :param interval: float. minimum seconds between two reports
+        :param step: float. minimum percent of progress between two reports
+        """
+        self.progress_changed = asciiSignal.Signal(int)
+        # work done per second and estimated seconds left
+        self.rate_changed = asciiSignal.Signal(float, float)
+
+        self.__total = max(total, 1)
+        self.__interval = interval
+        self.__stride = max(int(self.__total * step / 100.0), 1)
+        self.__start = 0.0
+        self.__last = 0.0
+        self.__next = 0
+
+    @property
+    def total(self):
+        return self.__total
+
+    def start(self):
+        """
+        Start timing the task
+
+        :return: int. position of the next report
+        """
+        self.__start = self.__last = time.time()
+        self.__next = self.__stride
+        return self.__next
+
+    def update(self, done):
+        """
+        Report the progress if the last report is old enough
+
+        :param done: int. amount of work done
+        :return: int. position of the next report
+        """
+        now = time.time()
+        self.__next = done + self.__stride
+        if now - self.__last < self.__interval:
+            return self.__next
+
+        self.__last = now
+        self.__emit(done, now)
+        return self.__next
+
+    def finish(self):
+        """
+        Report the task complete
+        """
+        self.__emit(self.__total, time.time())
+
+    def __emit(self, done, now):
+        """
+        Emit the progress, throughput and time left
+
+        :param done: int. amount of work done
+        :param now: float. current time
+        """
+        done = min(done, self.__total)
+        elapsed = max(now - self.__start, 1e-6)
+        rate = done / elapsed
+        eta = (self.__total - done) / rate if rate else 0.0
+
+        self.progress_changed.emit(int(done * 100 / self.__total))
+        self.rate_changed.emit(rate, eta)
@@ -0,0 +1,352 @@
+"""
+Module for writing slimmed copies of maya ascii files by filtering blocks
+
+Scripting:
+```
+# copy of a scene without unknown nodes and the 'mtoa' plugin
+blocks = Loader().load(r'C:/shot.ma')
+predicate = combine(drop_types(['unknown']),
+                    drop_plugin(blocks, 'mtoa'))
+dropped = rewrite(blocks, r'C:/shot_slim.ma', predicate)
+```
+
+Command line:
+```
+python -m mayaAsciiViewer.asciiRewrite shot.ma shot_slim.ma --type unknown --plugin mtoa
+```
+
+Example:
+```
+requires -nodeType "aiOptions" "mtoa" "4.0.0";                  (dropped)
+createNode aiOptions -s -n "defaultArnoldRenderOptions";        (dropped)
+    rename -uid "B1E4C7A2-4D9F-3E6B-8A1C-5F2D7E9B0C34";
+connectAttr "defaultArnoldRenderOptions.msg" ":defaultRenderGlobals.ao";
+                                                                (dropped)
+```
+
+A predicate decides whether a block is kept, nodes parented under a dropped
+node and connections to a dropped node are dropped along with it. Node
+names are resolved to full dag paths, a short name shared by several nodes
+never matches any of them. The kept byte ranges are copied straight from
+the source file, with `os.sendfile` where the platform supports it,
+otherwise in large writes from a memory map, the file content is never held
+in memory. Compressed files are written uncompressed.
+"""
+
+import argparse
+import mmap
+import os
+
+from . import asciiBlock, asciiLoader
+from .dg import dgGraph
+
+
+# largest number of bytes written at once when copying from a memory map
+COPY_SIZE = 16 * 1024 * 1024
+
+
+class NodePaths(object):
+    """
+    Full dag paths of the nodes created in a file, resolving the node names,
+    partial paths and plugs used by 'createNode -p', 'connectAttr' and
+    'select' to a single node
+    """
+    def __init__(self):
+        """
+        Initialization
+        """
+        self.__paths = set()
+        self.__shorts = dict()
+
+    def add(self, name, parent=''):
+        """
+        Add a created node, its parent is resolved against the nodes added
+        so far, like maya does when the file is sourced
+
+        :param name: str. node name (e.g. "pCube1")
+        :param parent: str. parent node name or path (e.g. "|group1")
+        :return: str. full dag path of the node (e.g. "|group1|pCube1")
+        """
+        path = '|' + name
+        if parent:
+            parent_path = self.resolve(parent)
+            if parent_path is None:
+                # parent created elsewhere (e.g. in a reference)
+                parent_path = '|' + dgGraph.get_node_name(parent).lstrip('|')
+            path = parent_path + path
+
+        self.__paths.add(path)
+        self.__shorts.setdefault(name, list()).append(path)
+        return path
+
+    def resolve(self, name):
+        """
+        Resolve a node name to the full dag path of a created node, a short
+        name or partial path is only resolved when a single node matches it
+
+        :param name: str. node name, path or plug (e.g. "grp", "B|grp.tx")
+        :return: str or None. full dag path (e.g. "|B|grp")
+        """
+        name = dgGraph.get_node_name(name)
+        if name.startswith('|'):
+            return name if name in self.__paths else None
+
+        candidates = self.__shorts.get(name.rsplit('|', 1)[-1], ())
+        if '|' in name:
+            suffix = '|' + name
+            candidates = [path for path in candidates if path.endswith(suffix)]
+        if len(candidates) == 1:
+            return candidates[0]
+        return None
+
+
+def drop_types(typs):
+    """
+    Predicate dropping the nodes of certain types
+
+    :param typs: list of str. node types to drop (e.g. ["unknown"])
+    :return: function. predicate returning whether a block is kept
+    """
+    typs = set(typs)
+
+    def predicate(block):
+        return not (isinstance(block, asciiBlock.NodeBlock)
+                    and block.typ in typs)
+    return predicate
+
+
+def drop_plugin(blocks, plugin):
+    """
+    Predicate dropping the 'requires' of a plugin and the nodes of the node
+    types it defines
+
+    :param blocks: list of AsciiBlock.
+    :param plugin: str. plugin name (e.g. "mtoa")
+    :return: function. predicate returning whether a block is kept
+    """
+    typs = set()
+    for block in blocks:
+        if isinstance(block, asciiBlock.RequirementBlock) \
+                and block.name == plugin:
+            typs.update(block.node_type)
+    keep_type = drop_types(typs)
+
+    def predicate(block):
+        if isinstance(block, asciiBlock.RequirementBlock):
+            return block.name != plugin
+        return keep_type(block)
+    return predicate
+
+
+def drop_namespace(namespace):
+    """
+    Predicate dropping the nodes of a namespace and its nested namespaces
+
+    :param namespace: str. namespace name (e.g. "rig")
+    :return: function. predicate returning whether a block is kept
+    """
+    prefix = namespace.strip(':') + ':'
+
+    def predicate(block):
+        return not (isinstance(block, asciiBlock.NodeBlock)
+                    and block.name.lstrip(':').startswith(prefix))
+    return predicate
+
+
+def combine(*predicates):
+    """
+    Predicate keeping a block only when all predicates keep it
+
+    :param predicates: list of function. predicates over AsciiBlock
+    :return: function. combined predicate
+    """
+    def predicate(block):
+        return all(keep(block) for keep in predicates)
+    return predicate
+
+
+def get_dropped(blocks, predicate):
+    """
+    Get the blocks to drop, including the blocks depending on a dropped node
+
+    :param blocks: list of AsciiBlock.
+                   normally generated from 'asciiLoader.py'
+    :param predicate: function. returns whether a block is kept
+    :return: list of AsciiBlock. dropped blocks in file order
+    """
+    dropped = list()
+    paths = NodePaths()
+    dropped_paths = set()
+    # parents are always created before their children
+    for block in blocks:
+        if block.offset < 0:
+            continue
+
+        keep = predicate(block)
+        if isinstance(block, asciiBlock.NodeBlock):
+            path = paths.add(block.name, block.parent)
+            if keep and path.rpartition('|')[0] in dropped_paths:
+                keep = False
+            if not keep:
+                dropped_paths.add(path)
+        if not keep:
+            dropped.append(block)
+
+    if not dropped_paths:
+        return dropped
+
+    offsets = set(block.offset for block in dropped)
+    for block in blocks:
+        if block.offset in offsets:
+            continue
+        if isinstance(block, asciiBlock.ConnectionBlock):
+            if paths.resolve(block.source) in dropped_paths or \
+                    paths.resolve(block.dest) in dropped_paths:
+                dropped.append(block)
+        elif block.command == 'select' and block.args:
+            # attributes set on a node created elsewhere
+            if paths.resolve(block.args[-1]) in dropped_paths:
+                dropped.append(block)
+
+    return sorted(dropped, key=lambda block: block.offset)
+
+
+def get_ranges(dropped, size):
+    """
+    Get the byte ranges of a file left after removing blocks, bytes outside
+    of any block (e.g. the header comments) are kept
+
+    :param dropped: list of AsciiBlock. dropped blocks in file order
+    :param size: int. file size in bytes
+    :return: list of tuple (int, int). offset and size of each kept range
+    """
+    ranges = list()
+    position = 0
+    for block in dropped:
+        if block.offset > position:
+            ranges.append((position, block.offset - position))
+        position = max(position, block.offset + block.size)
+    if size > position:
+        ranges.append((position, size - position))
+    return ranges
+
+
+def copy_stream_ranges(asc, dst, ranges):
+    """
+    Copy byte ranges of the uncompressed content of a compressed file into
+    an uncompressed file
+
+    :param asc: asciiLoader.Ascii. source file
+    :param dst: str. destination file path
+    :param ranges: list of tuple (int, int). offset and size of each range
+    """
+    with asc.open() as fin, open(dst, 'wb') as fout:
+        for offset, size in ranges:
+            if fin.tell() != offset:
+                fin.seek(offset)
+            while size > 0:
+                data = fin.read(min(COPY_SIZE, size))
+                if not data:
+                    break
+                fout.write(data)
+                size -= len(data)
+
+
+def copy_ranges(src, dst, ranges):
+    """
+    Copy byte ranges of a file into another file
+
+    :param src: str. source file path
+    :param dst: str. destination file path
+    :param ranges: list of tuple (int, int). offset and size of each range
+    """
+    with open(src, 'rb') as fin, open(dst, 'wb') as fout:
+        if hasattr(os, 'sendfile'):
+            try:
+                for offset, size in ranges:
+                    while size > 0:
+                        sent = os.sendfile(
+                            fout.fileno(), fin.fileno(), offset, size)
+                        if not sent:
+                            break
+                        offset += sent
+                        size -= sent
+                return
+            except OSError:
+                # platforms only supporting sockets as destination
+                fout.seek(0)
+                fout.truncate()
+
+        if not ranges:
+            return
+
+        buf = mmap.mmap(fin.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            for offset, size in ranges:
+                end = offset + size
+                while offset < end:
+                    chunk = min(COPY_SIZE, end - offset)
+                    fout.write(buf[offset:offset+chunk])
+                    offset += chunk
+        finally:
+            buf.close()
+
+
+def rewrite(blocks, path, predicate):
+    """
+    Write a copy of the file of the blocks, without the blocks rejected by
+    a predicate
+
+    :param blocks: list of AsciiBlock.
+                   normally generated from 'asciiLoader.py'
+    :param path: str. output .ma full path
+    :param predicate: function. returns whether a block is kept
+    :return: list of AsciiBlock. dropped blocks in file order
+    """
+    blocks = [block for block in blocks if block.offset >= 0]
+    if not blocks:
+        raise ValueError('No ascii blocks to rewrite')
+
+    asc = blocks[0].asc
+    if os.path.exists(path) and os.path.samefile(path, asc.path):
+        raise ValueError('Cannot rewrite {} onto itself'.format(path))
+
+    dropped = get_dropped(blocks, predicate)
+    ranges = get_ranges(dropped, asc.size)
+    if asc.compression:
+        copy_stream_ranges(asc, path, ranges)
+    else:
+        copy_ranges(asc.path, path, ranges)
+    return dropped
+
+
+def main(argv=None):
+    """
+    Command line entry, write a filtered copy of a file
+
+    :param argv: list of str. command line arguments
+    """
+    parser = argparse.ArgumentParser(
+        description='Write a slimmed copy of a maya ascii file')
+    parser.add_argument('src', help='source .ma file')
+    parser.add_argument('dst', help='output .ma file')
+    parser.add_argument('--type', action='append', default=[],
+                        help='node type to drop, can be repeated')
+    parser.add_argument('--plugin', action='append', default=[],
+                        help='plugin whose requires and nodes to drop')
+    parser.add_argument('--namespace', action='append', default=[],
+                        help='namespace whose nodes to drop')
+    args = parser.parse_args(argv)
+
+    blocks = asciiLoader.Loader().load(args.src)
+    predicates = [drop_types(args.type)]
+    predicates.extend(drop_plugin(blocks, plugin) for plugin in args.plugin)
+    predicates.extend(drop_namespace(ns) for ns in args.namespace)
+
+    dropped = rewrite(blocks, args.dst, combine(*predicates))
+    print('dropped {} blocks, {} bytes'.format(
+        len(dropped), sum(block.size for block in dropped)))
+
+
+if __name__ == '__main__':
+    main()
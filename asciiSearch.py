@@ -0,0 +1,199 @@
+"""
+Module for searching the full text of a maya ascii file and mapping the
+matches back to their owning blocks
+
+Scripting:
+```
+# every node mentioning a texture directory
+for hit in iter_hits(blocks, r'sourceimages/.*\\.exr'):
+    print(hit.name, hit.line, hit.text)
+```
+
+Example:
+```
+createNode file -n "diffuse_file";
+    rename -uid "4B6E1F0A-4C2D-9E8B-7A3F-1D5C2B8E6A90";
+    setAttr ".ftn" -type "string" "sourceimages/rock_diffuse.exr";
+```
+
+The pattern above matches the 'setAttr' line, the byte offset of the match
+falls inside the 'createNode file' block so the hit is reported as
+"diffuse_file". The file is memory mapped and scanned by a single compiled
+regex, each match is mapped to its block by bisecting the sorted block
+offsets.
+"""
+
+import bisect
+import mmap
+import re
+from collections import namedtuple
+
+from . import asciiBlock, asciiLoader
+
+
+# bytes around a match searched for its line boundaries
+WINDOW = 160
+
+
+HitBase = namedtuple('HitBase',
+                     ['name', 'typ', 'command', 'line', 'offset', 'text'])
+
+
+class BlockIndex(object):
+    """
+    Sorted byte offsets of ascii blocks, used to find the block owning
+    a byte position
+    """
+    def __init__(self, blocks):
+        """
+        Initialization
+
+        :param blocks: list of AsciiBlock. blocks of the same file
+        """
+        self.__blocks = sorted(
+            (block for block in blocks if block.offset >= 0),
+            key=lambda block: block.offset
+        )
+        self.__offsets = [block.offset for block in self.__blocks]
+
+    @property
+    def blocks(self):
+        return self.__blocks
+
+    def find(self, offset):
+        """
+        Find the block containing a byte position
+
+        :param offset: int. byte position in file
+        :return: AsciiBlock or None. None if the position is not in a block
+        """
+        i = bisect.bisect_right(self.__offsets, offset) - 1
+        if i < 0:
+            return None
+        block = self.__blocks[i]
+        if offset >= block.offset + block.size:
+            return None
+        return block
+
+
+def compile_pattern(pattern, ignore_case=False):
+    """
+    Compile a text pattern into a bytes regex
+
+    :param pattern: str. regular expression
+    :param ignore_case: bool. whether the search is case insensitive
+    :return: re.Pattern. compiled bytes pattern
+    """
+    flags = re.IGNORECASE if ignore_case else 0
+    if not isinstance(pattern, bytes):
+        pattern = pattern.encode(asciiLoader.ENCODING)
+    return re.compile(pattern, flags)
+
+
+def get_line(buf, start, end):
+    """
+    Get the text of the line around a match, long lines are cut to a
+    window around the match
+
+    :param buf: mmap or bytes. file content
+    :param start: int. match start position
+    :param end: int. match end position
+    :return: str. line text
+    """
+    head = max(buf.rfind(b'\n', max(0, start - WINDOW), start) + 1,
+               start - WINDOW, 0)
+    # a match ending with a line break ends its line
+    tail = buf.find(b'\n', max(end - 1, start), end + WINDOW)
+    if tail < 0:
+        tail = min(end + WINDOW, len(buf))
+    return asciiLoader.decode(buf[head:tail]).strip()
+
+
+def iter_matches(index, regex):
+    """
+    Run a regular expression over the file of indexed blocks
+
+    :param index: BlockIndex. blocks of the file
+    :param regex: re.Pattern. compiled bytes pattern
+    :return: generator of tuple (AsciiBlock, int, str). owning block, byte
+             position and line text of each match
+    """
+    asc = index.blocks[0].asc
+
+    # compressed files can not be mapped, blocks are searched one by one
+    if asc.compression:
+        for block, detail in asc.iter_bytes(index.blocks):
+            for match in regex.finditer(detail):
+                yield (
+                    block,
+                    block.offset + match.start(),
+                    get_line(detail, match.start(), match.end())
+                )
+        return
+
+    with open(asc.path, 'rb') as f:
+        buf = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        matches = regex.finditer(buf)
+        try:
+            for match in matches:
+                block = index.find(match.start())
+                if block is not None:
+                    yield (
+                        block,
+                        match.start(),
+                        get_line(buf, match.start(), match.end())
+                    )
+        finally:
+            # matches keep the buffer exported until released
+            matches = match = None
+            buf.close()
+
+
+def iter_hits(blocks, pattern, ignore_case=False, limit=None):
+    """
+    Search the file of the blocks with a regular expression, matches are
+    yielded as they are found so results can be displayed incrementally
+
+    :param blocks: list of AsciiBlock.
+                   normally generated from 'asciiLoader.py'
+    :param pattern: str. regular expression
+    :param ignore_case: bool. whether the search is case insensitive
+    :param limit: int. maximum number of hits, None for all
+    :return: generator of Hit. matches in file order
+    """
+    index = BlockIndex(blocks)
+    if not index.blocks:
+        return
+
+    regex = compile_pattern(pattern, ignore_case)
+    matches = iter_matches(index, regex)
+    count = 0
+    try:
+        for block, offset, text in matches:
+            if isinstance(block, asciiBlock.NodeBlock):
+                name, typ = block.name, block.typ
+            else:
+                name, typ = block.desc.strip(), ''
+            yield Hit(name, typ, block.command, block.index, offset, text)
+
+            count += 1
+            if limit is not None and count >= limit:
+                break
+    finally:
+        matches.close()
+
+
+class Hit(HitBase):
+    @classmethod
+    def from_blocks(cls, blocks, pattern, ignore_case=False, limit=None):
+        """
+        Create search hit data objects from ascii data blocks
+
+        :param blocks: list of AsciiBlock.
+                       normally generated from 'asciiLoader.py'
+        :param pattern: str. regular expression
+        :param ignore_case: bool. whether the search is case insensitive
+        :param limit: int. maximum number of hits, None for all
+        :return: list of Hit. matches in file order
+        """
+        return list(iter_hits(blocks, pattern, ignore_case, limit))
@@ -0,0 +1,527 @@
+"""
+Module for a local HTTP/JSON service sharing parsed maya ascii files
+between pipeline tools
+
+Command line:
+```
+python -m mayaAsciiViewer.asciiServer --port 8765 --cache 2048
+```
+
+Endpoints, all GET with a 'path' query parameter:
+```
+/summary?path=C:/shot.ma                       inspector report
+/dag?path=C:/shot.ma&node=group1&depth=2       dag subtree of a node
+/node?path=C:/shot.ma&name=pCubeShape1         ascii block of a node
+/search?path=C:/shot.ma&pattern=mtoa&limit=50  regular expression search
+/stats                                         cache usage
+```
+
+Scripting:
+```
+server = Server(cache_size=2 * 1024 ** 3, workers=4)
+asyncio.run(server.serve('127.0.0.1', 8765))
+```
+
+Requests are handled by asyncio while loading, building and searching run
+on a thread pool. Loaded files are kept in a least recently used cache
+bounded by an estimate of their memory, entries are dropped when the file
+changes on disk. Concurrent requests for a file being loaded wait on the
+same load instead of parsing it again, repeat requests are answered from
+memory.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import re
+import time
+from collections import OrderedDict
+from concurrent import futures
+
+from urllib.parse import urlsplit, parse_qs
+
+from . import asciiBlock, asciiInspect, asciiLoader, asciiSearch
+from .dag import dagBuilder
+
+
+# estimated memory of a loaded ascii block, in bytes
+BLOCK_COST = 600
+# estimated memory of a dag node, in bytes
+NODE_COST = 400
+
+DEFAULT_PORT = 8765
+DEFAULT_CACHE = 1024 * 1024 * 1024
+SEARCH_LIMIT = 1000
+
+STATUS = {
+    200: 'OK',
+    400: 'Bad Request',
+    404: 'Not Found',
+    405: 'Method Not Allowed',
+    500: 'Internal Server Error',
+}
+
+
+class HttpError(Exception):
+    """
+    Error answered to the client with a http status
+    """
+    def __init__(self, status, message):
+        super(HttpError, self).__init__(message)
+        self.status = status
+
+
+class Scene(object):
+    """
+    A loaded maya ascii file and what is derived from it on demand
+    """
+    def __init__(self, path, stat, blocks):
+        """
+        Initialization
+
+        :param path: str. maya ascii file path
+        :param stat: tuple (int, float). size and modification time of the
+                     file when it was loaded
+        :param blocks: list of AsciiBlock. blocks loaded from the file
+        """
+        self.__path = path
+        self.__stat = stat
+        self.__blocks = blocks
+        self.__summary = None
+        self.__root = None
+        self.__nodes = None
+        self.__named = None
+
+    @property
+    def path(self):
+        return self.__path
+
+    @property
+    def stat(self):
+        return self.__stat
+
+    @property
+    def blocks(self):
+        return self.__blocks
+
+    @property
+    def cost(self):
+        """
+        Estimated memory held by the scene
+
+        :return: int. size in bytes
+        """
+        cost = len(self.__blocks) * BLOCK_COST
+        if self.__root is not None:
+            cost += len(self.__nodes) * NODE_COST
+        return cost
+
+    def get_summary(self):
+        """
+        :return: dict. inspector report of the file
+        """
+        if self.__summary is None:
+            self.__summary = asciiInspect.get_report(self.__path, self.__blocks)
+        return self.__summary
+
+    def get_root(self):
+        """
+        :return: DagNode. root of the dag tree, built on first use
+        """
+        if self.__root is None:
+            root = dagBuilder.Builder().build(self.__blocks)
+            nodes = dict()
+            stack = [root]
+            while stack:
+                node = stack.pop()
+                nodes.setdefault(node.name, node)
+                stack.extend(node.children)
+            self.__nodes = nodes
+            self.__root = root
+        return self.__root
+
+    def get_node(self, name):
+        """
+        :param name: str. dag node name, empty for the root
+        :return: DagNode or None.
+        """
+        root = self.get_root()
+        if not name:
+            return root
+        return self.__nodes.get(name)
+
+    def get_block(self, name):
+        """
+        :param name: str. node name
+        :return: NodeBlock or None. first block creating the node
+        """
+        if self.__named is None:
+            named = dict()
+            for block in self.__blocks:
+                if isinstance(block, asciiBlock.NodeBlock):
+                    named.setdefault(block.name, block)
+            self.__named = named
+        return self.__named.get(name)
+
+
+class SceneCache(object):
+    """
+    Least recently used scenes, bounded by their estimated memory
+    """
+    def __init__(self, max_size):
+        """
+        Initialization
+
+        :param max_size: int. memory budget in bytes
+        """
+        self.__max_size = max_size
+        self.__scenes = OrderedDict()
+        self.__hits = 0
+        self.__misses = 0
+
+    def get(self, path, stat):
+        """
+        Get a cached scene still matching the file on disk
+
+        :param path: str. maya ascii file path
+        :param stat: tuple (int, float). current size and modification time
+        :return: Scene or None.
+        """
+        scene = self.__scenes.get(path)
+        if scene is None or scene.stat != stat:
+            self.__misses += 1
+            return None
+        self.__scenes.move_to_end(path)
+        self.__hits += 1
+        return scene
+
+    def put(self, scene):
+        """
+        Add a scene, evicting the least recently used ones over budget
+
+        :param scene: Scene.
+        """
+        self.__scenes[scene.path] = scene
+        self.__scenes.move_to_end(scene.path)
+        self.trim()
+
+    def trim(self):
+        """
+        Evict the least recently used scenes until the cache is in budget,
+        the most recent scene is always kept
+        """
+        while len(self.__scenes) > 1 and self.size > self.__max_size:
+            self.__scenes.popitem(last=False)
+
+    @property
+    def size(self):
+        return sum(scene.cost for scene in self.__scenes.values())
+
+    def get_stats(self):
+        """
+        :return: dict. cache usage
+        """
+        return {
+            'scenes': list(self.__scenes),
+            'size': self.size,
+            'max_size': self.__max_size,
+            'hits': self.__hits,
+            'misses': self.__misses,
+        }
+
+
+def load(path):
+    """
+    Load a scene, run on the worker pool
+
+    :param path: str. maya ascii file path
+    :return: Scene.
+    """
+    stat = get_stat(path)
+    return Scene(path, stat, asciiLoader.Loader().load(path))
+
+
+def get_stat(path):
+    """
+    :param path: str. file path
+    :return: tuple (int, float). size and modification time
+    """
+    stat = os.stat(path)
+    return stat.st_size, stat.st_mtime
+
+
+def get_subtree(node, depth):
+    """
+    Convert a dag node and its children to json serializable dicts
+
+    :param node: DagNode. top node
+    :param depth: int. levels of children to include, negative for all
+    :return: dict. node with its 'children', 'child_count' is given for
+             nodes whose children are cut by the depth
+    """
+    entry = {
+        'name': node.name,
+        'typ': node.typ,
+        'size': node.size,
+        'total_size': node.total_size,
+        'index': node.index,
+        'child_count': node.child_count,
+    }
+    if depth != 0:
+        entry['children'] = [
+            get_subtree(child, depth - 1) for child in node.children]
+    return entry
+
+
+class Server(object):
+    """
+    Asyncio http server answering json requests about maya ascii files
+    """
+    def __init__(self, cache_size=DEFAULT_CACHE, workers=None):
+        """
+        Initialization
+
+        :param cache_size: int. memory budget of loaded scenes in bytes
+        :param workers: int or None. number of worker threads
+        """
+        self.__cache = SceneCache(cache_size)
+        self.__executor = futures.ThreadPoolExecutor(workers)
+        self.__pending = dict()
+        self.__routes = {
+            '/summary': self.summary,
+            '/dag': self.dag,
+            '/node': self.node,
+            '/search': self.search,
+            '/stats': self.stats,
+        }
+
+    @property
+    def cache(self):
+        return self.__cache
+
+    async def run(self, func, *args):
+        """
+        Run a blocking function on the worker pool
+
+        :param func: function.
+        :return: result of the function
+        """
+        loop = asyncio.get_event_loop()
+        return await loop.run_in_executor(self.__executor, func, *args)
+
+    async def get_scene(self, path):
+        """
+        Get a loaded scene, from the cache or by loading it once for all
+        concurrent requests
+
+        :param path: str. maya ascii file path
+        :return: Scene.
+        """
+        path = os.path.abspath(path)
+        try:
+            stat = get_stat(path)
+        except OSError:
+            raise HttpError(404, 'File not found {}'.format(path))
+
+        scene = self.__cache.get(path, stat)
+        if scene is not None:
+            return scene
+
+        pending = self.__pending.get(path)
+        if pending is None:
+            pending = asyncio.ensure_future(self.run(load, path))
+            self.__pending[path] = pending
+            try:
+                scene = await pending
+            finally:
+                del self.__pending[path]
+            self.__cache.put(scene)
+            return scene
+        return await asyncio.shield(pending)
+
+    async def summary(self, query):
+        scene = await self.get_scene(get_param(query, 'path'))
+        return await self.run(scene.get_summary)
+
+    async def dag(self, query):
+        scene = await self.get_scene(get_param(query, 'path'))
+        name = get_param(query, 'node', '')
+        depth = int(get_param(query, 'depth', '1'))
+
+        node = await self.run(scene.get_node, name)
+        # the dag tree adds to the estimated memory of the scene
+        self.__cache.trim()
+        if node is None:
+            raise HttpError(404, 'Node not found {}'.format(name))
+        return await self.run(get_subtree, node, depth)
+
+    async def node(self, query):
+        scene = await self.get_scene(get_param(query, 'path'))
+        name = get_param(query, 'name')
+        block = await self.run(scene.get_block, name)
+        if block is None:
+            raise HttpError(404, 'Node not found {}'.format(name))
+
+        def read():
+            # seek straight to the block, read_detail scans the file
+            raw = block.asc.read_bytes(block.offset, block.size)
+            return asciiLoader.decode(raw)
+
+        detail = await self.run(read)
+        return {
+            'name': block.name,
+            'typ': block.typ,
+            'parent': block.parent,
+            'index': block.index,
+            'offset': block.offset,
+            'size': block.size,
+            'detail': detail,
+        }
+
+    async def search(self, query):
+        scene = await self.get_scene(get_param(query, 'path'))
+        pattern = get_param(query, 'pattern')
+        limit = int(get_param(query, 'limit', str(SEARCH_LIMIT)))
+        ignore_case = get_param(query, 'ignore_case', '') in ('1', 'true')
+
+        def find():
+            return [
+                hit._asdict() for hit in asciiSearch.iter_hits(
+                    scene.blocks, pattern, ignore_case, limit)
+            ]
+
+        try:
+            return await self.run(find)
+        except re.error as e:
+            raise HttpError(400, 'Invalid pattern: {}'.format(e))
+
+    async def stats(self, query):
+        return self.__cache.get_stats()
+
+    async def handle(self, reader, writer):
+        """
+        Answer the requests of a connection, kept alive until the client
+        closes it
+        """
+        try:
+            while True:
+                request = await reader.readline()
+                if not request:
+                    break
+
+                keep_alive = request.rstrip().endswith(b'HTTP/1.1')
+                while True:
+                    header = await reader.readline()
+                    if header in (b'\r\n', b'\n', b''):
+                        break
+                    key, _, value = header.decode('latin-1').partition(':')
+                    if key.strip().lower() == 'connection':
+                        keep_alive = value.strip().lower() == 'keep-alive'
+
+                status, body = await self.respond(request)
+                writer.write(
+                    'HTTP/1.1 {} {}\r\n'
+                    'Content-Type: application/json\r\n'
+                    'Content-Length: {}\r\n'
+                    'Connection: {}\r\n\r\n'.format(
+                        status, STATUS[status], len(body),
+                        'keep-alive' if keep_alive else 'close'
+                    ).encode('latin-1') + body)
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    async def respond(self, request):
+        """
+        Route a request line to its endpoint
+
+        :param request: bytes. http request line
+        :return: tuple (int, bytes). http status and json body
+        """
+        start = time.time()
+        try:
+            parts = request.decode('latin-1').split()
+            if len(parts) < 2:
+                raise HttpError(400, 'Malformed request')
+            if parts[0] != 'GET':
+                raise HttpError(405, 'Only GET is supported')
+
+            url = urlsplit(parts[1])
+            route = self.__routes.get(url.path)
+            if route is None:
+                raise HttpError(404, 'Unknown endpoint {}'.format(url.path))
+
+            result = await route(parse_qs(url.query))
+            status, body = 200, {'result': result}
+        except HttpError as e:
+            status, body = e.status, {'error': str(e)}
+        except ValueError as e:
+            status, body = 400, {'error': str(e)}
+        except Exception as e:
+            status, body = 500, {'error': '{}: {}'.format(type(e).__name__, e)}
+
+        body['time'] = time.time() - start
+        return status, json.dumps(body).encode('utf-8')
+
+    async def serve(self, host='127.0.0.1', port=DEFAULT_PORT):
+        """
+        Serve requests until cancelled
+
+        :param host: str. interface to listen on
+        :param port: int. port to listen on
+        """
+        server = await asyncio.start_server(self.handle, host, port)
+        async with server:
+            await server.serve_forever()
+
+
+def get_param(query, name, default=None):
+    """
+    Get a query parameter
+
+    :param query: dict. parsed query string
+    :param name: str. parameter name
+    :param default: str or None. value when missing, None if required
+    :return: str. parameter value
+    """
+    values = query.get(name)
+    if values:
+        return values[0]
+    if default is None:
+        raise HttpError(400, 'Missing parameter {}'.format(name))
+    return default
+
+
+def main(argv=None):
+    """
+    Command line entry, run the service
+
+    :param argv: list of str. command line arguments
+    """
+    parser = argparse.ArgumentParser(
+        description='Serve maya ascii file inspection over http')
+    parser.add_argument('--host', default='127.0.0.1',
+                        help='interface to listen on')
+    parser.add_argument('--port', type=int, default=DEFAULT_PORT,
+                        help='port to listen on')
+    parser.add_argument('--cache', type=int, default=DEFAULT_CACHE >> 20,
+                        help='memory budget of loaded scenes in MB')
+    parser.add_argument('--workers', type=int, default=None,
+                        help='number of worker threads')
+    args = parser.parse_args(argv)
+
+    server = Server(args.cache << 20, args.workers)
+    print('serving on http://{}:{}'.format(args.host, args.port))
+    try:
+        asyncio.run(server.serve(args.host, args.port))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == '__main__':
+    main()
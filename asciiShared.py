@@ -0,0 +1,374 @@
+"""
+Module to load maya ascii files in a separate process, the parsed blocks
+and Dag tree are handed back as columns in shared memory
+
+Example
+```python
+loader = SharedLoader()
+blocks = loader.load(mfile, idle=QtCore.QCoreApplication.processEvents)
+root = loader.root
+```
+
+Parsing in the viewer process competes with Qt painting for the GIL, even
+from a thread. The worker process loads the file, builds the Dag tree and
+writes one column per block property (line index, offset, size, block type,
+Dag parent, upstream size) followed by a pool of the descriptions and
+tokenized arguments into a `multiprocessing.shared_memory` block. Only the
+name and length of that block go through the process queue, nothing per
+block is pickled. The viewer maps the block, creates the ascii blocks and
+Dag nodes straight from the columns, and `idle` is called while waiting
+and between chunks so the interface keeps painting.
+
+`progress_changed`, `rate_changed` and `event_occurred` are forwarded from
+the worker the same way as `Loader`. Compressed files keep their seek
+checkpoints in decompressor states which can not be shared, they are loaded
+in the current process.
+"""
+
+import multiprocessing
+import os
+import queue
+from array import array
+from multiprocessing import shared_memory
+
+from . import asciiBlock, asciiLoader, asciiSignal, asciiTrace
+from .dag import dagBuilder, dagNode
+
+
+# seconds between two calls of idle while the worker is parsing, 60 fps
+POLL_INTERVAL = 1 / 60.0
+# blocks created between two calls of idle while mapping
+CHUNK = 5000
+# separates the command and arguments of a block in the string pool
+SEPARATOR = '\0'
+# typecode and item size of the columns
+TYPECODE = 'q'
+ITEM_SIZE = array(TYPECODE).itemsize
+
+# shared columns, in memory order, followed by the string pool
+COLUMNS = (
+    'index',
+    'offset',
+    'size',
+    'kind',
+    'parent',
+    'upstream',
+    'desc_end',
+    'token_end',
+)
+# block types by their 'kind' column value
+KINDS = (
+    asciiBlock.AsciiBlock,
+    asciiBlock.NodeBlock,
+    asciiBlock.ConnectionBlock,
+    asciiBlock.FileBlock,
+    asciiBlock.RequirementBlock,
+    asciiBlock.InfoBlock,
+)
+
+
+def share(blocks, root):
+    """
+    Write blocks and their Dag tree as columns into a new shared memory
+    block, the caller is responsible for closing it
+
+    :param blocks: list of AsciiBlock. blocks of a file
+    :param root: DagNode. root dag node built from the blocks
+    :return: tuple (SharedMemory, dict). shared memory and its layout
+    """
+    count = len(blocks)
+    kinds = dict((cls, i) for i, cls in enumerate(KINDS))
+    positions = dict((block.index, i) for i, block in enumerate(blocks))
+
+    # Dag parent position of each node block, -1 for top level nodes
+    parents = [-1] * count
+    upstreams = [0] * count
+    for node in dagNode.get_children(root):
+        i = positions[node.index]
+        if node.parent is not root:
+            parents[i] = positions[node.parent.index]
+        upstreams[i] = node.upstream_size
+
+    # descriptions and tokens are stored one after another, the ends are
+    # character positions in the decoded pool
+    pieces = list()
+    desc_ends = list()
+    token_ends = list()
+    end = 0
+    for block in blocks:
+        tokens = SEPARATOR.join([block.command] + block.args)
+        pieces.append(block.desc)
+        pieces.append(tokens)
+        end += len(block.desc)
+        desc_ends.append(end)
+        end += len(tokens)
+        token_ends.append(end)
+    pool = ''.join(pieces).encode(asciiLoader.ENCODING, 'surrogatepass')
+
+    columns = [
+        [block.index for block in blocks],
+        [block.offset for block in blocks],
+        [block.size for block in blocks],
+        [kinds[type(block)] for block in blocks],
+        parents,
+        upstreams,
+        desc_ends,
+        token_ends,
+    ]
+
+    width = count * ITEM_SIZE
+    size = width * len(COLUMNS) + len(pool)
+    shm = shared_memory.SharedMemory(create=True, size=max(size, 1))
+    for i, values in enumerate(columns):
+        shm.buf[i * width:(i + 1) * width] = array(TYPECODE, values).tobytes()
+    shm.buf[width * len(COLUMNS):size] = pool
+
+    layout = {
+        'name': shm.name,
+        'count': count,
+        'pool': len(pool),
+    }
+    return shm, layout
+
+
+def read_columns(buf, layout):
+    """
+    Read the columns and the string pool of a shared memory block
+
+    :param buf: memoryview. shared memory buffer
+    :param layout: dict. layout returned by share()
+    :return: tuple (dict, str). column values by name, and the string pool
+    """
+    width = layout['count'] * ITEM_SIZE
+    columns = dict()
+    for i, name in enumerate(COLUMNS):
+        with buf[i * width:(i + 1) * width] as part, part.cast(TYPECODE) as column:
+            columns[name] = column.tolist()
+
+    start = width * len(COLUMNS)
+    with buf[start:start + layout['pool']] as part:
+        pool = bytes(part).decode(asciiLoader.ENCODING, 'surrogatepass')
+    return columns, pool
+
+
+def scan(path, messages):
+    """
+    Worker process entry, load a file, build its Dag tree and share them
+
+    :param path: str. .ma full path
+    :param messages: multiprocessing.Queue. queue receiving the progress,
+                     the events and finally the layout or an error
+    """
+    loader = asciiLoader.Loader()
+    loader.progress_changed.connect(lambda value: messages.put(('progress', value)))
+    loader.rate_changed.connect(lambda rate, eta: messages.put(('rate', rate, eta)))
+    loader.event_occurred.connect(lambda msg: messages.put(('event', msg)))
+    builder = dagBuilder.Builder()
+    builder.progress_changed.connect(lambda value: messages.put(('progress', value)))
+    builder.event_occurred.connect(lambda msg: messages.put(('event', msg)))
+
+    try:
+        blocks = loader.load(path)
+        root = builder.build(blocks)
+        shm, layout = share(blocks, root)
+    except Exception as e:
+        messages.put(('error', '{}: {}'.format(e.__class__.__name__, e)))
+        return
+
+    # the segment outlives this handle until the viewer unlinks it
+    shm.close()
+    messages.put(('done', layout))
+
+
+class SharedLoader(object):
+    """
+    Loader parsing ascii files in a separate process
+    """
+    def __init__(self):
+        """
+        Initialization
+        """
+        self.progress_changed = asciiSignal.Signal(int)
+        self.rate_changed = asciiSignal.Signal(float, float)
+        self.event_occurred = asciiSignal.Signal(str)
+
+        self.__root = None
+
+    @property
+    def root(self):
+        """
+        Dag tree of the last loaded file
+
+        :return: DagNode or None. root dag node
+        """
+        return self.__root
+
+    def load(self, path, idle=None):
+        """
+        Create a network of Ascii blocks and its Dag tree from a path
+
+        :param path: str. .ma full path
+        :param idle: function or None. called at least every POLL_INTERVAL
+                     while waiting for the worker, and between chunks of
+                     blocks, e.g. QCoreApplication.processEvents
+        :return: list of AsciiBlock. data network
+        """
+        asc = asciiLoader.Ascii(path)
+        if asc.compression:
+            return self.__load_local(path)
+
+        with asciiTrace.span('read', os.path.basename(path)) as read_span:
+            with asciiTrace.span('worker'):
+                layout = self.__run(path, idle)
+
+            self.event_occurred.emit('Mapping Blocks')
+            with asciiTrace.span('map') as map_span:
+                shm = shared_memory.SharedMemory(name=layout['name'])
+                try:
+                    columns, pool = read_columns(shm.buf, layout)
+                finally:
+                    shm.close()
+                    shm.unlink()
+                blocks = self.__new_blocks(asc, columns, pool, idle)
+                map_span.add(bytes=layout['pool'], blocks=len(blocks))
+            read_span.add(bytes=asc.size, blocks=len(blocks))
+
+        with asciiTrace.span('build') as build_span:
+            self.__root = self.__new_tree(blocks, columns, idle)
+            build_span.add(blocks=len(blocks))
+
+        self.event_occurred.emit('File Load Complete')
+        return blocks
+
+    def __load_local(self, path):
+        """
+        Load a file in the current process
+
+        :param path: str. .ma full path
+        :return: list of AsciiBlock. data network
+        """
+        loader = asciiLoader.Loader()
+        loader.progress_changed.connect(self.progress_changed.emit)
+        loader.rate_changed.connect(self.rate_changed.emit)
+        loader.event_occurred.connect(self.event_occurred.emit)
+        blocks = loader.load(path)
+
+        builder = dagBuilder.Builder()
+        builder.progress_changed.connect(self.progress_changed.emit)
+        builder.event_occurred.connect(self.event_occurred.emit)
+        self.__root = builder.build(blocks)
+        return blocks
+
+    def __run(self, path, idle):
+        """
+        Run the worker process and forward its messages until it is done
+
+        :param path: str. .ma full path
+        :param idle: function or None. called while waiting
+        :return: dict. layout of the shared memory block
+        """
+        # a forked Qt application is not safe to use in the child
+        context = multiprocessing.get_context('spawn')
+        messages = context.Queue()
+        process = context.Process(target=scan, args=(path, messages))
+        process.daemon = True
+        process.start()
+
+        try:
+            while True:
+                try:
+                    message = messages.get(timeout=POLL_INTERVAL)
+                except queue.Empty:
+                    if not process.is_alive():
+                        raise RuntimeError(
+                            'Loading process exited with code {}'.format(
+                                process.exitcode))
+                    message = None
+
+                if message:
+                    kind, args = message[0], message[1:]
+                    if kind == 'progress':
+                        self.progress_changed.emit(*args)
+                    elif kind == 'rate':
+                        self.rate_changed.emit(*args)
+                    elif kind == 'event':
+                        self.event_occurred.emit(*args)
+                    elif kind == 'error':
+                        raise RuntimeError(args[0])
+                    elif kind == 'done':
+                        return args[0]
+
+                if idle:
+                    idle()
+        finally:
+            process.join(POLL_INTERVAL)
+            if process.is_alive():
+                process.terminate()
+
+    @staticmethod
+    def __new_blocks(asc, columns, pool, idle):
+        """
+        Create ascii blocks from shared columns
+
+        :param asc: Ascii. the ascii file responsible for the blocks
+        :param columns: dict. column values by name
+        :param pool: str. descriptions and tokens of the blocks
+        :param idle: function or None. called between chunks
+        :return: list of AsciiBlock.
+        """
+        blocks = list()
+        start = 0
+        rows = zip(
+            columns['index'],
+            columns['offset'],
+            columns['size'],
+            columns['kind'],
+            columns['desc_end'],
+            columns['token_end'],
+        )
+        for i, (index, offset, size, kind, desc_end, token_end) in enumerate(rows):
+            tokens = pool[desc_end:token_end].split(SEPARATOR)
+            blocks.append(KINDS[kind](
+                asc,
+                index,
+                pool[start:desc_end],
+                size,
+                tokens[0],
+                tokens[1:],
+                offset
+            ))
+            start = token_end
+            if idle and i % CHUNK == CHUNK - 1:
+                idle()
+        return blocks
+
+    @staticmethod
+    def __new_tree(blocks, columns, idle):
+        """
+        Create the Dag tree from the shared parent and upstream columns
+
+        :param blocks: list of AsciiBlock. blocks of the file
+        :param columns: dict. column values by name
+        :param idle: function or None. called between chunks
+        :return: DagNode. root dag node
+        """
+        root = dagNode.DagNode()
+        nodes = dict()
+        parents = columns['parent']
+        upstreams = columns['upstream']
+        for i, block in enumerate(blocks):
+            if not isinstance(block, asciiBlock.NodeBlock):
+                continue
+
+            node = dagNode.DagNode(
+                block.name,
+                block.typ,
+                block.size,
+                block.index,
+                upstreams[i]
+            )
+            nodes[i] = node
+            node.set_parent(nodes[parents[i]] if parents[i] >= 0 else root)
+            if idle and len(nodes) % CHUNK == 0:
+                idle()
+        return root
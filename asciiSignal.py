@@ -0,0 +1,64 @@
+"""
+Module for a minimal pure python signal, used by the loading and building
+engines to report progress without depending on Qt
+
+Example
+```python
+loader = Loader()
+loader.progress_changed.connect(lambda value: print(value))
+loader.event_occurred.connect(print)
+blocks = loader.load(mfile)
+```
+
+The interface follows the Qt signals it replaces (`connect`, `disconnect`
+and `emit`), slots are called immediately in the emitting thread. The
+viewer connects its widget updates to them directly, so they have to be
+emitted from the GUI thread, worker processes forward their signals
+through a queue instead (see 'asciiShared.py').
+"""
+
+
+class Signal(object):
+    """
+    A signal calling its connected slots in order of connection
+    """
+    def __init__(self, *types):
+        """
+        Initialization
+
+        :param types: list of type. argument types, for documentation only
+        """
+        self.__types = types
+        self.__slots = list()
+
+    @property
+    def types(self):
+        return self.__types
+
+    def connect(self, slot):
+        """
+        Connect a callable to the signal
+
+        :param slot: callable. called with the emitted arguments
+        """
+        self.__slots.append(slot)
+
+    def disconnect(self, slot=None):
+        """
+        Disconnect a callable from the signal
+
+        :param slot: callable. slot to disconnect, all slots if not given
+        """
+        if slot is None:
+            del self.__slots[:]
+        elif slot in self.__slots:
+            self.__slots.remove(slot)
+
+    def emit(self, *args):
+        """
+        Call all connected slots with the arguments
+
+        :param args: list. emitted arguments
+        """
+        for slot in self.__slots:
+            slot(*args)
@@ -0,0 +1,186 @@
+"""
+Module to spill the block index of a file to disk when loading under a
+memory budget
+
+Example
+```python
+loader = Loader()
+blocks = loader.load(r'C:/cache.ma', budget=512 * 1024 * 1024)
+print(len(blocks), blocks[0].desc)
+```
+
+`Loader.load` estimates the memory of the blocks while it scans. Past half
+of the budget, multi-line descriptions are trimmed to their first line
+followed by the ';' terminator, so their arguments are the ones of the
+first line. The offset and size of the block still cover its full
+content for `read_bytes`. Past the budget, the blocks scanned so far and all following
+ones are written to a temporary index file instead of memory, and the
+loader returns a `SpilledBlocks` sequence which maps the file and creates
+blocks on access.
+
+Extractors and the viewer read `SpilledBlocks` like a list. Mapped pages
+are backed by the file so the operating system reclaims them under
+pressure, the resident memory does not grow with the number of blocks.
+
+The budget only covers the block index. The Dag tree of `dagBuilder`, the
+`DependGraph` and the extractor results are built from the blocks and
+kept in memory as usual, they grow with the number of nodes but not with
+the size of their content.
+"""
+
+import mmap
+import tempfile
+from array import array
+
+try:
+    from collections.abc import Sequence
+except ImportError:
+    # python 2
+    from collections import Sequence
+
+
+# line index, byte offset, size, pool position, description length and
+# digest length of a block
+ROW = 6
+TYPECODE = 'q'
+# blocks buffered in memory between two writes to the index file
+FLUSH_ROWS = 4096
+
+
+def map_file(f):
+    """
+    Map a file read only
+
+    :param f: file object. file opened in binary mode
+    :return: mmap or bytes. mapped content, empty bytes for an empty file
+             which can not be mapped
+    """
+    f.flush()
+    f.seek(0, 2)
+    if not f.tell():
+        return b''
+    return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+class SpillWriter(object):
+    """
+    Writer of block records to temporary files, removed once closed
+    """
+    def __init__(self, directory=None):
+        """
+        Initialization
+
+        :param directory: str or None. directory of the temporary files,
+                          the system temporary directory if None
+        """
+        self.__rows = tempfile.TemporaryFile(dir=directory)
+        self.__pool = tempfile.TemporaryFile(dir=directory)
+        self.__buffer = array(TYPECODE)
+        self.__pool_size = 0
+        self.__count = 0
+
+    @property
+    def count(self):
+        return self.__count
+
+    @property
+    def files(self):
+        """
+        :return: tuple (file, file). index and string pool files
+        """
+        return self.__rows, self.__pool
+
+    def add(self, index, desc, size, offset, digest=None):
+        """
+        Write the record of a block, arguments follow the loader records
+
+        :param index: int. the starting line number of the block
+        :param desc: bytes. raw description of the block
+        :param size: int. the entire size in byte of the block
+        :param offset: int. the starting byte position of the block
+        :param digest: bytes or None. hash of the full block content
+        """
+        digest = digest or b''
+        self.__buffer.extend((
+            index,
+            offset,
+            size,
+            self.__pool_size,
+            len(desc),
+            len(digest)
+        ))
+        self.__pool.write(desc)
+        self.__pool.write(digest)
+        self.__pool_size += len(desc) + len(digest)
+        self.__count += 1
+
+        if len(self.__buffer) >= FLUSH_ROWS * ROW:
+            self.flush()
+
+    def flush(self):
+        """
+        Write the buffered rows to the index file
+        """
+        self.__buffer.tofile(self.__rows)
+        self.__buffer = array(TYPECODE)
+
+    def close(self):
+        self.__rows.close()
+        self.__pool.close()
+
+
+class SpilledBlocks(Sequence):
+    """
+    Read only sequence of blocks stored in memory-mapped files, blocks are
+    created each time they are accessed
+    """
+    def __init__(self, writer, factory):
+        """
+        Initialization
+
+        :param writer: SpillWriter. writer of the records, owned by the
+                       sequence from now on
+        :param factory: function. create a block from a record
+                        (index, desc, size, offset, digest)
+        """
+        writer.flush()
+        self.__writer = writer
+        self.__factory = factory
+        self.__count = writer.count
+
+        rows, pool = writer.files
+        self.__rows_map = map_file(rows)
+        self.__pool = map_file(pool)
+        self.__rows = memoryview(self.__rows_map).cast(TYPECODE)
+
+    def __len__(self):
+        return self.__count
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self[j] for j in range(*i.indices(self.__count))]
+
+        if i < 0:
+            i += self.__count
+        if not 0 <= i < self.__count:
+            raise IndexError('block index out of range')
+
+        index, offset, size, start, desc_size, digest_size = \
+            self.__rows[i * ROW:(i + 1) * ROW].tolist()
+        end = start + desc_size
+        digest = self.__pool[end:end + digest_size] if digest_size else None
+        return self.__factory(index, self.__pool[start:end], size, offset, digest)
+
+    def __iter__(self):
+        for i in range(self.__count):
+            yield self[i]
+
+    def close(self):
+        """
+        Unmap and remove the temporary files
+        """
+        self.__rows.release()
+        for mapped in (self.__rows_map, self.__pool):
+            if isinstance(mapped, mmap.mmap):
+                mapped.close()
+        self.__writer.close()
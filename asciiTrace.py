@@ -0,0 +1,290 @@
+"""
+Module for timing the phases of loading, building and displaying a file
+with named spans
+
+Scripting:
+```
+tracer = Tracer(memory=True, path=r'C:/trace.jsonl')
+with tracing(tracer):
+    blocks = Loader().load(r'C:/shot.ma')
+    root = Builder().build(blocks)
+
+for span in tracer.records:
+    print(span.name, span.label, span.seconds, span.peak_memory)
+```
+
+Instrumenting code:
+```
+with span('extract', 'Orphan') as s:
+    orphans = Orphan.from_blocks(blocks)
+    s.add(blocks=len(orphans))
+```
+
+Spans are recorded only while a tracer is installed with `tracing`,
+otherwise `span` returns a shared no-op span and costs a function call.
+Phases used across the package are 'read' (with nested 'scan' and
+'tokenize'), 'build', 'extract' and 'populate'.
+
+Peak memory is measured with tracemalloc, which slows python down, and
+cProfile statistics are captured for the outermost spans when profiling,
+both are opt-in.
+"""
+
+import contextlib
+import cProfile
+import io
+import json
+import pstats
+import time
+import tracemalloc
+from collections import namedtuple
+
+
+# functions listed in the profile summary of a span
+PROFILE_LINES = 20
+
+SpanBase = namedtuple('SpanBase',
+                      ['name',
+                       'label',
+                       'depth',
+                       'start',
+                       'seconds',
+                       'bytes',
+                       'blocks',
+                       'peak_memory',
+                       'profile']
+                      )
+
+
+class Span(SpanBase):
+    """
+    A finished span
+    """
+    __slots__ = ()
+
+    def to_json(self):
+        """
+        :return: str. span as a json line
+        """
+        return json.dumps(self._asdict())
+
+
+class ActiveSpan(object):
+    """
+    A span being measured, code inside it reports what it processed
+    """
+    def __init__(self, name, label, depth):
+        self.name = name
+        self.label = label
+        self.depth = depth
+        self.bytes = 0
+        self.blocks = 0
+        self.peak = 0
+        self.start = 0.0
+        self.profiler = None
+
+    def add(self, bytes=0, blocks=0):
+        """
+        Add to the amount of data processed in the span
+
+        :param bytes: int. bytes processed
+        :param blocks: int. blocks or items processed
+        """
+        self.bytes += bytes
+        self.blocks += blocks
+
+
+class NullSpan(object):
+    """
+    Span used when no tracer is installed
+    """
+    def add(self, bytes=0, blocks=0):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        return False
+
+
+NULL_SPAN = NullSpan()
+
+
+class Tracer(object):
+    """
+    Recorder of finished spans
+    """
+    def __init__(self, memory=False, profile=False, path=None):
+        """
+        Initialization
+
+        :param memory: bool. whether to measure peak memory with tracemalloc
+        :param profile: bool. whether to capture cProfile statistics of the
+                        outermost spans
+        :param path: str or None. .jsonl file spans are appended to as they
+                     finish
+        """
+        self.__memory = memory
+        self.__profile = profile
+        self.__path = path
+        self.__records = list()
+        self.__stack = list()
+        self.__origin = time.perf_counter()
+        self.__started_tracing = False
+
+    @property
+    def records(self):
+        return self.__records
+
+    @property
+    def memory(self):
+        return self.__memory
+
+    @property
+    def profile(self):
+        return self.__profile
+
+    def start(self):
+        """
+        Start measuring memory if needed, called by `tracing`
+        """
+        if self.__memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self.__started_tracing = True
+
+    def stop(self):
+        """
+        Stop measuring memory if this tracer started it
+        """
+        if self.__started_tracing:
+            tracemalloc.stop()
+            self.__started_tracing = False
+
+    def enter(self, name, label=''):
+        """
+        Start a span
+
+        :param name: str. phase name
+        :param label: str. what the phase is working on
+        :return: ActiveSpan.
+        """
+        active = ActiveSpan(name, label, len(self.__stack))
+        if self.__memory and tracemalloc.is_tracing():
+            # the peak of the enclosing span so far is kept before the
+            # peak is reset for this span
+            if self.__stack:
+                parent = self.__stack[-1]
+                parent.peak = max(parent.peak, tracemalloc.get_traced_memory()[1])
+            tracemalloc.reset_peak()
+        if self.__profile and not self.__stack:
+            active.profiler = cProfile.Profile()
+            active.profiler.enable()
+
+        self.__stack.append(active)
+        active.start = time.perf_counter()
+        return active
+
+    def exit(self, active):
+        """
+        Finish a span and record it
+
+        :param active: ActiveSpan. span returned by `enter`
+        :return: Span. recorded span
+        """
+        end = time.perf_counter()
+        if active.profiler:
+            active.profiler.disable()
+        self.__stack.pop()
+
+        peak = active.peak
+        if self.__memory and tracemalloc.is_tracing():
+            peak = max(peak, tracemalloc.get_traced_memory()[1])
+            if self.__stack:
+                parent = self.__stack[-1]
+                parent.peak = max(parent.peak, peak)
+
+        profile = None
+        if active.profiler:
+            stream = io.StringIO()
+            stats = pstats.Stats(active.profiler, stream=stream)
+            stats.sort_stats('cumulative').print_stats(PROFILE_LINES)
+            profile = stream.getvalue()
+
+        record = Span(
+            active.name,
+            active.label,
+            active.depth,
+            active.start - self.__origin,
+            end - active.start,
+            active.bytes,
+            active.blocks,
+            peak,
+            profile
+        )
+        self.__records.append(record)
+        if self.__path:
+            with open(self.__path, 'a') as f:
+                f.write(record.to_json() + '\n')
+        return record
+
+    def save(self, path):
+        """
+        Write all recorded spans as json lines
+
+        :param path: str. output .jsonl file path
+        """
+        with open(path, 'w') as f:
+            for record in self.__records:
+                f.write(record.to_json() + '\n')
+
+
+# tracer receiving the spans, None when tracing is off
+_tracer = None
+
+
+def get_tracer():
+    """
+    :return: Tracer or None. installed tracer
+    """
+    return _tracer
+
+
+@contextlib.contextmanager
+def tracing(tracer):
+    """
+    Install a tracer for the duration of a block
+
+    :param tracer: Tracer. tracer receiving the spans
+    """
+    global _tracer
+    previous = _tracer
+    _tracer = tracer
+    tracer.start()
+    try:
+        yield tracer
+    finally:
+        tracer.stop()
+        _tracer = previous
+
+
+@contextlib.contextmanager
+def _span(tracer, name, label):
+    active = tracer.enter(name, label)
+    try:
+        yield active
+    finally:
+        tracer.exit(active)
+
+
+def span(name, label=''):
+    """
+    Measure a block of code as a named span of the installed tracer
+
+    :param name: str. phase name (e.g. 'read')
+    :param label: str. what the phase is working on (e.g. a file name)
+    :return: context manager giving an object with an `add` method
+    """
+    if _tracer is None:
+        return NULL_SPAN
+    return _span(_tracer, name, label)
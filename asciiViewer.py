@@ -2,7 +2,9 @@
 Module for evoking the main GUI
 """
 
+import multiprocessing
 import os
+import re
 import sys
 
 from Qt import QtWidgets, QtCore, QtGui
@@ -11,15 +13,22 @@ from Qt import _loadUi
 from guiUtil.custom import smartTableWidget
 from guiUtil.template import pieChart
 
-from mayaAsciiViewer import asciiBlock, asciiLoader
+from mayaAsciiViewer import asciiBlock, asciiLoader, asciiProfiler, asciiDiff
+from mayaAsciiViewer import asciiDuplicate, asciiSearch, asciiPrecision
+from mayaAsciiViewer import asciiEstimate, asciiProgress, asciiShared
+from mayaAsciiViewer import asciiTrace
 from mayaAsciiViewer.block import audio, config, reference, requirement, info
-from mayaAsciiViewer.dag import dagBuilder, dagView, dagNode
+from mayaAsciiViewer.block import animation, geometry, referenceEdit
+from mayaAsciiViewer.block import referenceTree
+from mayaAsciiViewer.dag import dagBuilder, dagView, dagNode, dagModel
+from mayaAsciiViewer.dg import dgGraph, dgSweep
 
 
 MODULE_PATH = os.path.dirname(os.path.abspath(__file__))
 UI_PATH = os.path.join(MODULE_PATH, 'asciiViewer.ui')
 ICON_PATH = os.path.join(MODULE_PATH, 'icon.png')
 PROJECT_DIR = os.path.expandvars("%USERPROFILE%\\Desktop")
+FILE_TYPES = '*.ma *.ma.gz *.ma.zst'
 
 # color palette
 TABLEAU_NEW_10 = [
@@ -34,6 +43,21 @@ TABLEAU_NEW_10 = [
     '#76b7b2',
     '#ff9da7',
 ]
+# search hits added to the table at a time, and in total
+SEARCH_BATCH = 200
+SEARCH_LIMIT = 10000
+
+# random windows sampled for the size estimate shown before loading, and
+# added at each progress update while loading
+ESTIMATE_WINDOWS = 256
+REFINE_WINDOWS = 32
+
+# estimated memory the blocks may use when loading memory is limited
+MEMORY_BUDGET = 1024 * 1024 * 1024
+
+# significant digits of the float precision estimate
+PRECISION_DIGITS = 6
+
 PRIM_3 = [
     '#82d3e5',
     '#fd635c',
@@ -75,6 +99,12 @@ class DockChart(QtWidgets.QDockWidget):
         self.restore()
         self.__chart.clear()
 
+    def clear_slices(self):
+        """
+        Clear the slices only, keeping the widget where it is
+        """
+        self.__chart.clear()
+
     def restore(self):
         """
         Restore the widget to its default position
@@ -100,11 +130,12 @@ class DockTable(QtWidgets.QDockWidget):
     """
     Class for creating dockable table widget
     """
-    def __init__(self, cls, parent):
+    def __init__(self, cls, parent, sortable=False):
         """
         Initialization
 
         :param cls: namedtuple. data class to be presented in the table
+        :param sortable: bool. whether the table can be sorted by column
         """
         super(DockTable, self).__init__(parent)
         self.setWindowTitle(cls.__name__)
@@ -117,6 +148,7 @@ class DockTable(QtWidgets.QDockWidget):
         self.__table.setHorizontalHeaderLabels(
             [label.replace('_', ' ') for label in self.__args]
         )
+        self.__table.setSortingEnabled(sortable)
 
         self.setWidget(self.__table)
         self.dock()
@@ -152,13 +184,114 @@ class DockTable(QtWidgets.QDockWidget):
 
         :param values: list. data entries corresponding to each header
         """
-        self.__table.insertRow(self.__table.rowCount())
-        for i, arg in enumerate(self.__args):
-            self.__table.setItem(
-                self.__table.rowCount()-1,
-                i,
-                QtWidgets.QTableWidgetItem(str(values[i]))
-            )
+        self.add_entries([values])
+
+    def add_entries(self, entries):
+        """
+        Add many entries to the table, sorting is suspended while adding
+
+        :param entries: list of list. data entries of each row
+        """
+        sortable = self.__table.isSortingEnabled()
+        self.__table.setSortingEnabled(False)
+
+        with asciiTrace.span('populate', self.windowTitle()) as span:
+            for values in entries:
+                self.__table.insertRow(self.__table.rowCount())
+                for i, arg in enumerate(self.__args):
+                    item = QtWidgets.QTableWidgetItem()
+                    # numbers are stored as is to be sorted by value
+                    if isinstance(values[i], (int, float)) and \
+                            not isinstance(values[i], bool):
+                        item.setData(QtCore.Qt.DisplayRole, values[i])
+                    else:
+                        item.setText(str(values[i]))
+                    self.__table.setItem(self.__table.rowCount()-1, i, item)
+                span.add(blocks=1)
+
+        self.__table.setSortingEnabled(sortable)
+
+
+class DockSearch(DockTable):
+    """
+    Class for creating dockable search widget, a search field above a
+    table of search hits
+    """
+    def __init__(self, parent):
+        """
+        Initialization
+        """
+        super(DockSearch, self).__init__(asciiSearch.Hit, parent, sortable=True)
+        self.setWindowTitle('Search')
+
+        self.__table = self.widget()
+        self.ui_search_edit = QtWidgets.QLineEdit()
+        self.ui_search_edit.setPlaceholderText('Regular expression')
+
+        widget = QtWidgets.QWidget()
+        layout = QtWidgets.QVBoxLayout()
+        layout.setContentsMargins(0, 0, 0, 0)
+        layout.addWidget(self.ui_search_edit)
+        layout.addWidget(self.__table)
+        widget.setLayout(layout)
+        self.setWidget(widget)
+
+    def clear_hits(self):
+        """
+        Clear the search hits without moving the widget
+        """
+        self.__table.setRowCount(0)
+
+
+class DockTree(QtWidgets.QDockWidget):
+    """
+    Class for creating dockable dag tree widget
+    """
+    def __init__(self, parent):
+        """
+        Initialization
+        """
+        super(DockTree, self).__init__(parent)
+        self.__parent = parent
+
+        self.__tree = dagView.DagWidget()
+        self.setWidget(self.__tree)
+
+        self.dock()
+
+    def dock(self, position=QtCore.Qt.BottomDockWidgetArea):
+        """
+        Dock the current widget to parent
+
+        :param position: Qt.DockWidgetArea. target dock position
+        """
+        self.__parent.addDockWidget(position, self)
+
+    def clear(self):
+        """
+        Clear all existing data in the widget
+        """
+        self.restore()
+        self.__tree.clear()
+
+    def restore(self):
+        """
+        Restore the widget to its default position
+        """
+        if self.isFloating():
+            self.setFloating(False)
+        if not self.isVisible():
+            self.setVisible(True)
+        self.dock()
+
+    def set_root(self, node):
+        """
+        Display a dag node tree in the widget
+
+        :param node: DagNode. the invisible root node of the tree
+        """
+        self.__tree.set_root(node)
+        self.__tree.update()
 
 
 class AsciiViewer(QtWidgets.QMainWindow):
@@ -174,6 +307,12 @@ class AsciiViewer(QtWidgets.QMainWindow):
         self.resize(1500, 800)
 
         self.__blocks = None
+        self.__path = None
+        self.__root = None
+        self.__graph = None
+        self.__sampler = None
+        # update functions of docks computed once they are shown
+        self.__deferred = dict()
 
         self.ui_dag_widget = dagView.DagWidget()
         self.setCentralWidget(self.ui_dag_widget)
@@ -189,6 +328,39 @@ class AsciiViewer(QtWidgets.QMainWindow):
         self.ui_config_table = DockTable(config.Config, self)
         self.ui_ref_table = DockTable(reference.Reference, self)
         self.ui_audio_table = DockTable(audio.Audio, self)
+        self.ui_edit_table = DockTable(
+            referenceEdit.ReferenceEdit, self, sortable=True)
+        self.ui_edit_ns_table = DockTable(
+            referenceEdit.EditNamespace, self, sortable=True)
+        self.ui_orphan_table = DockTable(dgSweep.Orphan, self, sortable=True)
+        self.ui_duplicate_table = DockTable(
+            asciiDuplicate.Duplicate, self, sortable=True)
+        self.ui_anim_table = DockTable(
+            animation.AnimCurve, self, sortable=True)
+        self.ui_geo_table = DockTable(geometry.Geometry, self, sortable=True)
+        self.ui_profile_table = DockTable(
+            asciiProfiler.AttrProfile, self, sortable=True)
+        self.ui_heavy_table = DockTable(
+            asciiProfiler.HeavyAttr, self, sortable=True)
+        self.ui_precision_table = DockTable(
+            asciiPrecision.NumericProfile, self, sortable=True)
+        self.ui_ref_tree = DockTree(self)
+        self.ui_ref_tree.setWindowTitle('Reference tree')
+        self.ui_diff_table = DockTable(asciiDiff.BlockDiff, self, sortable=True)
+        self.ui_search_table = DockSearch(self)
+        self.ui_perf_table = DockTable(asciiTrace.Span, self, sortable=True)
+        self.ui_perf_table.setWindowTitle('Performance')
+
+        # numeric analyses read every block, they are stacked as tabs and
+        # only computed once their tab is shown
+        self.ui_lazy_tables = [
+            self.ui_profile_table,
+            self.ui_heavy_table,
+            self.ui_precision_table,
+        ]
+        for dock in self.ui_lazy_tables:
+            dock.visibilityChanged.connect(
+                lambda visible, dock=dock: self.__run_deferred(dock, visible))
 
         # store the order
         self.ui_dockables = [
@@ -199,6 +371,19 @@ class AsciiViewer(QtWidgets.QMainWindow):
             self.ui_config_table,
             self.ui_ref_table,
             self.ui_audio_table,
+            self.ui_edit_table,
+            self.ui_edit_ns_table,
+            self.ui_orphan_table,
+            self.ui_duplicate_table,
+            self.ui_anim_table,
+            self.ui_geo_table,
+            self.ui_profile_table,
+            self.ui_heavy_table,
+            self.ui_precision_table,
+            self.ui_ref_tree,
+            self.ui_diff_table,
+            self.ui_search_table,
+            self.ui_perf_table,
         ]
 
         self.ui_progress = QtWidgets.QProgressBar()
@@ -207,6 +392,9 @@ class AsciiViewer(QtWidgets.QMainWindow):
 
         # connect signals
         self.ui_open_action.triggered.connect(self.load)
+        self.ui_ref_tree_action.triggered.connect(self.load_reference_tree)
+        self.ui_compare_action.triggered.connect(self.compare)
+        self.ui_search_table.ui_search_edit.returnPressed.connect(self.search)
         self.ui_clear_action.triggered.connect(self.clear)
         self.ui_reset_action.triggered.connect(self.restore)
 
@@ -217,7 +405,9 @@ class AsciiViewer(QtWidgets.QMainWindow):
         # order matters for docking position
         for widget in self.ui_dockables:
             widget.clear()
+        self.__tabify()
 
+        self.__deferred.clear()
         self.ui_dag_widget.clear()
 
     def restore(self):
@@ -227,6 +417,16 @@ class AsciiViewer(QtWidgets.QMainWindow):
         # order matters for docking position
         for widget in self.ui_dockables:
             widget.restore()
+        self.__tabify()
+
+    def __tabify(self):
+        """
+        Stack the numeric analysis docks as tabs, the first one is raised
+        """
+        first = self.ui_lazy_tables[0]
+        for dock in self.ui_lazy_tables[1:]:
+            self.tabifyDockWidget(first, dock)
+        first.raise_()
 
     def load(self):
         """
@@ -235,8 +435,81 @@ class AsciiViewer(QtWidgets.QMainWindow):
         """
         from guiUtil import prompt
 
-        mfile = prompt.get_path_import(default_path=PROJECT_DIR, typ='*.ma')
+        mfile = prompt.get_path_import(default_path=PROJECT_DIR, typ=FILE_TYPES)
+
+        if not mfile:
+            return
+
+        if not os.path.exists(mfile):
+            prompt.message("File not found \n{}".format(mfile), prompt.ERROR)
+            return
+
+        self.load_file(mfile)
+
+    def load_file(self, mfile):
+        """
+        Load a maya ascii file without prompting, populates all widgets with
+        file data.
+
+        :param mfile: str. file path to a maya ascii file
+        """
+        tracer = asciiTrace.Tracer(
+            memory=self.ui_trace_memory_action.isChecked(),
+            profile=self.ui_profile_action.isChecked()
+        )
+        with asciiTrace.tracing(tracer):
+            self.__show_estimate(mfile)
+            try:
+                self.__get_blocks(mfile)
+            finally:
+                if self.__sampler:
+                    self.__sampler.close()
+                    self.__sampler = None
+
+            self.clear()
+            self.update()
+
+        self.ui_perf_table.add_entries(tracer.records)
+        self.ui_perf_table.setWindowTitle('Performance ({:.3f}s)'.format(
+            sum(r.seconds for r in tracer.records if not r.depth)))
+
+    def load_reference_tree(self):
+        """
+        Load the nested references of the current file and display them
+        with their file sizes
+        """
+        if not self.__path:
+            return
+
+        update_message(self.statusBar(), 'Loading Reference Tree')
+        refs = referenceTree.ReferenceFile.from_path(self.__path)
+
+        root = dagNode.DagNode()
+        nodes = list()
+        for ref in refs:
+            node = dagNode.DagNode(
+                ref.namespace or os.path.basename(ref.path),
+                os.path.basename(ref.path),
+                ref.size
+            )
+            node.set_parent(nodes[ref.parent] if ref.parent >= 0 else root)
+            nodes.append(node)
+
+        self.ui_ref_tree.clear()
+        self.ui_ref_tree.set_root(root)
+        update_message(self.statusBar(), 'Reference Tree Complete')
+
+    def compare(self):
+        """
+        Compare the current file with another version of it, the dag view
+        is colored by the size delta of each node
+        """
+        from guiUtil import prompt
+
+        if not self.__path:
+            return
 
+        mfile = prompt.get_path_import(default_path=PROJECT_DIR, typ=FILE_TYPES)
         if not mfile:
             return
 
@@ -244,10 +517,61 @@ class AsciiViewer(QtWidgets.QMainWindow):
             prompt.message("File not found \n{}".format(mfile), prompt.ERROR)
             return
 
-        self.__get_blocks(mfile)
+        loader = asciiLoader.Loader()
+        loader.progress_changed.connect(lambda value: update_progress(self.ui_progress, value))
+        loader.rate_changed.connect(lambda rate, eta: update_rate(self.statusBar(), 'Reading File', rate, eta))
+        loader.event_occurred.connect(lambda msg: update_message(self.statusBar(), msg))
+        diffs = asciiDiff.diff_files(mfile, self.__path, loader)
+
+        deltas = asciiDiff.get_deltas(diffs)
+        for node in dagNode.get_children(self.__root):
+            node.set_delta(deltas.get(node.index))
+        self.ui_dag_widget.set_root(self.__root)
+        self.ui_dag_widget.update()
+
+        self.ui_diff_table.clear()
+        self.ui_diff_table.add_entries(diffs)
+        self.ui_diff_table.setWindowTitle('BlockDiff ({:+d} bytes)'.format(
+            sum(d.delta for d in diffs)))
+
+    def search(self):
+        """
+        Search the current file with the pattern of the search field, hits
+        are listed as they are found and their dag nodes are selected
+        """
+        pattern = self.ui_search_table.ui_search_edit.text()
+        if not pattern or not self.__blocks:
+            return
+
+        self.ui_search_table.clear_hits()
+        update_message(self.statusBar(), 'Searching')
+
+        progress = asciiProgress.Progress(self.__blocks[0].asc.size)
+        progress.progress_changed.connect(lambda value: update_progress(self.ui_progress, value))
+        next_report = progress.start()
+
+        hits = asciiSearch.iter_hits(self.__blocks, pattern, limit=SEARCH_LIMIT)
+        entries = list()
+        indices = set()
+        count = 0
+        try:
+            for hit in hits:
+                entries.append(hit)
+                indices.add(hit.line)
+                count += 1
+                if len(entries) >= SEARCH_BATCH:
+                    self.ui_search_table.add_entries(entries)
+                    entries = list()
+                if hit.offset >= next_report:
+                    next_report = progress.update(hit.offset)
+        except re.error as e:
+            update_message(self.statusBar(), 'Invalid pattern: {}'.format(e))
+            return
 
-        self.clear()
-        self.update()
+        self.ui_search_table.add_entries(entries)
+        progress.finish()
+        self.ui_dag_widget.select_nodes(indices)
+        update_message(self.statusBar(), 'Search Complete: {} hits'.format(count))
 
     def update(self):
         """
@@ -263,23 +587,117 @@ class AsciiViewer(QtWidgets.QMainWindow):
 
         :param mfile: str. file path to a maya ascii file
         """
-        loader = asciiLoader.Loader()
+        self.__path = mfile
+        # the memory budget is only followed when loading in this process
+        budget = MEMORY_BUDGET if self.ui_budget_action.isChecked() else None
+        if self.ui_process_action.isChecked() and not budget:
+            loader = asciiShared.SharedLoader()
+        else:
+            loader = asciiLoader.Loader()
         loader.progress_changed.connect(lambda value: update_progress(self.ui_progress, value))
+        loader.rate_changed.connect(lambda rate, eta: update_rate(self.statusBar(), 'Reading File', rate, eta))
         loader.event_occurred.connect(lambda msg: update_message(self.statusBar(), msg))
-        self.__blocks = loader.load(mfile)
+        loader.progress_changed.connect(lambda value: self.__refine_estimate())
+
+        if isinstance(loader, asciiShared.SharedLoader):
+            self.__blocks = loader.load(
+                mfile, idle=QtCore.QCoreApplication.processEvents)
+            self.__root = loader.root
+        else:
+            self.__blocks = loader.load(mfile, budget=budget)
+            self.__root = None
+        self.__graph = None
+
+    def __get_graph(self):
+        """
+        Get the DG network of the current blocks, built once and shared by
+        the Dag builder and the orphan sweep
+
+        :return: dgGraph.DependGraph.
+        """
+        if self.__graph is None:
+            with asciiTrace.span('extract', 'DependGraph'):
+                self.__graph = dgGraph.DependGraph(self.__blocks)
+        return self.__graph
+
+    def __show_estimate(self, mfile):
+        """
+        Show the size and Dag type charts estimated from random samples of
+        a file, before it is loaded
+
+        :param mfile: str. file path to a maya ascii file
+        """
+        self.ui_size_chart.clear()
+        self.ui_type_chart.clear()
+        try:
+            with asciiTrace.span('estimate', os.path.basename(mfile)):
+                sampler = asciiEstimate.Sampler(mfile)
+                sampler.sample(ESTIMATE_WINDOWS)
+        except ValueError:
+            # compressed files can not be sampled
+            return
+
+        self.__sampler = sampler
+        self.__draw_estimate()
+
+    def __refine_estimate(self):
+        """
+        Sample more windows while the file loads and redraw the estimate
+        """
+        if not self.__sampler:
+            return
+
+        self.__sampler.sample(REFINE_WINDOWS)
+        self.__draw_estimate()
+
+    def __draw_estimate(self):
+        """
+        Draw the current estimate in the size and Dag type charts
+        """
+        sampler = self.__sampler
+        title = '({} estimate from {} samples)'.format(
+            dagModel.format_size(sampler.size), sampler.windows)
+
+        self.ui_size_chart.clear_slices()
+        for i, estimate in enumerate(sampler.get_distribution()):
+            self.ui_size_chart.add_slice(
+                format_estimate(estimate), estimate.size, PRIM_3[i])
+        self.ui_size_chart.setWindowTitle('Size distribution chart ' + title)
+
+        self.ui_type_chart.clear_slices()
+        for i, estimate in enumerate(sampler.get_type_distribution(top=10)):
+            self.ui_type_chart.add_slice(
+                format_estimate(estimate), estimate.size, TABLEAU_NEW_10[i])
+        self.ui_type_chart.setWindowTitle(
+            'Dag type distribution chart ' + title)
+        QtCore.QCoreApplication.processEvents()
 
     def __update_dag_view(self):
         """
         Update the Dag view and the Dag type chart
         to reflect the latest ascii blocks data
         """
-        buider = dagBuilder.Builder()
-        buider.progress_changed.connect(lambda value: update_progress(self.ui_progress, value))
-        buider.event_occurred.connect(lambda msg: update_message(self.statusBar(), msg))
-        root = buider.build(self.__blocks)
+        # files loaded in a separate process come with their Dag tree
+        root = self.__root
+        if root is None:
+            buider = dagBuilder.Builder()
+            buider.progress_changed.connect(lambda value: update_progress(self.ui_progress, value))
+            buider.rate_changed.connect(lambda rate, eta: update_rate(self.statusBar(), 'Building DAG Tree', rate, eta, 'nodes'))
+            buider.event_occurred.connect(lambda msg: update_message(self.statusBar(), msg))
+            root = buider.build(self.__blocks, self.__get_graph())
+            self.__root = root
 
         children = dagNode.get_children(root)
+        with asciiTrace.span('extract', 'Geometry'):
+            geometries = geometry.get_geometry(self.__blocks)
+        for node in children:
+            if node.index in geometries:
+                geo = geometries[node.index]
+                node.set_geometry(geo.vertices, geo.faces)
+        self.ui_geo_table.add_entries(geometries.values())
+
         results = dagNode.get_distribution(children, top=10)
+        self.ui_type_chart.setWindowTitle('Dag type distribution chart')
         for i in range(len(results)):
             self.ui_type_chart.add_slice(
                 results[i][0],
@@ -287,8 +705,10 @@ class AsciiViewer(QtWidgets.QMainWindow):
                 TABLEAU_NEW_10[i]
             )
 
-        self.ui_dag_widget.set_root(root)
-        self.ui_dag_widget.update()
+        with asciiTrace.span('populate', 'Dag view') as span:
+            self.ui_dag_widget.set_root(root)
+            self.ui_dag_widget.update()
+            span.add(blocks=len(children))
 
     def __update_size_chart(self):
         """
@@ -296,6 +716,7 @@ class AsciiViewer(QtWidgets.QMainWindow):
         """
         # simple chart
         results = asciiBlock.get_distribution(self.__blocks)
+        self.ui_size_chart.setWindowTitle('Size distribution chart')
         for i in range(len(results)):
             self.ui_size_chart.add_slice(
                 results[i][0],
@@ -307,25 +728,117 @@ class AsciiViewer(QtWidgets.QMainWindow):
         """
         Update the tables to reflect the latest ascii blocks data
         """
-        infos = info.Info.from_blocks(self.__blocks)
+        with asciiTrace.span('extract', 'Info'):
+            infos = info.Info.from_blocks(self.__blocks)
         for entry in infos:
             self.ui_info_table.add_entry(entry)
 
-        reqs = requirement.Requirement.from_blocks(self.__blocks)
+        with asciiTrace.span('extract', 'Requirement'):
+            reqs = requirement.Requirement.from_blocks(self.__blocks)
         for entry in reqs:
             self.ui_req_table.add_entry(entry)
 
-        conf = config.Config.from_blocks(self.__blocks)
+        with asciiTrace.span('extract', 'Config'):
+            conf = config.Config.from_blocks(self.__blocks)
         self.ui_config_table.add_entry(conf)
 
-        refs = reference.Reference.from_blocks(self.__blocks)
+        with asciiTrace.span('extract', 'Reference'):
+            refs = reference.Reference.from_blocks(self.__blocks)
         for entry in refs:
             self.ui_ref_table.add_entry(entry)
 
-        audios = audio.Audio.from_blocks(self.__blocks)
+        with asciiTrace.span('extract', 'Audio'):
+            audios = audio.Audio.from_blocks(self.__blocks)
         for entry in audios:
             self.ui_audio_table.add_entry(entry)
 
+        # reference edits are read once for both tables
+        with asciiTrace.span('extract', 'ReferenceEdit'):
+            edits = referenceEdit.get_edits(self.__blocks)
+            ref_edits = referenceEdit.ReferenceEdit.from_blocks(
+                self.__blocks, edits)
+        self.ui_edit_table.add_entries(ref_edits)
+        with asciiTrace.span('extract', 'EditNamespace'):
+            ns_edits = referenceEdit.EditNamespace.from_blocks(
+                self.__blocks, edits)
+        self.ui_edit_ns_table.add_entries(ns_edits)
+
+        graph = self.__get_graph()
+        with asciiTrace.span('extract', 'Orphan'):
+            orphans = dgSweep.Orphan.from_blocks(self.__blocks, graph)
+        self.ui_orphan_table.add_entries(orphans)
+        self.ui_orphan_table.setWindowTitle('Orphan ({} reclaimable)'.format(
+            dagModel.format_size(dgSweep.get_savings(orphans))))
+
+        with asciiTrace.span('extract', 'Duplicate'):
+            duplicates = asciiDuplicate.Duplicate.from_blocks(self.__blocks)
+        self.ui_duplicate_table.add_entries(duplicates)
+        self.ui_duplicate_table.setWindowTitle(
+            'Duplicate ({} reclaimable)'.format(dagModel.format_size(
+                asciiDuplicate.get_savings(duplicates))))
+
+        with asciiTrace.span('extract', 'AnimCurve'):
+            curves = animation.AnimCurve.from_blocks(self.__blocks)
+        self.ui_anim_table.add_entries(curves)
+
+        self.__defer(
+            self.__update_profile, self.ui_profile_table, self.ui_heavy_table)
+        self.__defer(self.__update_precision, self.ui_precision_table)
+
+    def __defer(self, func, *docks):
+        """
+        Run an update function once any of its docks is shown, right away
+        if one is visible already
+
+        :param func: function. update of the docks
+        :param docks: DockTable. docks filled by the function
+        """
+        for dock in docks:
+            self.__deferred[dock] = func
+        for dock in docks:
+            # docks behind another tab are visible with an empty region
+            if dock.isVisible() and not dock.visibleRegion().isEmpty():
+                self.__run_deferred(dock, True)
+                break
+
+    def __run_deferred(self, dock, visible):
+        """
+        Run the pending update function of a dock being shown
+
+        :param dock: DockTable. dock whose visibility changed
+        :param visible: bool. whether the dock is shown
+        """
+        func = self.__deferred.get(dock)
+        if not visible or func is None or not self.__blocks:
+            return
+
+        for other in [d for d, f in self.__deferred.items() if f == func]:
+            del self.__deferred[other]
+        func()
+
+    def __update_profile(self):
+        """
+        Update the attribute profile and heaviest attribute tables
+        """
+        with asciiTrace.span('extract', 'AttrProfile'):
+            profiles, heavies = asciiProfiler.get_profile(self.__blocks)
+        self.ui_profile_table.add_entries(profiles)
+        self.ui_heavy_table.add_entries(heavies)
+
+    def __update_precision(self):
+        """
+        Update the numeric profile table
+        """
+        with asciiTrace.span('extract', 'NumericProfile'):
+            numerics = asciiPrecision.get_precision(
+                self.__blocks, PRECISION_DIGITS)
+        self.ui_precision_table.add_entries(numerics)
+        self.ui_precision_table.setWindowTitle(
+            'NumericProfile ({} with {} digits)'.format(
+                dagModel.format_size(
+                    asciiPrecision.get_estimate(self.__blocks, numerics)),
+                PRECISION_DIGITS))
+
 
 def update_progress(progress_bar, value):
     """
@@ -354,6 +867,35 @@ def update_message(status_bar, msg):
     QtCore.QCoreApplication.processEvents()
 
 
+def format_estimate(estimate):
+    """
+    Format the name of an estimate with its confidence interval
+
+    :param estimate: asciiEstimate.Estimate.
+    :return: str. (e.g. 'mesh ±1.2MB')
+    """
+    return u'{} \u00b1{}'.format(
+        estimate.name,
+        dagModel.format_size((estimate.high - estimate.low) / 2.0))
+
+
+def update_rate(status_bar, task, rate, eta, unit=None):
+    """
+    Display the throughput and time left of a task in status bar widget
+
+    :param status_bar: QtWidget.QStatusBar. status bar to update
+    :param task: str. task description
+    :param rate: float. work done per second
+    :param eta: float. seconds left
+    :param unit: str or None. unit of work, None for bytes
+    """
+    if unit:
+        rate = '{:.0f} {}'.format(rate, unit)
+    else:
+        rate = dagModel.format_size(rate)
+    update_message(status_bar, '{}: {}/s, {:.1f}s left'.format(task, rate, eta))
+
+
 def show():
     """
     Launch the main application with custom icon and style sheet
@@ -362,8 +904,14 @@ def show():
 
     global window
 
-    app_id = 'xingyulei.asciiviewer.1-0-0'
-    ctypes.windll.shell32.SetCurrentProcessExplicitAppUserModelID(app_id)
+    # the shared loader and the reference tree start worker processes,
+    # a frozen executable has to run them instead of the viewer
+    multiprocessing.freeze_support()
+
+    # taskbar icon grouping, windows only
+    if hasattr(ctypes, 'windll'):
+        app_id = 'xingyulei.asciiviewer.1-0-0'
+        ctypes.windll.shell32.SetCurrentProcessExplicitAppUserModelID(app_id)
 
     app = QtWidgets.QApplication(sys.argv)
     app.setWindowIcon(QtGui.QIcon(ICON_PATH))
@@ -384,4 +932,5 @@ def show():
 
 
 if __name__ == '__main__':
+    multiprocessing.freeze_support()
     show()
@@ -0,0 +1,16 @@
+"""
+This package is used for measuring the performance of the loading, parsing
+and building engines, it is not needed by the viewer.
+
+Benchmarks run against synthetic maya ascii scenes written by
+'sceneGenerator.py', the same spec and seed always produce the same file so
+results of different runs and machines are comparable:
+
+python -m mayaAsciiViewer.bench.sceneGenerator bench.ma --size 100
+python -m mayaAsciiViewer.bench.benchCore bench.ma --output before.json
+python -m mayaAsciiViewer.bench.benchGui bench.ma --output gui_before.json
+
+Results are stored as json, two result files are compared with:
+
+python -m mayaAsciiViewer.bench.benchCore --compare before.json after.json
+"""
@@ -0,0 +1,316 @@
+"""
+Module for benchmarking the hot paths of loading, parsing and building
+
+Scripting:
+```
+results = run(r'C:/bench.ma', repeat=3)
+save(results, r'C:/before.json')
+```
+
+Command line:
+```
+python -m mayaAsciiViewer.bench.benchCore bench.ma --output after.json
+python -m mayaAsciiViewer.bench.benchCore --compare before.json after.json
+```
+
+Each benchmark is timed on its own, the best of a few repeats is kept. Peak
+memory is measured in a separate run with tracemalloc, which slows python
+down, so tracing never affects the timings.
+"""
+
+import argparse
+import gc
+import json
+import os
+import platform
+import sys
+import time
+import tracemalloc
+from collections import namedtuple
+
+from .. import asciiAttr, asciiBlock, asciiLoader, asciiPrecision, asciiProfiler
+from ..block import animation, geometry, referenceEdit
+from ..dag import dagBuilder
+from ..dg import dgGraph
+
+
+# node blocks read by the read_detail benchmark, spread over the file,
+# read_detail scans the file up to the block so each call is costly
+DETAIL_SAMPLE = 50
+
+ResultBase = namedtuple('ResultBase',
+                        ['name',
+                         'seconds',
+                         'size',
+                         'count',
+                         'mb_per_s',
+                         'blocks_per_s',
+                         'peak_memory']
+                        )
+
+
+def bench_load(path):
+    blocks = asciiLoader.Loader().load(path)
+    return os.path.getsize(path), len(blocks)
+
+
+def bench_load_digest(path):
+    blocks = asciiLoader.Loader().load(path, digest=True)
+    return os.path.getsize(path), len(blocks)
+
+
+def bench_tokenize(blocks):
+    for block in blocks:
+        asciiLoader.tokenize_command(block.desc)
+    return sum(len(block.desc) for block in blocks), len(blocks)
+
+
+def bench_build(blocks):
+    dagBuilder.Builder().build(blocks)
+    nodes = [b for b in blocks if isinstance(b, asciiBlock.NodeBlock)]
+    return sum(block.size for block in nodes), len(nodes)
+
+
+def bench_read_detail(blocks):
+    nodes = [b for b in blocks if isinstance(b, asciiBlock.NodeBlock)]
+    step = max(1, len(nodes) // DETAIL_SAMPLE)
+    size = 0
+    count = 0
+    for block in nodes[::step]:
+        size += len(block.asc.read_detail(block.index))
+        count += 1
+    return size, count
+
+
+def bench_iter_bytes(blocks):
+    blocks = [b for b in blocks if b.offset >= 0]
+    size = 0
+    count = 0
+    if blocks:
+        for _, detail in blocks[0].asc.iter_bytes(blocks):
+            size += len(detail)
+            count += 1
+    return size, count
+
+
+def bench_arrays(blocks):
+    nodes = [
+        b for b in blocks
+        if isinstance(b, asciiBlock.NodeBlock) and b.offset >= 0
+    ]
+    size = 0
+    count = 0
+    if nodes:
+        for _, detail in nodes[0].asc.iter_bytes(nodes):
+            size += len(detail)
+            count += len(asciiAttr.get_arrays(detail))
+    return size, count
+
+
+def bench_profile(blocks):
+    profiles = asciiProfiler.AttrProfile.from_blocks(blocks)
+    return sum(block.size for block in blocks), len(profiles)
+
+
+def bench_precision(blocks):
+    profiles = asciiPrecision.NumericProfile.from_blocks(blocks)
+    return sum(block.size for block in blocks), len(profiles)
+
+
+def bench_geometry(blocks):
+    geometries = geometry.Geometry.from_blocks(blocks)
+    return sum(block.size for block in blocks), len(geometries)
+
+
+def bench_animation(blocks):
+    curves = animation.AnimCurve.from_blocks(blocks)
+    return sum(block.size for block in blocks), len(curves)
+
+
+def bench_reference_edits(blocks):
+    edits = referenceEdit.ReferenceEdit.from_blocks(blocks)
+    return sum(block.size for block in blocks), len(edits)
+
+
+def bench_upstream(blocks):
+    sizes = dgGraph.DependGraph(blocks).get_upstream_sizes()
+    return sum(block.size for block in blocks), len(sizes)
+
+
+# benchmarks and whether they run on the path or on the loaded blocks
+BENCHMARKS = [
+    ('load', bench_load, False),
+    ('load_digest', bench_load_digest, False),
+    ('tokenize_command', bench_tokenize, True),
+    ('build', bench_build, True),
+    ('read_detail', bench_read_detail, True),
+    ('iter_bytes', bench_iter_bytes, True),
+    ('arrays', bench_arrays, True),
+    ('profile', bench_profile, True),
+    ('precision', bench_precision, True),
+    ('geometry', bench_geometry, True),
+    ('animation', bench_animation, True),
+    ('reference_edits', bench_reference_edits, True),
+    ('upstream', bench_upstream, True),
+]
+
+
+class Result(ResultBase):
+    @classmethod
+    def from_run(cls, name, seconds, size, count, peak_memory):
+        """
+        Create a benchmark result with its throughput
+
+        :param name: str. benchmark name
+        :param seconds: float. best duration
+        :param size: int. bytes processed
+        :param count: int. blocks processed
+        :param peak_memory: int. peak memory allocated in bytes
+        :return: Result.
+        """
+        seconds = max(seconds, 1e-9)
+        return cls(
+            name,
+            seconds,
+            size,
+            count,
+            size / seconds / (1024 * 1024),
+            count / seconds,
+            peak_memory
+        )
+
+
+def measure(func, arg, repeat):
+    """
+    Time a benchmark and measure its peak memory
+
+    :param func: function. benchmark returning (size, count) processed
+    :param arg: str or list of AsciiBlock. benchmark argument
+    :param repeat: int. number of timed runs
+    :return: tuple (float, int, int, int). best duration in seconds,
+             bytes and blocks processed, peak memory in bytes
+    """
+    best = None
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        size, count = func(arg)
+        duration = time.perf_counter() - start
+        best = duration if best is None else min(best, duration)
+
+    gc.collect()
+    tracemalloc.start()
+    try:
+        func(arg)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return best, size, count, peak
+
+
+def run(path, repeat=3, names=None):
+    """
+    Run the benchmarks against a scene
+
+    :param path: str. maya ascii file path
+    :param repeat: int. number of timed runs of each benchmark
+    :param names: list of str or None. benchmarks to run, all if None
+    :return: dict. json serializable results with the run environment
+    """
+    blocks = asciiLoader.Loader().load(path)
+    results = list()
+    for name, func, on_blocks in BENCHMARKS:
+        if names and name not in names:
+            continue
+        try:
+            seconds, size, count, peak = measure(
+                func, blocks if on_blocks else path, repeat)
+        except Exception as e:
+            print('{}: failed, {}'.format(name, e))
+            continue
+        result = Result.from_run(name, seconds, size, count, peak)
+        print('{:<18} {:>9.3f}s {:>9.1f} MB/s {:>12.0f} blocks/s {:>9.1f} MB'
+              .format(name, result.seconds, result.mb_per_s,
+                      result.blocks_per_s, peak / (1024.0 * 1024)))
+        results.append(result._asdict())
+
+    return {
+        'scene': os.path.abspath(path),
+        'size': os.path.getsize(path),
+        'blocks': len(blocks),
+        'python': sys.version.split()[0],
+        'platform': platform.platform(),
+        'time': time.strftime('%Y-%m-%d %H:%M:%S'),
+        'results': results,
+    }
+
+
+def save(results, path):
+    """
+    :param results: dict. results from run()
+    :param path: str. output .json file path
+    """
+    with open(path, 'w') as f:
+        json.dump(results, f, indent=2)
+
+
+def compare(old, new):
+    """
+    Print the speed and memory ratios of two result files
+
+    :param old: str. baseline .json file path
+    :param new: str. .json file path to compare with the baseline
+    """
+    with open(old) as f:
+        old_results = dict((r['name'], r) for r in json.load(f)['results'])
+    with open(new) as f:
+        new_results = json.load(f)['results']
+
+    print('{:<18} {:>10} {:>10} {:>8} {:>8}'.format(
+        'benchmark', 'old s', 'new s', 'speed', 'memory'))
+    for result in new_results:
+        base = old_results.get(result['name'])
+        if not base:
+            continue
+        print('{:<18} {:>10.3f} {:>10.3f} {:>7.2f}x {:>7.2f}x'.format(
+            result['name'],
+            base['seconds'],
+            result['seconds'],
+            base['seconds'] / result['seconds'] if result['seconds'] else 0,
+            result['peak_memory'] / float(max(base['peak_memory'], 1))
+        ))
+
+
+def main(argv=None):
+    """
+    Command line entry, run the benchmarks or compare two runs
+
+    :param argv: list of str. command line arguments
+    """
+    parser = argparse.ArgumentParser(
+        description='Benchmark loading, parsing and building')
+    parser.add_argument('path', nargs='?',
+                        help='.ma scene, see sceneGenerator.py')
+    parser.add_argument('--output', help='.json file to store results')
+    parser.add_argument('--repeat', type=int, default=3,
+                        help='timed runs of each benchmark')
+    parser.add_argument('--only', action='append', default=[],
+                        choices=[name for name, _, _ in BENCHMARKS],
+                        help='benchmark to run, can be repeated')
+    parser.add_argument('--compare', nargs=2, metavar=('OLD', 'NEW'),
+                        help='compare two result files')
+    args = parser.parse_args(argv)
+
+    if args.compare:
+        compare(*args.compare)
+        return
+    if not args.path:
+        parser.error('a scene path is required')
+
+    results = run(args.path, args.repeat, args.only)
+    if args.output:
+        save(results, args.output)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,275 @@
+"""
+Module for benchmarking the responsiveness of the viewer and the Dag view,
+run offscreen so it works on machines without a display
+
+Command line:
+```
+python -m mayaAsciiViewer.bench.sceneGenerator bench.ma --transforms 20000
+python -m mayaAsciiViewer.bench.benchGui bench.ma --output gui.json
+python -m mayaAsciiViewer.bench.benchCore --compare gui_before.json gui.json
+```
+
+Measured steps:
+- open: loading the file into the viewer, with every dock populated
+- first_paint: showing the viewer until the Dag view is painted
+- set_root: setting a Dag tree on a standalone Dag widget
+- expand_all: expanding every node of the Dag view
+- sort_<column>: sorting the Dag view by each column
+- filter_keystroke: average and worst latency of typing in the filter box
+- memory_per_row: resident memory grown per Dag row, from setting the
+  tree to expanding it
+
+Each step runs the Qt event loop until pending events are processed, so
+the timings include painting and persistent editor creation. Memory is the
+growth of the process resident size, which includes Qt allocations that
+tracemalloc can not see.
+"""
+
+import argparse
+import gc
+import os
+import sys
+import time
+from collections import namedtuple
+
+# must be set before the Qt application is created
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+from Qt import QtWidgets, QtCore
+
+from .. import asciiLoader
+from ..dag import dagBuilder, dagNode, dagView
+from . import benchCore
+
+
+# text typed in the filter box, one keystroke at a time
+FILTER_TEXT = 't12'
+# longest wait for the first paint
+PAINT_TIMEOUT = 60.0
+
+GuiResultBase = namedtuple('GuiResultBase',
+                           ['name',
+                            'seconds',
+                            'count',
+                            'per_second',
+                            'peak_memory']
+                           )
+
+
+class GuiResult(GuiResultBase):
+    @classmethod
+    def from_run(cls, name, seconds, count, peak_memory=0):
+        """
+        Create a benchmark result with its rate
+
+        :param name: str. step name
+        :param seconds: float. duration, 0 for memory only results
+        :param count: int. rows or events processed
+        :param peak_memory: int. resident memory grown in bytes
+        :return: GuiResult.
+        """
+        per_second = count / seconds if seconds else 0
+        return cls(name, seconds, count, per_second, peak_memory)
+
+
+class PaintFilter(QtCore.QObject):
+    """
+    Event filter recording whether a widget has been painted
+    """
+    def __init__(self, parent=None):
+        super(PaintFilter, self).__init__(parent)
+        self.painted = False
+
+    def eventFilter(self, obj, event):
+        """
+        Override
+        """
+        if event.type() == QtCore.QEvent.Paint:
+            self.painted = True
+        return False
+
+
+def get_rss():
+    """
+    Get the resident memory of the process
+
+    :return: int. size in bytes, 0 if it can not be measured
+    """
+    try:
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except (IOError, OSError, ValueError):
+        pass
+    try:
+        import psutil
+        return psutil.Process().memory_info().rss
+    except ImportError:
+        return 0
+
+
+def flush(app):
+    """
+    Process pending events, including deferred layouts and paints
+    """
+    app.processEvents()
+    app.sendPostedEvents()
+    app.processEvents()
+
+
+def timed(app, func, *args):
+    """
+    Time a function and the events it leaves pending
+
+    :param app: QApplication.
+    :param func: function.
+    :return: float. duration in seconds
+    """
+    start = time.perf_counter()
+    func(*args)
+    flush(app)
+    return time.perf_counter() - start
+
+
+def bench_viewer(app, path):
+    """
+    Time opening a file in the viewer and its first paint
+
+    :param app: QApplication.
+    :param path: str. maya ascii file path
+    :return: list of GuiResult.
+    """
+    from .. import asciiViewer
+
+    window = asciiViewer.AsciiViewer()
+    seconds = timed(app, window.load_file, path)
+    results = [GuiResult.from_run('open', seconds, 1)]
+
+    viewport = window.ui_dag_widget.ui_dag_view.viewport()
+    painter = PaintFilter()
+    viewport.installEventFilter(painter)
+    start = time.perf_counter()
+    window.show()
+    while not painter.painted and time.perf_counter() - start < PAINT_TIMEOUT:
+        app.processEvents(QtCore.QEventLoop.AllEvents, 50)
+    results.append(GuiResult.from_run(
+        'first_paint', time.perf_counter() - start, 1))
+
+    viewport.removeEventFilter(painter)
+    window.close()
+    window.deleteLater()
+    flush(app)
+    return results
+
+
+def bench_dag(app, path):
+    """
+    Time the Dag view interactions on a standalone Dag widget
+
+    :param app: QApplication.
+    :param path: str. maya ascii file path
+    :return: list of GuiResult.
+    """
+    blocks = asciiLoader.Loader().load(path)
+    root = dagBuilder.Builder().build(blocks)
+    rows = len(dagNode.get_children(root))
+
+    widget = dagView.DagWidget()
+    widget.resize(1200, 800)
+    widget.show()
+    flush(app)
+    view = widget.ui_dag_view
+    results = list()
+
+    def set_root():
+        widget.set_root(root)
+        widget.update()
+
+    gc.collect()
+    memory = get_rss()
+    seconds = timed(app, set_root)
+    results.append(GuiResult.from_run('set_root', seconds, rows))
+
+    seconds = timed(app, view.expandAll)
+    memory = get_rss() - memory
+    results.append(GuiResult.from_run('expand_all', seconds, rows, memory))
+    results.append(GuiResult.from_run(
+        'memory_per_row', 0, rows, memory // max(rows, 1)))
+
+    model = view.model()
+    for column in range(model.columnCount()):
+        name = model.headerData(column, QtCore.Qt.Horizontal)
+        seconds = timed(
+            app, view.sortByColumn, column, QtCore.Qt.DescendingOrder)
+        results.append(GuiResult.from_run(
+            'sort_{}'.format(str(name).lower().replace(' ', '_')),
+            seconds, rows))
+
+    latencies = list()
+    edit = widget.ui_filter_edit
+    texts = [FILTER_TEXT[:i] for i in range(1, len(FILTER_TEXT) + 1)]
+    texts += list(reversed(texts[:-1])) + ['']
+    for text in texts:
+        latencies.append(timed(app, edit.setText, text))
+    results.append(GuiResult.from_run(
+        'filter_keystroke', sum(latencies) / len(latencies), len(latencies)))
+    results.append(GuiResult.from_run(
+        'filter_keystroke_max', max(latencies), 1))
+
+    widget.close()
+    widget.deleteLater()
+    flush(app)
+    return results
+
+
+def run(path, viewer=True):
+    """
+    Run the gui benchmarks against a scene
+
+    :param path: str. maya ascii file path
+    :param viewer: bool. whether to include the full viewer, which needs
+                   every viewer dependency
+    :return: dict. json serializable results with the run environment
+    """
+    app = QtWidgets.QApplication.instance() or QtWidgets.QApplication(sys.argv)
+
+    results = list()
+    if viewer:
+        results.extend(bench_viewer(app, path))
+    results.extend(bench_dag(app, path))
+
+    for result in results:
+        print('{:<24} {:>9.3f}s {:>12.0f} /s {:>9.1f} KB'.format(
+            result.name, result.seconds, result.per_second,
+            result.peak_memory / 1024.0))
+
+    return {
+        'scene': os.path.abspath(path),
+        'size': os.path.getsize(path),
+        'platform': QtWidgets.QApplication.platformName(),
+        'python': sys.version.split()[0],
+        'time': time.strftime('%Y-%m-%d %H:%M:%S'),
+        'results': [result._asdict() for result in results],
+    }
+
+
+def main(argv=None):
+    """
+    Command line entry, run the gui benchmarks
+
+    :param argv: list of str. command line arguments
+    """
+    parser = argparse.ArgumentParser(
+        description='Benchmark the viewer and the Dag view offscreen')
+    parser.add_argument('path', help='.ma scene, see sceneGenerator.py')
+    parser.add_argument('--output', help='.json file to store results')
+    parser.add_argument('--dag-only', action='store_true',
+                        help='only benchmark the standalone Dag widget')
+    args = parser.parse_args(argv)
+
+    results = run(args.path, not args.dag_only)
+    if args.output:
+        benchCore.save(results, args.output)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,413 @@
+"""
+Module for writing deterministic synthetic maya ascii scenes
+
+Scripting:
+```
+spec = SceneSpec(transforms=5000, depth=6, fanout=4, curves=2000, keys=200)
+generate(r'C:/bench.ma', spec)
+
+# about 500 MB with the default proportions
+generate(r'C:/bench_500.ma', get_spec(500 * 1024 * 1024))
+```
+
+Command line:
+```
+python -m mayaAsciiViewer.bench.sceneGenerator bench.ma --size 2048 --seed 7
+```
+
+The scene is made of transform hierarchies of a given depth and fan-out,
+mesh shapes with heavy vertex, uv and polyFaces arrays, anim curves
+connected to the transforms, bind poses storing 'xform' matrices, random
+connections between transforms, references with their reference edits and
+connections to the referenced (namespaced) nodes, and long 'requires' lines
+listing many node types. The file is written as it is generated, multi-GB
+scenes never live in memory.
+"""
+
+import argparse
+import io
+import random
+from collections import namedtuple
+
+
+# values per wrapped line of a numeric array
+LINE_VALUES = 12
+# formatted random floats that array lines are sliced from
+POOL_SIZE = 1 << 16
+# transforms held by each bind pose
+POSE_MEMBERS = 20
+# referenced controls targeted by the edits and connections of a reference
+REFERENCE_CONTROLS = 10
+
+SceneSpecBase = namedtuple('SceneSpecBase',
+                           ['transforms',
+                            'depth',
+                            'fanout',
+                            'connections',
+                            'curves',
+                            'keys',
+                            'meshes',
+                            'vertices',
+                            'references',
+                            'edits',
+                            'poses',
+                            'requires',
+                            'node_types',
+                            'seed']
+                           )
+
+
+class SceneSpec(SceneSpecBase):
+    """
+    Content of a synthetic scene
+    """
+    __slots__ = ()
+
+    def __new__(cls, transforms=1000, depth=4, fanout=4, connections=1.0,
+                curves=500, keys=100, meshes=50, vertices=2000,
+                references=5, edits=50, poses=5, requires=10, node_types=40,
+                seed=0):
+        """
+        Initialization
+
+        :param transforms: int. number of transform nodes
+        :param depth: int. depth of each transform hierarchy
+        :param fanout: int. children of each transform above the last level
+        :param connections: float. random connections per transform
+        :param curves: int. number of anim curves, each driving a transform
+        :param keys: int. keys per anim curve
+        :param meshes: int. number of mesh shapes under transforms
+        :param vertices: int. vertices per mesh
+        :param references: int. number of file references
+        :param edits: int. reference edits per reference node
+        :param poses: int. number of bind poses
+        :param requires: int. number of plugin 'requires' lines
+        :param node_types: int. node types listed by each 'requires' line
+        :param seed: int. random seed, the same spec always writes the
+                     same file
+        """
+        return super(SceneSpec, cls).__new__(
+            cls, transforms, depth, fanout, connections, curves, keys,
+            meshes, vertices, references, edits, poses, requires, node_types,
+            seed)
+
+    def scale(self, factor):
+        """
+        Scale the number of nodes, the per node content is unchanged
+
+        :param factor: float. multiplier of the node counts
+        :return: SceneSpec. scaled spec
+        """
+        return self._replace(
+            transforms=max(1, int(self.transforms * factor)),
+            curves=int(self.curves * factor),
+            meshes=int(self.meshes * factor),
+            poses=int(self.poses * factor),
+        )
+
+
+class CountingWriter(object):
+    """
+    A file-like sink only counting the bytes written
+    """
+    def __init__(self):
+        self.size = 0
+
+    def write(self, data):
+        self.size += len(data)
+
+
+def write_array(f, rng, pool, attr, count, width):
+    """
+    Write a setAttr of a numeric array wrapped over many lines like maya,
+    each line is a random slice of a pool of values so large arrays are
+    written at disk speed
+
+    :param f: file. text output
+    :param rng: random.Random. random generator
+    :param pool: list of str. formatted values
+    :param attr: str. attribute name without the index (e.g. ".vt")
+    :param count: int. number of elements
+    :param width: int. values per element (e.g. 3 for a point)
+    """
+    if not count:
+        return
+    f.write('\tsetAttr -s {0} "{1}[0:{2}]"'.format(count, attr, count - 1))
+    total = count * width
+    last = len(pool) - LINE_VALUES
+    for start in range(0, total, LINE_VALUES):
+        offset = rng.randrange(last)
+        values = pool[offset:offset + min(LINE_VALUES, total - start)]
+        f.write('\n\t\t ' + ' '.join(values))
+    f.write(';\n')
+
+
+def write_faces(f, rng, pool, count):
+    """
+    Write a polyFaces setAttr of quads with their uvs, the edge and uv
+    indices are random slices of a pool of values
+
+    :param f: file. text output
+    :param rng: random.Random. random generator
+    :param pool: list of str. formatted indices
+    :param count: int. number of faces
+    """
+    if not count:
+        return
+    f.write('\tsetAttr -s {0} -ch {1} ".fc[0:{2}]" -type "polyFaces" '.format(
+        count, count * 4, count - 1))
+    last = len(pool) - 4
+    for _ in range(count):
+        edges = rng.randrange(last)
+        uvs = rng.randrange(last)
+        f.write('\n\t\tf 4 ' + ' '.join(pool[edges:edges + 4]))
+        f.write('\n\t\tmu 0 4 ' + ' '.join(pool[uvs:uvs + 4]))
+    f.write(';\n')
+
+
+def write_pose(f, rng, pool, name, count):
+    """
+    Write a bind pose with the world matrix and the 'xform' matrix of each
+    member
+
+    :param f: file. text output
+    :param rng: random.Random. random generator
+    :param pool: list of str. formatted values
+    :param name: str. pose node name
+    :param count: int. number of members
+    """
+    f.write('createNode dagPose -n "{0}";\n'.format(name))
+    write_uid(f, rng)
+    f.write('\tsetAttr -s {0} ".wm";\n'.format(count))
+    for i in range(count):
+        x, y, z = rng.sample(pool, 3)
+        f.write('\tsetAttr ".wm[{0}]" -type "matrix" 1 0 0 0 0 1 0 0 0 0 1 0 '
+                '{1} {2} {3} 1;\n'.format(i, x, y, z))
+    f.write('\tsetAttr -s {0} ".xm";\n'.format(count))
+    for i in range(count):
+        x, y, z = rng.sample(pool, 3)
+        f.write('\tsetAttr ".xm[{0}]" -type "matrix" "xform" 1 1 1 0 0 0 0 '
+                '{1} {2} {3}\n\t\t 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 '
+                '0 0 0 1 0 0 0 1 1 1 1 yes;\n'.format(i, x, y, z))
+    f.write('\tsetAttr -s {0} ".m";\n'.format(count))
+    f.write('\tsetAttr ".bp" yes;\n')
+
+
+def write_header(f, rng, spec):
+    """
+    Write the header comments, references, requires, units and file info
+    """
+    f.write('//Maya ASCII 2018ff09 scene\n')
+    f.write('//Name: bench.ma\n')
+    f.write('//Codeset: 1252\n')
+
+    for i in range(spec.references):
+        path = '/assets/ref{0}/ref{0}.ma'.format(i)
+        f.write('file -rdi 1 -ns "ref{0}" -rfn "ref{0}RN" -op "v=0;" '
+                '-typ "mayaAscii" "{1}";\n'.format(i, path))
+    for i in range(spec.references):
+        path = '/assets/ref{0}/ref{0}.ma'.format(i)
+        f.write('file -r -ns "ref{0}" -dr 1 -rfn "ref{0}RN" -op "v=0;" '
+                '-typ "mayaAscii" "{1}";\n'.format(i, path))
+
+    f.write('requires maya "2018ff09";\n')
+    for i in range(spec.requires):
+        f.write('requires')
+        for j in range(spec.node_types):
+            f.write(' -nodeType "plugin{0}Node{1}"'.format(i, j))
+            if j % 4 == 3:
+                f.write('\n\t\t')
+        f.write(' "plugin{0}" "{1}.{2}.0";\n'.format(
+            i, rng.randrange(1, 5), rng.randrange(10)))
+
+    f.write('currentUnit -l centimeter -a degree -t film;\n')
+    f.write('fileInfo "application" "maya";\n')
+    f.write('fileInfo "product" "Maya 2018";\n')
+    f.write('fileInfo "version" "2018";\n')
+    f.write('fileInfo "seed" "{0}";\n'.format(spec.seed))
+
+
+def write_uid(f, rng):
+    f.write('\trename -uid "{0:08X}-{1:04X}-{2:04X}-{3:04X}-{4:012X}";\n'.format(
+        rng.getrandbits(32), rng.getrandbits(16), rng.getrandbits(16),
+        rng.getrandbits(16), rng.getrandbits(48)))
+
+
+def iter_hierarchy(spec):
+    """
+    Get the transform names and parents, parents always come first
+
+    :param spec: SceneSpec.
+    :return: generator of tuple (str, str or None). name and parent name
+    """
+    count = 0
+    while count < spec.transforms:
+        level = ['t{0}'.format(count)]
+        yield level[0], None
+        count += 1
+        for _ in range(1, spec.depth):
+            children = list()
+            for parent in level:
+                for _ in range(spec.fanout):
+                    if count >= spec.transforms:
+                        return
+                    name = 't{0}'.format(count)
+                    yield name, parent
+                    children.append(name)
+                    count += 1
+            level = children
+
+
+def write_scene(f, spec):
+    """
+    Write a synthetic scene
+
+    :param f: file. text output
+    :param spec: SceneSpec.
+    """
+    rng = random.Random(spec.seed)
+    floats = [repr(rng.uniform(-100, 100)) for _ in range(POOL_SIZE)]
+    indices = [str(rng.randrange(POOL_SIZE)) for _ in range(POOL_SIZE)]
+    write_header(f, rng, spec)
+
+    for name, parent in iter_hierarchy(spec):
+        f.write('createNode transform -n "{0}"'.format(name))
+        if parent:
+            f.write(' -p "{0}"'.format(parent))
+        f.write(';\n')
+        write_uid(f, rng)
+        f.write('\tsetAttr ".t" -type "double3" {0!r} {1!r} {2!r} ;\n'.format(
+            rng.uniform(-100, 100), rng.uniform(-100, 100),
+            rng.uniform(-100, 100)))
+
+    # transforms are named by their creation order
+    for i in range(spec.meshes):
+        f.write('createNode mesh -n "mesh{0}Shape" -p "t{1}";\n'.format(
+            i, rng.randrange(spec.transforms)))
+        write_uid(f, rng)
+        f.write('\tsetAttr -k off ".v";\n')
+        f.write('\tsetAttr ".uvst[0].uvsn" -type "string" "map1";\n')
+        write_array(f, rng, floats, '.uvst[0].uvsp', spec.vertices, 2)
+        write_array(f, rng, floats, '.vt', spec.vertices, 3)
+        write_array(f, rng, indices, '.ed', spec.vertices, 3)
+        write_faces(f, rng, indices, spec.vertices)
+
+    for i in range(spec.curves):
+        f.write('createNode animCurveTL -n "curve{0}";\n'.format(i))
+        write_uid(f, rng)
+        f.write('\tsetAttr ".tan" 18;\n')
+        f.write('\tsetAttr ".wgt" no;\n')
+        write_array(f, rng, floats, '.ktv', spec.keys, 2)
+
+    for i in range(spec.references):
+        f.write('createNode reference -n "ref{0}RN";\n'.format(i))
+        write_uid(f, rng)
+        f.write('\tsetAttr ".ed" -type "dataReferenceEdits" \n')
+        f.write('\t\t"ref{0}RN"\n\t\t"ref{0}RN" 0\n'.format(i))
+        f.write('\t\t"ref{0}RN" {1}\n'.format(i, spec.edits + 1))
+        f.write('\t\t2 "|ref{0}:root" "visibility" " 1"'.format(i))
+        for j in range(spec.edits):
+            control = '|ref{0}:root|ref{0}:ctrl{1}'.format(
+                i, j % REFERENCE_CONTROLS)
+            kind = j % 3
+            if kind == 0:
+                f.write('\n\t\t2 "{0}" "translate" " -type \\"double3\\" '
+                        '{1} {2} {3}"'.format(control, *rng.sample(floats, 3)))
+            elif kind == 1:
+                f.write('\n\t\t3 "{0}.instObjGroups" '
+                        '"ref{1}:blinn1SG.dagSetMembers" "-na"'.format(control, i))
+            else:
+                f.write('\n\t\t5 4 "ref{0}RN" "{1}.translate" '
+                        '"ref{0}RN.placeHolderList[{2}]" ""'.format(i, control, j))
+        f.write(';\n')
+
+    for i in range(spec.poses):
+        write_pose(f, rng, floats, 'bindPose{0}'.format(i),
+                   min(POSE_MEMBERS, spec.transforms))
+
+    f.write('createNode script -n "sceneConfigurationScriptNode";\n')
+    write_uid(f, rng)
+    f.write('\tsetAttr ".b" -type "string" '
+            '"playbackOptions -min 1 -max {0} -ast 1 -aet {0} ";\n'.format(
+                max(spec.keys, 1)))
+    f.write('\tsetAttr ".st" 6;\n')
+
+    f.write('select -ne :time1;\n')
+    f.write('\tsetAttr ".o" 1;\n')
+
+    for i in range(spec.curves):
+        f.write('connectAttr "curve{0}.o" "t{1}.tx";\n'.format(
+            i, i % spec.transforms))
+    for i in range(spec.poses):
+        for j in range(min(POSE_MEMBERS, spec.transforms)):
+            f.write('connectAttr "t{0}.msg" "bindPose{1}.m[{2}]";\n'.format(
+                rng.randrange(spec.transforms), i, j))
+    # referenced nodes are not created in the file
+    for i in range(spec.references):
+        for j in range(REFERENCE_CONTROLS):
+            f.write('connectAttr "ref{0}:ctrl{1}.tx" "t{2}.tz";\n'.format(
+                i, j, rng.randrange(spec.transforms)))
+    for i in range(int(spec.transforms * spec.connections)):
+        f.write('connectAttr "t{0}.ty" "t{1}.sy";\n'.format(
+            rng.randrange(spec.transforms), rng.randrange(spec.transforms)))
+    f.write('// End of bench.ma\n')
+
+
+def generate(path, spec):
+    """
+    Write a synthetic scene file
+
+    :param path: str. output .ma file path
+    :param spec: SceneSpec.
+    :return: int. file size in bytes
+    """
+    with io.open(path, 'w', newline='\n', buffering=1024 * 1024) as f:
+        write_scene(f, spec)
+        return f.tell()
+
+
+def get_spec(size, spec=None):
+    """
+    Scale a spec to approach a file size, the spec is written once to a
+    counting sink at its own size to measure the bytes per node
+
+    :param size: int. target file size in bytes
+    :param spec: SceneSpec or None. proportions of the scene, the default
+                 spec if not given
+    :return: SceneSpec. scaled spec
+    """
+    spec = spec or SceneSpec()
+    sink = CountingWriter()
+    write_scene(sink, spec)
+    return spec.scale(float(size) / sink.size)
+
+
+def main(argv=None):
+    """
+    Command line entry, write a synthetic scene
+
+    :param argv: list of str. command line arguments
+    """
+    defaults = SceneSpec()
+    parser = argparse.ArgumentParser(
+        description='Write a synthetic maya ascii scene')
+    parser.add_argument('path', help='output .ma file')
+    parser.add_argument('--size', type=float, default=None,
+                        help='approximate size in MB, scales the node counts')
+    for field in SceneSpec._fields:
+        default = getattr(defaults, field)
+        parser.add_argument('--' + field.replace('_', '-'),
+                            type=type(default), default=default)
+    args = parser.parse_args(argv)
+
+    spec = SceneSpec(**dict(
+        (field, getattr(args, field)) for field in SceneSpec._fields))
+    if args.size:
+        spec = get_spec(int(args.size * 1024 * 1024), spec)
+
+    size = generate(args.path, spec)
+    print('wrote {} bytes, {}'.format(size, spec))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,309 @@
+"""
+Module used to parse animation curve keys from ascii data blocks
+
+Scripting:
+```
+# all animation curves with static (constant value) curves flagged
+curves = AnimCurve.from_blocks(blocks)
+for curve in curves:
+    if curve.static:
+        print(curve.name)
+
+# the key table of all curves
+table = KeyTable.from_blocks(blocks)
+print(table.times, table.values, table.offsets)
+```
+
+Example:
+```
+createNode animCurveTL -n "pCube1_translateX";
+    rename -uid "9E8D1C4F-4B5A-A2A8-6A42-1F8A9C5D2B7E";
+    setAttr ".tan" 18;
+    setAttr ".wgt" no;
+    setAttr -s 4 ".ktv[0:3]"  1 0 10 2.5 20 2.5 30 2.5;
+```
+
+"""
+
+import re
+from collections import namedtuple
+
+import numpy as np
+
+from .. import asciiBlock
+
+
+# keys of a curve may be split into multiple statements
+KTV_RE = re.compile(br'\n\tsetAttr[^"\n]*"\.ktv\[(\d+)(?::(\d+))?\]"([^;]*);')
+
+AnimCurveBase = namedtuple('AnimCurveBase',
+                           ['name',
+                            'typ',
+                            'keys',
+                            'start',
+                            'end',
+                            'static',
+                            'redundant']
+                           )
+
+
+def is_anim_curve(block):
+    """
+    Whether the ascii block creates an animation curve node
+    (e.g. "animCurveTL", "animCurveTA", "animCurveTU", "animCurveUA")
+
+    :param block: AsciiBlock.
+    :return: bool.
+    """
+    return (isinstance(block, asciiBlock.NodeBlock)
+            and block.typ.startswith('animCurve'))
+
+
+def get_pairs(data, count):
+    """
+    Decode key time and value pairs from the ascii values of 'ktv' statements
+
+    :param data: bytes. whitespace separated key times and values
+    :param count: int. expected number of keys
+    :return: np.ndarray or None. time and value of each key with a shape of
+             (count, 2), None if the data does not hold exactly that many
+             pairs of numbers
+    """
+    try:
+        pairs = np.fromstring(data, dtype=np.float64, sep=' ')
+    except ValueError:
+        return None
+    if len(pairs) != count * 2:
+        return None
+    return pairs.reshape(-1, 2)
+
+
+class KeyTable(object):
+    """
+    Keys of many animation curves concatenated into one table, keys of the
+    curve i are times[offsets[i]:offsets[i+1]] and
+    values[offsets[i]:offsets[i+1]]
+    """
+    def __init__(self, names, typs, offsets, times, values, invalid=None):
+        """
+        Initialization
+
+        :param names: list of str. curve node names
+        :param typs: list of str. curve node types
+        :param offsets: np.ndarray. key offsets of each curve, with an
+                        extra trailing offset of the total key count
+        :param times: np.ndarray. key times (or input values for
+                      driven keys) of all curves
+        :param values: np.ndarray. key values of all curves
+        :param invalid: list of str. names of the curves left out of the
+                        table because their keys could not be decoded
+        """
+        self.__names = names
+        self.__typs = typs
+        self.__offsets = offsets
+        self.__times = times
+        self.__values = values
+        self.__invalid = invalid or list()
+
+    @classmethod
+    def from_blocks(cls, blocks):
+        """
+        Create the key table from ascii data blocks, keys of all curves are
+        decoded with a single numpy conversion, curves whose key count does
+        not match their values are left out of the table
+
+        :param blocks: list of AsciiBlock.
+                       normally generated from 'asciiLoader.py'
+        :return: KeyTable. key table of all animation curves
+        """
+        curves = [block for block in blocks if is_anim_curve(block)]
+        names = list()
+        typs = list()
+        counts = list()
+        keys = list()
+        invalid = list()
+
+        if curves:
+            for block, detail in curves[0].asc.iter_bytes(curves):
+                count = 0
+                tokens = 0
+                chunks = list()
+                for match in KTV_RE.finditer(detail):
+                    first, last, value = match.groups()
+                    count += int(last or first) - int(first) + 1
+                    tokens += len(value.split())
+                    chunks.append(value)
+
+                if tokens != count * 2:
+                    invalid.append(block.name)
+                    continue
+                names.append(block.name)
+                typs.append(block.typ)
+                counts.append(count)
+                keys.append(b' '.join(chunks))
+
+        pairs = get_pairs(b' '.join(keys), sum(counts))
+        if pairs is None:
+            # a curve holds a value that is not a number, decode the curves
+            # one by one to leave it out
+            valid = list()
+            arrays = list()
+            for i, data in enumerate(keys):
+                curve_pairs = get_pairs(data, counts[i])
+                if curve_pairs is None:
+                    invalid.append(names[i])
+                else:
+                    valid.append(i)
+                    arrays.append(curve_pairs)
+
+            names = [names[i] for i in valid]
+            typs = [typs[i] for i in valid]
+            counts = [counts[i] for i in valid]
+            pairs = np.concatenate(arrays) if arrays else np.zeros((0, 2))
+
+        offsets = np.zeros(len(counts) + 1, dtype=np.int64)
+        np.cumsum(counts, out=offsets[1:])
+        return cls(names, typs, offsets, pairs[:, 0], pairs[:, 1], invalid)
+
+    @property
+    def names(self):
+        return self.__names
+
+    @property
+    def typs(self):
+        return self.__typs
+
+    @property
+    def offsets(self):
+        return self.__offsets
+
+    @property
+    def times(self):
+        return self.__times
+
+    @property
+    def values(self):
+        return self.__values
+
+    @property
+    def invalid(self):
+        """
+        Names of the curves left out of the table, their key count does not
+        match their values or a value is not a number
+
+        :return: list of str. curve node names
+        """
+        return self.__invalid
+
+    @property
+    def counts(self):
+        """
+        Number of keys of each curve
+
+        :return: np.ndarray. key count of each curve
+        """
+        return np.diff(self.__offsets)
+
+    def get_ranges(self):
+        """
+        Time range of each curve, curves without keys have a nan range
+
+        :return: tuple (np.ndarray, np.ndarray). first and last key times
+        """
+        counts = self.counts
+        has_keys = counts > 0
+        starts = np.full(len(counts), np.nan)
+        ends = np.full(len(counts), np.nan)
+        starts[has_keys] = self.__times[self.__offsets[:-1][has_keys]]
+        ends[has_keys] = self.__times[self.__offsets[1:][has_keys] - 1]
+        return starts, ends
+
+    def get_static(self, tolerance=0.0):
+        """
+        Whether each curve holds a constant value across all its keys
+
+        :param tolerance: float. maximum value difference considered equal
+        :return: np.ndarray. boolean mask of static curves
+        """
+        counts = self.counts
+        has_keys = counts > 0
+        static = np.zeros(len(counts), dtype=bool)
+        if not has_keys.any():
+            return static
+
+        firsts = self.__offsets[:-1][has_keys]
+        highs = np.maximum.reduceat(self.__values, firsts)
+        lows = np.minimum.reduceat(self.__values, firsts)
+        static[has_keys] = (highs - lows) <= tolerance
+        return static
+
+    def get_redundant(self, tolerance=0.0):
+        """
+        Whether each key is a redundant in-between key, which holds the same
+        value as both its previous and next key on the same curve
+
+        :param tolerance: float. maximum value difference considered equal
+        :return: np.ndarray. boolean mask of redundant keys
+        """
+        redundant = np.zeros(len(self.__values), dtype=bool)
+        if len(self.__values) < 3:
+            return redundant
+
+        same = np.abs(np.diff(self.__values)) <= tolerance
+        redundant[1:-1] = same[:-1] & same[1:]
+
+        # first and last keys of a curve have no neighbour on the same curve
+        counts = self.counts
+        has_keys = counts > 0
+        redundant[self.__offsets[:-1][has_keys]] = False
+        redundant[self.__offsets[1:][has_keys] - 1] = False
+        return redundant
+
+    def get_redundant_counts(self, tolerance=0.0):
+        """
+        Number of redundant in-between keys of each curve
+
+        :param tolerance: float. maximum value difference considered equal
+        :return: np.ndarray. redundant key count of each curve
+        """
+        counts = self.counts
+        has_keys = counts > 0
+        results = np.zeros(len(counts), dtype=np.int64)
+        if not has_keys.any():
+            return results
+
+        redundant = self.get_redundant(tolerance).astype(np.int64)
+        results[has_keys] = np.add.reduceat(
+            redundant, self.__offsets[:-1][has_keys])
+        return results
+
+
+class AnimCurve(AnimCurveBase):
+    @classmethod
+    def from_blocks(cls, blocks):
+        """
+        Create animation curve data objects from ascii data blocks
+
+        :param blocks: list of AsciiBlock.
+                       normally generated from 'asciiLoader.py'
+        :return: list of AnimCurve. animation curve objects containing
+                 key statistics
+        """
+        table = KeyTable.from_blocks(blocks)
+        starts, ends = table.get_ranges()
+        statics = table.get_static()
+        redundants = table.get_redundant_counts()
+
+        return [
+            cls(name, typ, int(keys), float(start), float(end),
+                bool(static), int(redundant))
+            for name, typ, keys, start, end, static, redundant in zip(
+                table.names,
+                table.typs,
+                table.counts,
+                starts,
+                ends,
+                statics,
+                redundants
+            )
+        ]
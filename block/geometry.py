@@ -0,0 +1,196 @@
+"""
+Module used to parse geometry statistics from ascii data blocks
+
+Scripting:
+```
+# heaviest meshes and their component counts
+geos = Geometry.from_blocks(blocks)
+for geo in sorted(geos, key=lambda geo: geo.size, reverse=True):
+    print(geo.name, geo.vertices, geo.faces)
+```
+
+Example:
+```
+createNode mesh -n "pCubeShape1" -p "pCube1";
+    rename -uid "A1D0E7C2-4F3B-8E51-2C6D-93B7F0E1A4C8";
+    setAttr -s 4 ".uvst[0].uvsp[0:3]" -type "float2" 0.375 0 0.625 0 0.375
+         0.25 0.625 0.25;
+    setAttr -s 4 ".vt[0:3]"  -0.5 -0.5 0.5 0.5 -0.5 0.5 -0.5 0.5 0.5 0.5 0.5 0.5;
+    setAttr -s 5 ".ed[0:4]"  0 1 0 2 3 0 0 2 0 1 3 0 1 2 0;
+    setAttr -s 2 -ch 6 ".fc[0:1]" -type "polyFaces"
+        f 3 0 4 -3
+        mu 0 3 0 1 2
+        f 3 1 3 -5
+        mu 0 3 1 3 2;
+```
+
+Counts are taken from the '-s' array sizes and index ranges of the
+statement headers, the values themselves are never decoded.
+"""
+
+import re
+from collections import namedtuple, OrderedDict
+
+from .. import asciiBlock, asciiAttr
+
+
+GEOMETRY_TYPES = {'mesh', 'nurbsSurface'}
+
+UV_SET_RE = re.compile(r'^\.uvst\[(\d+)\]')
+TOKEN_RE = re.compile(br'\S+')
+
+# statement bucket of each attribute
+VERTEX_ATTRS = {'.vt', '.pt', '.cc'}
+EDGE_ATTRS = {'.ed'}
+FACE_ATTRS = {'.fc'}
+
+
+GeometryBase = namedtuple('GeometryBase',
+                          ['name',
+                           'typ',
+                           'vertices',
+                           'edges',
+                           'faces',
+                           'uv_sets',
+                           'uvs',
+                           'size',
+                           'vertex_size',
+                           'edge_size',
+                           'face_size',
+                           'uv_size']
+                          )
+
+
+def get_nurbs_cvs(detail, statement):
+    """
+    Get the control vertex count of a 'nurbsSurface' data, only the
+    header and knot tokens are read
+
+    Example:
+    ```
+    setAttr ".cc" -type "nurbsSurface"
+        3 3 0 0 no
+        6 0 0 0 1 1 1
+        6 0 0 0 1 1 1
+
+        16
+        -0.5 -0.5 0.5 ...
+    ```
+
+    :param detail: bytes. raw content of an ascii block
+    :param statement: asciiAttr.Statement. the '.cc' statement
+    :return: int. control vertex count
+    """
+    tokens = TOKEN_RE.finditer(detail, statement.value, statement.end)
+    try:
+        # degree u, degree v, form u, form v, rational
+        for _ in range(5):
+            next(tokens)
+        for _ in range(2):
+            knots = int(next(tokens).group())
+            for _ in range(knots):
+                next(tokens)
+        return int(next(tokens).group())
+    except (StopIteration, ValueError):
+        return 0
+
+
+def get_attr_sizes(detail):
+    """
+    Get the bytes spent on each attribute of a block
+
+    :param detail: bytes. raw content of an ascii block
+    :return: OrderedDict. attribute name without index to size in bytes
+    """
+    sizes = OrderedDict()
+    for statement in asciiAttr.iter_statements(detail):
+        key = statement.base if statement.attr else statement.command
+        sizes[key] = sizes.get(key, 0) + statement.size
+    return sizes
+
+
+def get_geometry(blocks):
+    """
+    Get geometry statistics of every 'mesh' and 'nurbsSurface' node
+
+    :param blocks: list of AsciiBlock.
+                   normally generated from 'asciiLoader.py'
+    :return: OrderedDict. block line index to Geometry
+    """
+    geometries = OrderedDict()
+    nodes = [
+        block for block in blocks
+        if isinstance(block, asciiBlock.NodeBlock)
+        and block.typ in GEOMETRY_TYPES
+    ]
+    if not nodes:
+        return geometries
+
+    for block, detail in nodes[0].asc.iter_bytes(nodes):
+        # declared array size and sum of index ranges of each attribute
+        declared = dict()
+        ranged = dict()
+        buckets = dict.fromkeys(['vertex', 'edge', 'face', 'uv'], 0)
+        uv_sets = set()
+        cvs = 0
+
+        for statement in asciiAttr.iter_statements(detail):
+            if statement.command != 'setAttr':
+                continue
+
+            base = statement.base
+            if statement.length is not None:
+                declared[base] = max(declared.get(base, 0), statement.length)
+            if statement.count:
+                ranged[base] = ranged.get(base, 0) + statement.count
+
+            uv_set = UV_SET_RE.match(base)
+            if uv_set:
+                uv_sets.add(uv_set.group(1))
+                buckets['uv'] += statement.size
+            elif base in VERTEX_ATTRS:
+                buckets['vertex'] += statement.size
+            elif base in EDGE_ATTRS:
+                buckets['edge'] += statement.size
+            elif base in FACE_ATTRS:
+                buckets['face'] += statement.size
+
+            if base == '.cc' and statement.typ == 'nurbsSurface':
+                cvs = get_nurbs_cvs(detail, statement)
+
+        def get_count(attr):
+            return max(declared.get(attr, 0), ranged.get(attr, 0))
+
+        uvs = sum(
+            get_count(attr) for attr in set(declared) | set(ranged)
+            if UV_SET_RE.match(attr) and attr.endswith('.uvsp')
+        )
+        geometries[block.index] = Geometry(
+            block.name,
+            block.typ,
+            get_count('.vt') or cvs,
+            get_count('.ed'),
+            get_count('.fc'),
+            len(uv_sets),
+            uvs,
+            block.size,
+            buckets['vertex'],
+            buckets['edge'],
+            buckets['face'],
+            buckets['uv']
+        )
+
+    return geometries
+
+
+class Geometry(GeometryBase):
+    @classmethod
+    def from_blocks(cls, blocks):
+        """
+        Create geometry data objects from ascii data blocks
+
+        :param blocks: list of AsciiBlock.
+                       normally generated from 'asciiLoader.py'
+        :return: list of Geometry. geometry statistics objects
+        """
+        return list(get_geometry(blocks).values())
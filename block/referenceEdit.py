@@ -0,0 +1,218 @@
+"""
+Module used to parse reference edits stored on reference nodes from ascii
+data blocks
+
+Scripting:
+```
+# references ranked by the bytes of their accumulated edits
+edits = ReferenceEdit.from_blocks(blocks)
+for edit in edits:
+    print(edit.ref_node, edit.path, edit.edits, edit.size)
+```
+
+Example:
+```
+createNode reference -n "rigRN";
+    rename -uid "6F3C5D2A-4B1E-9A7C-3E8D-0B2F4A6C8D1E";
+    setAttr ".ed" -type "dataReferenceEdits"
+        "rigRN"
+        "rigRN" 0
+        "rigRN" 3
+        2 "|rig:ctrl" "translate" " -type \\"double3\\" 1 0 0"
+        3 "|rig:ctrl|rig:ctrlShape.instObjGroups" "rig:blinn1SG.dagSetMembers" "-na"
+        0 "|rig:ctrl" "|group1" "-s -r "
+        5 4 "rigRN" "|rig:ctrl.translate" "rigRN.placeHolderList[1]" "";
+```
+
+Each edit line starts with its kind, followed by the target node or plug,
+lines starting with a string are the headers of the reference node
+sections the edits belong to.
+"""
+
+import re
+from collections import namedtuple, OrderedDict
+from operator import attrgetter
+
+from .. import asciiBlock, asciiAttr
+from . import reference
+
+
+QUOTED_RE = re.compile(br'"((?:[^"\\]|\\.)*)"')
+
+EDIT_KINDS = {
+    0: 'parent',
+    1: 'add_attr',
+    2: 'set_attr',
+    3: 'connect_attr',
+    4: 'disconnect_attr',
+}
+
+
+ReferenceEditBase = namedtuple('ReferenceEditBase',
+                               ['ref_node',
+                                'path',
+                                'namespace',
+                                'edits',
+                                'set_attr',
+                                'connect_attr',
+                                'disconnect_attr',
+                                'parent',
+                                'add_attr',
+                                'other',
+                                'size']
+                               )
+EditNamespaceBase = namedtuple('EditNamespaceBase',
+                               ['ref_node', 'namespace', 'edits', 'size'])
+
+
+def get_namespace(target):
+    """
+    Get the namespace of an edit target
+
+    :param target: str. node path or plug (e.g. "|rig:ctrl|rig:ctrlShape.v")
+    :return: str. namespace (e.g. "rig"), ':' for the root namespace
+    """
+    node = target.partition('.')[0].rsplit('|', 1)[-1]
+    namespace, colon, _ = node.rpartition(':')
+    return namespace if colon and namespace else ':'
+
+
+def iter_edits(detail, statement):
+    """
+    Iterate the edits of a 'dataReferenceEdits' value line by line
+
+    :param detail: bytes. raw content of the reference node block
+    :param statement: asciiAttr.Statement. the '.ed' statement
+    :return: generator of tuple (str, str, int). edit kind name, edit target
+             and size of the edit in bytes
+    """
+    kind = target = None
+    size = 0
+    value = bytes(detail[statement.value:statement.end])
+    for line in value.split(b'\n'):
+        stripped = line.strip()
+        if stripped[:1].isdigit():
+            if kind is not None:
+                yield kind, target, size
+
+            number = int(stripped.split(None, 1)[0])
+            quoted = QUOTED_RE.findall(stripped)
+            # placeholder edits name the reference node before the target
+            if number == 5 and len(quoted) > 1:
+                quoted = quoted[1:]
+            kind = EDIT_KINDS.get(number, 'other')
+            target = quoted[0].decode('utf-8', 'replace') if quoted else ''
+            size = len(line) + 1
+        elif kind is not None and not stripped.startswith(b'"'):
+            # continuation of a long edit
+            size += len(line) + 1
+        elif kind is not None:
+            yield kind, target, size
+            kind = None
+
+    if kind is not None:
+        yield kind, target, size
+
+
+def get_edits(blocks):
+    """
+    Get the reference edits of every reference node
+
+    :param blocks: list of AsciiBlock.
+                   normally generated from 'asciiLoader.py'
+    :return: OrderedDict. reference node name to list of tuple
+             (kind, target, size) of each edit
+    """
+    edits = OrderedDict()
+    nodes = [
+        block for block in blocks
+        if isinstance(block, asciiBlock.NodeBlock) and block.typ == 'reference'
+    ]
+    if not nodes:
+        return edits
+
+    for block, detail in nodes[0].asc.iter_bytes(nodes):
+        node_edits = edits.setdefault(block.name, list())
+        for statement in asciiAttr.iter_statements(detail):
+            if statement.typ != 'dataReferenceEdits':
+                continue
+            node_edits.extend(iter_edits(detail, statement))
+
+    return edits
+
+
+class ReferenceEdit(ReferenceEditBase):
+    @classmethod
+    def from_blocks(cls, blocks, edits=None):
+        """
+        Create reference edit data objects from ascii data blocks, joined
+        with the file references by reference node
+
+        :param blocks: list of AsciiBlock.
+                       normally generated from 'asciiLoader.py'
+        :param edits: OrderedDict or None. result of get_edits() to reuse,
+                      read from the blocks if None
+        :return: list of ReferenceEdit. edit summary of each reference node
+                 ranked by size
+        """
+        if edits is None:
+            edits = get_edits(blocks)
+        refs = dict(
+            (ref.ref_node, ref)
+            for ref in reference.Reference.from_blocks(blocks)
+        )
+
+        results = list()
+        for ref_node, node_edits in edits.items():
+            counts = dict.fromkeys(list(EDIT_KINDS.values()) + ['other'], 0)
+            for kind, _, _ in node_edits:
+                counts[kind] += 1
+
+            ref = refs.get(ref_node)
+            results.append(cls(
+                ref_node,
+                ref.path if ref else '',
+                ref.namespace if ref else '',
+                len(node_edits),
+                counts['set_attr'],
+                counts['connect_attr'],
+                counts['disconnect_attr'],
+                counts['parent'],
+                counts['add_attr'],
+                counts['other'],
+                sum(size for _, _, size in node_edits)
+            ))
+
+        return sorted(results, key=attrgetter('size'), reverse=True)
+
+
+class EditNamespace(EditNamespaceBase):
+    @classmethod
+    def from_blocks(cls, blocks, edits=None):
+        """
+        Create reference edit data objects grouped by the namespace of the
+        edit targets
+
+        :param blocks: list of AsciiBlock.
+                       normally generated from 'asciiLoader.py'
+        :param edits: OrderedDict or None. result of get_edits() to reuse,
+                      read from the blocks if None
+        :return: list of EditNamespace. edit summary of each reference node
+                 and target namespace ranked by size
+        """
+        if edits is None:
+            edits = get_edits(blocks)
+
+        results = list()
+        for ref_node, node_edits in edits.items():
+            counts = OrderedDict()
+            sizes = dict()
+            for _, target, size in node_edits:
+                namespace = get_namespace(target)
+                counts[namespace] = counts.get(namespace, 0) + 1
+                sizes[namespace] = sizes.get(namespace, 0) + size
+
+            for namespace, count in counts.items():
+                results.append(cls(ref_node, namespace, count, sizes[namespace]))
+
+        return sorted(results, key=attrgetter('size'), reverse=True)
@@ -0,0 +1,212 @@
+"""
+Module used to load the nested references of a maya ascii file recursively
+
+Scripting:
+```
+# all references nested up to 3 levels deep, with their file sizes
+refs = ReferenceFile.from_path(r'C:/shot.ma', depth=3)
+for ref in refs:
+    print('  ' * ref.depth + ref.namespace, ref.size)
+```
+
+Example:
+```
+file -rdi 1 -ns "rig" -rfn "rigRN" -op "v=0;" -typ "mayaAscii" "$ASSETS/rig.ma";
+file -r -ns "rig" -dr 1 -rfn "rigRN" -op "v=0;" -typ "mayaAscii" "$ASSETS/rig.ma";
+```
+
+References are declared at the top of a file before any 'requires', so only
+the file header is parsed. Unique files are parsed once per tree level in a
+process pool, and the results are kept in a module level cache shared by
+all trees, invalidated by file size and modification time.
+"""
+
+import os
+import re
+from collections import namedtuple
+from concurrent import futures
+
+from .. import asciiLoader
+
+
+COPY_NUMBER_RE = re.compile(r'\{\d+\}$')
+
+# header scan stops at the first of these commands
+HEADER_END = (b'requires', b'currentUnit', b'fileInfo', b'createNode')
+
+# (path, size, mtime) to list of (path, namespace, ref_node, typ)
+CACHE = dict()
+
+
+ReferenceFileBase = namedtuple('ReferenceFileBase',
+                               ['namespace',
+                                'path',
+                                'typ',
+                                'depth',
+                                'size',
+                                'parent']
+                               )
+
+
+def resolve_path(path, directory):
+    """
+    Resolve a reference path as written in the file to an absolute path
+
+    :param path: str. reference path (e.g. "$ASSETS/rig.ma{2}")
+    :param directory: str. directory of the referencing file, used to
+                      resolve relative paths
+    :return: str. absolute path
+    """
+    path = COPY_NUMBER_RE.sub('', path)
+    path = os.path.expanduser(os.path.expandvars(path))
+    if not os.path.isabs(path):
+        path = os.path.join(directory, path)
+    return os.path.normpath(path)
+
+
+def read_references(path):
+    """
+    Read the references declared in the header of a maya ascii file
+
+    :param path: str. maya ascii file path
+    :return: list of tuple (str, str, str, str). resolved path, namespace,
+             reference node and file type of each reference
+    """
+    asc = asciiLoader.Ascii(path)
+    references = list()
+    desc = b''
+    with asc.open() as f:
+        for line in f:
+            if line.startswith(HEADER_END):
+                break
+
+            if line.startswith(b'file '):
+                desc = line
+            elif desc and line.startswith(b'\t'):
+                desc += line
+            else:
+                continue
+
+            if not desc.rstrip().endswith(b';'):
+                continue
+
+            block = asciiLoader.new(asc, -1, asciiLoader.decode(desc), len(desc))
+            desc = b''
+            if block.is_ref:
+                references.append((
+                    resolve_path(block.path, asc.dir),
+                    block.namespace,
+                    block.ref_node,
+                    block.typ
+                ))
+
+    return references
+
+
+def get_cache_key(path):
+    """
+    Get the cache key of a file
+
+    :param path: str. file path
+    :return: tuple or None. None if the file does not exist
+    """
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return path, stat.st_size, stat.st_mtime
+
+
+def load_references(paths, workers=None):
+    """
+    Read the references of many files, files already in the cache are not
+    parsed again
+
+    :param paths: list of str. maya ascii file paths
+    :param workers: int. number of worker processes, read in the current
+                    process if it is 0
+    :return: dict. path to its list of references
+    """
+    results = dict()
+    pending = dict()
+    for path in set(paths):
+        key = get_cache_key(path)
+        if key is None:
+            results[path] = list()
+        elif key in CACHE:
+            results[path] = CACHE[key]
+        else:
+            pending[path] = key
+
+    if not pending:
+        return results
+
+    if workers == 0 or len(pending) == 1:
+        loaded = dict((path, read_references(path)) for path in pending)
+    else:
+        with futures.ProcessPoolExecutor(workers) as executor:
+            loaded = dict(zip(pending, executor.map(read_references, pending)))
+
+    for path, references in loaded.items():
+        CACHE[pending[path]] = references
+        results[path] = references
+    return results
+
+
+class ReferenceFile(ReferenceFileBase):
+    @classmethod
+    def from_path(cls, path, depth=3, workers=None):
+        """
+        Create reference file data objects of the whole reference tree
+
+        :param path: str. top level maya ascii file path
+        :param depth: int. maximum nesting level of references to load
+        :param workers: int. number of worker processes
+        :return: list of ReferenceFile. the top level file followed by its
+                 references in depth first order, parent is the index of
+                 the referencing file in the list
+        """
+        path = os.path.normpath(os.path.abspath(path))
+
+        # load unique files level by level
+        references = dict()
+        paths = [path]
+        for _ in range(depth + 1):
+            references.update(load_references(paths, workers))
+            paths = set(
+                ref[0]
+                for loaded in paths
+                for ref in references[loaded]
+                if ref[3] == 'mayaAscii' and ref[0] not in references
+            )
+            if not paths:
+                break
+
+        def get_size(file_path):
+            return os.path.getsize(file_path) if os.path.isfile(file_path) else 0
+
+        results = list()
+        stack = [(-1, '', path, 'mayaAscii', 0, list())]
+        while stack:
+            parent, namespace, file_path, typ, level, ancestors = stack.pop()
+            results.append(cls(
+                namespace, file_path, typ, level, get_size(file_path), parent))
+
+            # a file referencing its ancestor would never end
+            if file_path in ancestors:
+                continue
+            if level >= depth or file_path not in references:
+                continue
+
+            for ref_path, ref_namespace, _, ref_typ in reversed(
+                    references[file_path]):
+                stack.append((
+                    len(results)-1,
+                    ref_namespace,
+                    ref_path,
+                    ref_typ,
+                    level+1,
+                    ancestors + [file_path]
+                ))
+
+        return results
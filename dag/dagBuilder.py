@@ -11,67 +11,97 @@ root = builder.build(blocks)
 
 `progress_changed` signal can be connected to progress bar to reflect load
 progress and `event_occurred` can be connected to status bar to display
-event message
+event message, both are plain python signals so building does not need Qt.
+Progress is throttled and `rate_changed` reports the nodes built per second
+and the seconds left
 """
 
 
 import time
 
-from Qt import QtCore
-
 from . import dagNode
-from .. import asciiBlock
+from .. import asciiBlock, asciiProgress, asciiSignal, asciiTrace
+from ..dg import dgGraph
 
 
-class Builder(QtCore.QObject):
+class Builder(object):
     """
     Builder for creating Dag node tree
     this should be the standard way of creating a tree of Dag nodes consists
     with an ascii file, which we will need to use the asciiLoader.py to
     generate ascii data blocks.
     """
-    progress_changed = QtCore.Signal(int)
-    event_occurred = QtCore.Signal(str)
+    def __init__(self):
+        """
+        Initialization
+        """
+        self.progress_changed = asciiSignal.Signal(int)
+        self.rate_changed = asciiSignal.Signal(float, float)
+        self.event_occurred = asciiSignal.Signal(str)
 
-    def build(self, blocks):
+    def build(self, blocks, graph=None):
         """
         Create node networks from Ascii data blocks
 
         :param blocks: list of AsciiBlock(s). ascii block starting with 'createNode'
+        :param graph: dgGraph.DependGraph or None. DG network of the blocks
+                      to share with other analyses, built if None
         :return: DagNode. root dag node
         """
-        # filter data blocks to NodeBlock type
-        blocks = [b for b in blocks if isinstance(b, asciiBlock.NodeBlock)]
-
         start_time = time.time()
         self.event_occurred.emit('Building DAG Tree')
-        root_node = dagNode.DagNode()
-        nodes = list()
-
-        for i, block in enumerate(blocks):
-            if not isinstance(block, asciiBlock.NodeBlock):
-                raise TypeError
-
-            node = dagNode.DagNode(block.name, block.typ, block.size, block.index)
-            nodes.append(node)
-            self.progress_changed.emit(int(float(len(nodes)) / len(blocks) * 100))
-
-            parent = None
-            if block.parent:
-                while i > 0:
-                    i -= 1
-                    # sometimes the name contains '|'
-                    if block.parent.endswith(blocks[i].name):
-                        parent = nodes[i]
-                        break
-
-                if not parent:
-
-                    raise ValueError('Parent {} not found'.format(block.parent))
-            else:
-                parent = root_node
 
-            node.set_parent(parent)
+        with asciiTrace.span('build') as build_span:
+            # upstream sizes follow the order of NodeBlock
+            if graph is None:
+                graph = dgGraph.DependGraph(blocks)
+            upstream_sizes = graph.get_upstream_sizes()
+
+            # filter data blocks to NodeBlock type
+            blocks = [b for b in blocks if isinstance(b, asciiBlock.NodeBlock)]
+
+            root_node = dagNode.DagNode()
+            nodes = list()
+
+            progress = asciiProgress.Progress(len(blocks))
+            progress.progress_changed.connect(self.progress_changed.emit)
+            progress.rate_changed.connect(self.rate_changed.emit)
+            next_report = progress.start()
+
+            for i, block in enumerate(blocks):
+                if not isinstance(block, asciiBlock.NodeBlock):
+                    raise TypeError
+
+                node = dagNode.DagNode(
+                    block.name,
+                    block.typ,
+                    block.size,
+                    block.index,
+                    upstream_sizes[i]
+                )
+                nodes.append(node)
+                if len(nodes) >= next_report:
+                    next_report = progress.update(len(nodes))
+
+                parent = None
+                if block.parent:
+                    while i > 0:
+                        i -= 1
+                        # sometimes the name contains '|'
+                        if block.parent.endswith(blocks[i].name):
+                            parent = nodes[i]
+                            break
+
+                    if not parent:
+
+                        raise ValueError('Parent {} not found'.format(block.parent))
+                else:
+                    parent = root_node
+
+                node.set_parent(parent)
+            progress.finish()
+            build_span.add(
+                bytes=sum(block.size for block in blocks), blocks=len(nodes))
 
         time_elapsed = round(time.time() - start_time, 3)
         self.event_occurred.emit('Build Complete: {}s'.format(time_elapsed))
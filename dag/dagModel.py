@@ -8,6 +8,24 @@ from Qt import QtWidgets, QtCore, QtGui
 from . import dagNode
 
 
+# background colors of compared nodes
+GROWTH_COLOR = QtGui.QColor(225, 87, 89, 90)
+SHRINK_COLOR = QtGui.QColor(89, 161, 79, 90)
+
+
+def format_size(size):
+    """
+    Format a size in bytes into readable text
+
+    :param size: int. size in bytes
+    :return: str. size in MB or KB
+    """
+    if size > 1024 * 1024:
+        return '{}MB'.format(round(size/1024.0/1024, 2))
+
+    return '{}KB'.format(round(size/1024.0, 2))
+
+
 class DagModel(QtCore.QAbstractItemModel):
     sort_role = QtCore.Qt.UserRole
     filter_role = QtCore.Qt.UserRole + 1
@@ -36,7 +54,7 @@ class DagModel(QtCore.QAbstractItemModel):
         """
         Override
         """
-        return 4
+        return 7
 
     def flags(self, index):
         """
@@ -57,19 +75,18 @@ class DagModel(QtCore.QAbstractItemModel):
             elif index.column() == 1:
                 return node.typ
             elif index.column() == 2:
-                if node.total_size > 1024 * 1024:
-                    return '{}MB'.format(
-                        round(node.total_size/1024.0/1024, 2)
-                    )
-
-                return '{}KB'.format(
-                    round(node.total_size/1024.0, 2)
-                )
+                return format_size(node.total_size)
             elif index.column() == 3:
                 return round(
                     node.total_size / float(self.__root_node.total_size) * 100,
                     1
                     )
+            elif index.column() == 4:
+                return format_size(node.upstream_size)
+            elif index.column() == 5:
+                return node.vertices or ''
+            elif index.column() == 6:
+                return node.faces or ''
 
         elif role == DagModel.sort_role:
             if index.column() == 0:
@@ -80,10 +97,28 @@ class DagModel(QtCore.QAbstractItemModel):
                 return node.total_size
             elif index.column() == 3:
                 return node.total_size
+            elif index.column() == 4:
+                return node.upstream_size
+            elif index.column() == 5:
+                return node.vertices
+            elif index.column() == 6:
+                return node.faces
 
         elif role == DagModel.filter_role:
             return node.name
 
+        elif role == QtCore.Qt.BackgroundRole:
+            if node.delta is None:
+                return None
+            elif node.delta > 0:
+                return QtGui.QBrush(GROWTH_COLOR)
+            elif node.delta < 0:
+                return QtGui.QBrush(SHRINK_COLOR)
+
+        elif role == QtCore.Qt.ToolTipRole:
+            if node.delta is not None:
+                return '{:+d} bytes'.format(node.delta)
+
         elif role == QtCore.Qt.SizeHintRole:
             return QtCore.QSize(-1, 22)
 
@@ -98,8 +133,14 @@ class DagModel(QtCore.QAbstractItemModel):
                 return "Type"
             elif section == 2:
                 return "Size"
-            else:
+            elif section == 3:
                 return "Percentage"
+            elif section == 4:
+                return "History"
+            elif section == 5:
+                return "Vertices"
+            else:
+                return "Faces"
 
         elif role == QtCore.Qt.InitialSortOrderRole:
             return QtCore.Qt.DescendingOrder
@@ -48,18 +48,25 @@ class DagNode(object):
     """
     Maya Dag node representation
     """
-    def __init__(self, name='', typ='', size=0, index=-1):
+    def __init__(self, name='', typ='', size=0, index=-1, upstream_size=0):
         """
         Initialization
 
         :param name: str. dag node name
         :param typ: str. dag node type
         :param size: int. dag node size in bytes
+        :param index: int. start line number of the node ascii block
+        :param upstream_size: int. size in bytes of the node and its
+                              upstream DG network (construction history)
         """
         self.__name = name
         self.__typ = typ
         self.__size = size
         self.__index = index
+        self.__upstream_size = upstream_size
+        self.__vertices = 0
+        self.__faces = 0
+        self.__delta = None
 
         self.__parent = None
         self.__children = list()
@@ -81,6 +88,34 @@ class DagNode(object):
     def index(self):
         return self.__index
 
+    @property
+    def upstream_size(self):
+        """
+        Size of the node itself and its upstream DG network, this is not
+        related to the dag hierarchy
+
+        :return: int. upstream size in bytes
+        """
+        return self.__upstream_size
+
+    @property
+    def vertices(self):
+        return self.__vertices
+
+    @property
+    def faces(self):
+        return self.__faces
+
+    @property
+    def delta(self):
+        """
+        Size difference of the node compared to another version of the
+        file, None when the node is unchanged or not compared
+
+        :return: int or None. size delta in bytes
+        """
+        return self.__delta
+
     @property
     def parent(self):
         return self.__parent
@@ -144,6 +179,25 @@ class DagNode(object):
         parent.append_child(self)
         parent.add_size(self.__size)
 
+    def set_geometry(self, vertices, faces):
+        """
+        Set the geometry statistics of a shape node
+
+        :param vertices: int. vertex (or control vertex) count
+        :param faces: int. face count
+        """
+        self.__vertices = vertices
+        self.__faces = faces
+
+    def set_delta(self, delta):
+        """
+        Set the size difference of the node compared to another version
+        of the file
+
+        :param delta: int or None. size delta in bytes
+        """
+        self.__delta = delta
+
     def add_size(self, size):
         """
         Increase size of the current node, also propagate upwards to parents
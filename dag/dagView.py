@@ -5,7 +5,7 @@ A view module that supports Dag node for Model View Programming in Qt
 
 from Qt import QtWidgets, QtCore, QtGui
 
-from . import dagModel
+from . import dagModel, dagNode
 
 
 class DagView(QtWidgets.QTreeView):
@@ -44,6 +44,40 @@ class DagView(QtWidgets.QTreeView):
         self.sortByColumn(self.PERCENT_COLUMN, QtCore.Qt.DescendingOrder)
         self.__make_children_persistent()
 
+    def select_nodes(self, indices):
+        """
+        Select and reveal the nodes created by certain ascii blocks
+
+        :param indices: set of int. start line numbers of the ascii blocks
+        """
+        model = self.proxy_model.sourceModel()
+        if not model:
+            return
+
+        selection = QtCore.QItemSelection()
+        for node in dagNode.get_children(model.get_node()):
+            if node.index not in indices:
+                continue
+
+            index = self.proxy_model.mapFromSource(
+                model.createIndex(node.row, 0, node))
+            if not index.isValid():
+                continue
+            selection.select(index, index)
+
+            parent = index.parent()
+            while parent.isValid():
+                self.expand(parent)
+                parent = parent.parent()
+
+        self.selectionModel().select(
+            selection,
+            QtCore.QItemSelectionModel.ClearAndSelect |
+            QtCore.QItemSelectionModel.Rows
+        )
+        if not selection.isEmpty():
+            self.scrollTo(selection.indexes()[0])
+
     def __make_children_persistent(self, index=QtCore.QModelIndex()):
         # TODO: only make persistent on items visible on screen
         for row in range(0, self.proxy_model.rowCount(index)):
@@ -83,6 +117,9 @@ class DagWidget(QtWidgets.QWidget):
     def update(self):
         self.ui_dag_view.update()
 
+    def select_nodes(self, indices):
+        self.ui_dag_view.select_nodes(indices)
+
     def clear(self):
         self.ui_filter_edit.setText('')
         self.ui_dag_view.clear()
@@ -97,8 +134,8 @@ class PercentageDelegate(QtWidgets.QItemDelegate):
         Override
         """
         editor = QtWidgets.QProgressBar(parent)
-        editor.setMinimum(0.0)
-        editor.setMaximum(100.0)
+        editor.setMinimum(0)
+        editor.setMaximum(100)
         return editor
 
     def setEditorData(self, editor, index):
@@ -129,7 +166,7 @@ class PercentageDelegate(QtWidgets.QItemDelegate):
             """.format(color)
         )
 
-        editor.setValue(model_value)
+        editor.setValue(int(model_value))
         editor.setFormat('{}%'.format(model_value))
         if model_value < 0.1:
             editor.setFormat('<0.1%')
@@ -0,0 +1,14 @@
+"""
+This package is used for building the DG (dependency graph) network of a
+maya ascii file, representing the attribute connections between nodes.
+
+It is de-coupled from the dag package, which only represents the parent
+child hierarchy. A DG connection is made from a 'connectAttr' mel command:
+
+connectAttr "polyCube1.out" "pCubeShape1.i";
+
+which makes 'polyCube1' an upstream (history) node of 'pCubeShape1'.
+Node name and size are taken from the 'createNode' ascii blocks, nodes that
+are connected but never created in the file (e.g. ':time1' or referenced
+nodes) are kept as external nodes with no size.
+"""
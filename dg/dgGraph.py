@@ -0,0 +1,333 @@
+"""
+Module for building a DG network from ascii data blocks and analysing it
+
+Example
+```python
+graph = DependGraph(blocks)
+
+# size of each node and everything upstream of it, in block order
+sizes = graph.get_upstream_sizes()
+```
+
+Node index of the graph follows the order of 'createNode' blocks, so the
+first `len(node_blocks)` entries line up with the dag builder nodes, external
+nodes are appended afterwards.
+"""
+
+from collections import deque
+
+from .. import asciiBlock
+
+
+def get_node_name(plug):
+    """
+    Get the node portion of a plug
+
+    :param plug: str. attribute plug (e.g. "|group1|pCube1.tx", ":time1.o")
+    :return: str. node name or path (e.g. "|group1|pCube1", "time1")
+    """
+    name = plug.partition('.')[0]
+    # leading colon refers to the root namespace
+    if name.startswith(':'):
+        name = name[1:]
+    return name
+
+
+def get_components(starts, targets):
+    """
+    Find strongly connected components with an iterative Tarjan algorithm,
+    components are returned in reverse topological order, which means every
+    component comes after all the components it can reach.
+
+    :param starts: list of int. CSR offsets, edges of node i are
+                   targets[starts[i]:starts[i+1]]
+    :param targets: list of int. CSR edge targets
+    :return: tuple (list of int, list of list). component id of each node,
+             and member nodes of each component
+    """
+    count = len(starts) - 1
+    order = [-1] * count
+    low = [0] * count
+    on_stack = [False] * count
+    component_ids = [-1] * count
+    components = list()
+    stack = list()
+    counter = 0
+
+    for root in range(count):
+        if order[root] != -1:
+            continue
+
+        order[root] = low[root] = counter
+        counter += 1
+        stack.append(root)
+        on_stack[root] = True
+        work = [[root, starts[root]]]
+
+        while work:
+            frame = work[-1]
+            node, ptr = frame
+            if ptr < starts[node+1]:
+                frame[1] += 1
+                target = targets[ptr]
+                if order[target] == -1:
+                    order[target] = low[target] = counter
+                    counter += 1
+                    stack.append(target)
+                    on_stack[target] = True
+                    work.append([target, starts[target]])
+                elif on_stack[target] and order[target] < low[node]:
+                    low[node] = order[target]
+                continue
+
+            work.pop()
+            if work and low[node] < low[work[-1][0]]:
+                low[work[-1][0]] = low[node]
+
+            if low[node] == order[node]:
+                component_id = len(components)
+                members = list()
+                while True:
+                    member = stack.pop()
+                    on_stack[member] = False
+                    component_ids[member] = component_id
+                    members.append(member)
+                    if member == node:
+                        break
+                components.append(members)
+
+    return component_ids, components
+
+
+class DependGraph(object):
+    """
+    Dependency graph representation, nodes are stored as indices and
+    connections as flat source and destination index lists
+    """
+    def __init__(self, blocks):
+        """
+        Initialization
+
+        :param blocks: list of AsciiBlock. normally generated from
+                       'asciiLoader.py'
+        """
+        self.__names = list()
+        self.__typs = list()
+        self.__sizes = list()
+        self.__parents = list()
+        self.__shared = list()
+        self.__lookup = dict()
+        self.__node_count = 0
+
+        self.__sources = list()
+        self.__dests = list()
+
+        self.__upstream_sizes = None
+
+        paths = list()
+        for block in blocks:
+            if not isinstance(block, asciiBlock.NodeBlock):
+                continue
+
+            path = '|' + block.name
+            parent = None
+            if block.parent:
+                parent = self.find(block.parent)
+                if parent is not None:
+                    path = paths[parent] + path
+
+            self.__lookup.setdefault(block.name, len(self.__names))
+            self.__lookup.setdefault(path, len(self.__names))
+            paths.append(path)
+            self.__names.append(block.name)
+            self.__typs.append(block.typ)
+            self.__sizes.append(block.size)
+            self.__parents.append(-1 if parent is None else parent)
+            self.__shared.append('-s' in block.args)
+
+        self.__node_count = len(self.__names)
+
+        for block in blocks:
+            if not isinstance(block, asciiBlock.ConnectionBlock):
+                continue
+
+            self.__sources.append(self.__get_or_add(get_node_name(block.source)))
+            self.__dests.append(self.__get_or_add(get_node_name(block.dest)))
+
+    @property
+    def count(self):
+        """
+        Number of nodes in the graph, including external nodes
+
+        :return: int. node count
+        """
+        return len(self.__names)
+
+    @property
+    def node_count(self):
+        """
+        Number of nodes created in the file, these are the first nodes of
+        the graph following the order of 'createNode' blocks
+
+        :return: int. created node count
+        """
+        return self.__node_count
+
+    @property
+    def edge_count(self):
+        return len(self.__sources)
+
+    def name(self, index):
+        return self.__names[index]
+
+    def typ(self, index):
+        return self.__typs[index]
+
+    def size(self, index):
+        return self.__sizes[index]
+
+    def parent(self, index):
+        """
+        Dag parent of a node
+
+        :param index: int. node index
+        :return: int. parent node index, -1 if the node has no parent
+        """
+        if self.is_external(index):
+            return -1
+        return self.__parents[index]
+
+    def is_shared(self, index):
+        """
+        Whether the node is created as a shared node ('createNode -s'),
+        which are the default nodes of a scene (e.g. "persp", "lightLinker1")
+
+        :param index: int. node index
+        :return: bool.
+        """
+        if self.is_external(index):
+            return False
+        return self.__shared[index]
+
+    def is_external(self, index):
+        """
+        Whether the node is only connected to but never created in the file
+
+        :param index: int. node index
+        :return: bool.
+        """
+        return index >= self.__node_count
+
+    def find(self, name):
+        """
+        Find node index by name or dag path
+
+        :param name: str. node name or path (e.g. "pCube1", "|group1|pCube1")
+        :return: int or None. node index
+        """
+        if name in self.__lookup:
+            return self.__lookup[name]
+        if '|' in name:
+            return self.__lookup.get(name.rsplit('|', 1)[-1])
+        return None
+
+    def get_adjacency(self, upstream=True):
+        """
+        Get the graph adjacency in compressed sparse row form
+
+        :param upstream: bool. whether edges point from destination node
+                         to source node, otherwise from source to destination
+        :return: tuple (list of int, list of int). starts and targets,
+                 neighbours of node i are targets[starts[i]:starts[i+1]]
+        """
+        if upstream:
+            heads, tails = self.__dests, self.__sources
+        else:
+            heads, tails = self.__sources, self.__dests
+
+        starts = [0] * (self.count + 1)
+        for head in heads:
+            starts[head+1] += 1
+        for i in range(self.count):
+            starts[i+1] += starts[i]
+
+        targets = [0] * len(heads)
+        fill = starts[:-1]
+        for head, tail in zip(heads, tails):
+            targets[fill[head]] = tail
+            fill[head] += 1
+
+        return starts, targets
+
+    def get_upstream_sizes(self):
+        """
+        Get the size of each node together with everything upstream of it
+        (its construction history and input network)
+
+        Cycles are collapsed into strongly connected components, and each
+        component total is memoized, so the whole graph is solved in a
+        single linear pass. A component shared by several branches of the
+        same network is counted once per branch, so the value is an upper
+        bound on diamond shaped networks, use `get_upstream()` for the exact
+        node set of a single node.
+
+        :return: list of int. upstream size of each node, indexed by node
+        """
+        if self.__upstream_sizes is not None:
+            return self.__upstream_sizes
+
+        starts, targets = self.get_adjacency(upstream=True)
+        component_ids, components = get_components(starts, targets)
+
+        # components come after everything upstream of them
+        totals = [0] * len(components)
+        seen = [-1] * len(components)
+        for component_id, members in enumerate(components):
+            seen[component_id] = component_id
+            total = 0
+            for member in members:
+                total += self.__sizes[member]
+                for ptr in range(starts[member], starts[member+1]):
+                    upstream_id = component_ids[targets[ptr]]
+                    if seen[upstream_id] != component_id:
+                        seen[upstream_id] = component_id
+                        total += totals[upstream_id]
+            totals[component_id] = total
+
+        self.__upstream_sizes = [totals[i] for i in component_ids]
+        return self.__upstream_sizes
+
+    def get_upstream(self, index):
+        """
+        Get the exact set of nodes upstream of a node, including itself
+
+        :param index: int. node index
+        :return: list of int. upstream node indices
+        """
+        starts, targets = self.get_adjacency(upstream=True)
+        visited = {index}
+        queue = deque([index])
+        while queue:
+            node = queue.popleft()
+            for target in targets[starts[node]:starts[node+1]]:
+                if target not in visited:
+                    visited.add(target)
+                    queue.append(target)
+        return sorted(visited)
+
+    def __get_or_add(self, name):
+        """
+        Get a node index by name, nodes that are not created in the file
+        are added as external nodes
+
+        :param name: str. node name or path
+        :return: int. node index
+        """
+        index = self.find(name)
+        if index is None:
+            index = len(self.__names)
+            self.__lookup[name] = index
+            self.__names.append(name)
+            self.__typs.append('')
+            self.__sizes.append(0)
+        return index
@@ -0,0 +1,118 @@
+"""
+Module used to find unused (orphan) DG nodes from ascii data blocks
+
+Scripting:
+```
+# nodes that could be deleted and the bytes it would save
+orphans = Orphan.from_blocks(blocks)
+print(get_savings(orphans))
+```
+
+A node is considered in use when it has a downstream connection path to
+a dag node, a shading group, a default/shared node or a node that is not
+created in the file (default lists like ':defaultRenderingList1' or
+referenced nodes). For example, the 'orphan_curve' is unused since it is
+not connected to anything:
+
+```
+createNode animCurveTU -n "orphan_curve";
+    rename -uid "AE9B1A73-4D2C-58A4-A0C2-1496C21F6C1A";
+    setAttr -s 2 ".ktv[0:1]"  1 0 10 1;
+```
+
+"""
+
+from collections import namedtuple
+
+from . import dgGraph
+
+
+# node types which are used by the scene on their own
+DAG_TYPES = {'transform', 'joint'}
+KEEP_TYPES = {
+    'shadingEngine',
+    'script',
+    'reference',
+    'audio',
+    'lightLinker',
+    'displayLayerManager',
+    'displayLayer',
+    'renderLayerManager',
+    'renderLayer',
+    'nodeGraphEditorInfo',
+    'sequenceManager',
+    'sequencer',
+    'shot',
+}
+
+
+OrphanBase = namedtuple('OrphanBase', ['name', 'typ', 'size'])
+
+
+def get_savings(orphans):
+    """
+    Get the total size of orphan nodes
+
+    :param orphans: list of Orphan.
+    :return: int. size in bytes that could be saved by cleaning up
+    """
+    return sum(orphan.size for orphan in orphans)
+
+
+def get_orphans(graph):
+    """
+    Find the nodes without a downstream path to a node in use, in a linear
+    pass starting from the nodes in use and walking upstream
+
+    :param graph: dgGraph.DependGraph. the DG network
+    :return: list of int. orphan node indices
+    """
+    is_parent = [False] * graph.count
+    for index in range(graph.node_count):
+        parent = graph.parent(index)
+        if parent != -1:
+            is_parent[parent] = True
+
+    used = [False] * graph.count
+    queue = list()
+    for index in range(graph.count):
+        if (graph.is_external(index)
+                or graph.is_shared(index)
+                or graph.parent(index) != -1
+                or is_parent[index]
+                or graph.typ(index) in DAG_TYPES
+                or graph.typ(index) in KEEP_TYPES):
+            used[index] = True
+            queue.append(index)
+
+    starts, targets = graph.get_adjacency(upstream=True)
+    while queue:
+        node = queue.pop()
+        for ptr in range(starts[node], starts[node+1]):
+            target = targets[ptr]
+            if not used[target]:
+                used[target] = True
+                queue.append(target)
+
+    return [i for i in range(graph.node_count) if not used[i]]
+
+
+class Orphan(OrphanBase):
+    @classmethod
+    def from_blocks(cls, blocks, graph=None):
+        """
+        Create orphan node data objects from ascii data blocks
+
+        :param blocks: list of AsciiBlock.
+                       normally generated from 'asciiLoader.py'
+        :param graph: dgGraph.DependGraph or None. DG network of the blocks
+                      already built for another analysis, built if None
+        :return: list of Orphan. unused node objects ranked by size
+        """
+        if graph is None:
+            graph = dgGraph.DependGraph(blocks)
+        orphans = [
+            cls(graph.name(i), graph.typ(i), graph.size(i))
+            for i in get_orphans(graph)
+        ]
+        return sorted(orphans, key=lambda orphan: orphan.size, reverse=True)
@@ -0,0 +1,130 @@
+"""
+Small maya ascii scenes written the way maya exports them, shared by the
+tests
+"""
+
+
+HEADER = '''//Maya ASCII 2018ff09 scene
+//Name: test.ma
+requires maya "2018ff09";
+currentUnit -l centimeter -a degree -t film;
+fileInfo "application" "maya";
+'''
+
+CURVE = '''createNode transform -n "curve1";
+createNode nurbsCurve -n "curveShape1" -p "curve1";
+\tsetAttr -k off ".v";
+\tsetAttr ".cc" -type "nurbsCurve"
+\t\t1 3 0 no 3
+\t\t4 0 1 2 3
+\t\t4
+\t\t0 0 0
+\t\t1.0000000000000002 0 0
+\t\t1.0000000000000002 0 1.0000000000000002
+\t\t0 0 1.0000000000000002
+\t\t;
+'''
+
+BIND_POSE = '''createNode dagPose -n "bindPose1";
+\tsetAttr -s 2 ".wm";
+\tsetAttr ".wm[0]" -type "matrix" 1 0 0 0 0 1 0 0 0 0 1 0 0 0 0 1;
+\tsetAttr -s 2 ".xm";
+\tsetAttr ".xm[0]" -type "matrix" "xform" 1 1 1 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0
+\t\t 0 0 0 0 0 0 0 0 0 0 1 0 0 0 1 1 1 1 yes;
+\tsetAttr ".xm[1]" -type "matrix" "xform" 1 1 1 0 0 0 0 0 2.5000000000000004 0
+\t\t 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 1 0 0 0 1 1 1 1 yes;
+\tsetAttr ".bp" yes;
+'''
+
+ANIM_CURVE = '''createNode animCurveTL -n "pPlane1_translateX";
+\tsetAttr ".tan" 18;
+\tsetAttr ".wgt" no;
+\tsetAttr -s 4 ".ktv[0:3]"  1 0 10 0 20 0 30 5;
+'''
+
+REFERENCE = '''createNode reference -n "rigRN";
+\tsetAttr ".ed" -type "dataReferenceEdits" 
+\t\t"rigRN"
+\t\t"rigRN" 0
+\t\t"rigRN" 2
+\t\t2 "|rig:ctrl" "translate" " -type \\"double3\\" 1 0 0"
+\t\t3 "|rig:ctrl.instObjGroups" "rig:blinn1SG.dagSetMembers" "-na";
+'''
+
+
+def get_plane(name, divisions):
+    """
+    Get the blocks of a polygon plane with a transform and its mesh shape
+
+    :param name: str. transform name
+    :param divisions: int. faces along each side
+    :return: str. mel commands
+    """
+    side = divisions + 1
+    vertices = list()
+    uvs = list()
+    for row in range(side):
+        for column in range(side):
+            x = column / float(divisions) - 0.5
+            z = 0.5 - row / float(divisions)
+            vertices.append('{!r} 0 {!r}'.format(x, z))
+            uvs.append('{!r} {!r}'.format(
+                column / float(divisions), row / float(divisions)))
+
+    # horizontal edges, then vertical edges
+    edges = list()
+    for row in range(side):
+        for column in range(divisions):
+            i = row * side + column
+            edges.append('{} {} 0'.format(i, i + 1))
+    vertical = len(edges)
+    for row in range(divisions):
+        for column in range(side):
+            i = row * side + column
+            edges.append('{} {} 0'.format(i, i + side))
+
+    faces = list()
+    for row in range(divisions):
+        for column in range(divisions):
+            bottom = row * divisions + column
+            top = bottom + divisions
+            left = vertical + row * side + column
+            i = row * side + column
+            faces.append('\t\tf 4 {} {} {} {}\n\t\tmu 0 4 {} {} {} {}'.format(
+                bottom, left + 1, -(top + 1), -(left + 1),
+                i, i + 1, i + side + 1, i + side))
+
+    count = len(faces)
+    return '\n'.join([
+        'createNode transform -n "{}";'.format(name),
+        'createNode mesh -n "{0}Shape" -p "{0}";'.format(name),
+        '\tsetAttr -k off ".v";',
+        '\tsetAttr ".uvst[0].uvsn" -type "string" "map1";',
+        '\tsetAttr -s {0} ".uvst[0].uvsp[0:{1}]" -type "float2" {2};'.format(
+            len(uvs), len(uvs) - 1, ' '.join(uvs)),
+        '\tsetAttr ".cuvs" -type "string" "map1";',
+        '\tsetAttr -s {0} ".vt[0:{1}]"  {2};'.format(
+            len(vertices), len(vertices) - 1, ' '.join(vertices)),
+        '\tsetAttr -s {0} ".ed[0:{1}]"  {2};'.format(
+            len(edges), len(edges) - 1, ' '.join(edges)),
+        '\tsetAttr -s {0} -ch {1} ".fc[0:{2}]" -type "polyFaces" \n{3};'.format(
+            count, count * 4, count - 1, '\n'.join(faces)),
+        '\tsetAttr ".cd" -type "dataPolyComponent" Index_Data Edge 0 ;',
+        ''
+    ])
+
+
+def write_scene(path, *bodies):
+    """
+    Write a scene made of the header and blocks
+
+    :param path: str. output .ma path
+    :param bodies: str. mel commands of the blocks
+    :return: str. the path
+    """
+    with open(path, 'w', newline='\n') as f:
+        f.write(HEADER)
+        for body in bodies:
+            f.write(body)
+        f.write('// End of test.ma\n')
+    return str(path)
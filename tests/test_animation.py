@@ -0,0 +1,57 @@
+from .. import asciiLoader
+from ..block import animation
+from . import scenes
+
+
+TRUNCATED = '''createNode animCurveTA -n "pPlane1_rotateY";
+\tsetAttr ".tan" 18;
+\tsetAttr ".wgt" no;
+\tsetAttr -s 3 ".ktv[0:2]"  1 0 10 45 20;
+'''
+
+NOT_NUMBER = '''createNode animCurveTU -n "pPlane1_visibility";
+\tsetAttr ".tan" 9;
+\tsetAttr ".wgt" no;
+\tsetAttr -s 2 ".ktv[0:1]"  1 1 10 on;
+'''
+
+SPLIT = '''createNode animCurveTL -n "pPlane1_translateY";
+\tsetAttr ".tan" 18;
+\tsetAttr ".wgt" no;
+\tsetAttr -s 4 ".ktv[0:1]"  1 2 10 2;
+\tsetAttr ".ktv[2:3]"  20 2 30 2;
+'''
+
+
+def load(tmp_path, *bodies):
+    return asciiLoader.Loader().load(
+        scenes.write_scene(tmp_path / 'anim.ma', *bodies))
+
+
+def test_key_table(tmp_path):
+    table = animation.KeyTable.from_blocks(
+        load(tmp_path, scenes.ANIM_CURVE, SPLIT))
+
+    assert table.names == ['pPlane1_translateX', 'pPlane1_translateY']
+    assert table.invalid == []
+    assert table.counts.tolist() == [4, 4]
+    assert table.times.tolist() == [1, 10, 20, 30, 1, 10, 20, 30]
+    assert table.get_static().tolist() == [False, True]
+    assert table.get_redundant_counts().tolist() == [1, 2]
+
+
+def test_malformed_curves(tmp_path):
+    blocks = load(tmp_path, scenes.ANIM_CURVE, TRUNCATED, SPLIT, NOT_NUMBER)
+    table = animation.KeyTable.from_blocks(blocks)
+
+    # malformed curves are left out, the valid ones keep their keys
+    assert table.names == ['pPlane1_translateX', 'pPlane1_translateY']
+    assert sorted(table.invalid) == ['pPlane1_rotateY', 'pPlane1_visibility']
+    assert table.values.tolist() == [0, 0, 0, 5, 2, 2, 2, 2]
+
+    curves = animation.AnimCurve.from_blocks(blocks)
+    assert [(curve.name, curve.keys, curve.start, curve.end)
+            for curve in curves] == [
+        ('pPlane1_translateX', 4, 1.0, 30.0),
+        ('pPlane1_translateY', 4, 1.0, 30.0),
+    ]
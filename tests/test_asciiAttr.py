@@ -0,0 +1,40 @@
+from .. import asciiAttr, asciiBlock, asciiLoader
+from . import scenes
+
+
+def get_details(path):
+    blocks = asciiLoader.Loader().load(path)
+    return dict(
+        (block.name, block.asc.read_bytes(block.offset, block.size))
+        for block in blocks if isinstance(block, asciiBlock.NodeBlock)
+    )
+
+
+def test_get_arrays_bind_pose(tmp_path):
+    path = scenes.write_scene(tmp_path / 'pose.ma', scenes.BIND_POSE)
+    arrays = asciiAttr.get_arrays(get_details(path)['bindPose1'])
+
+    assert arrays['.wm'].shape == (1, 4, 4)
+    assert arrays['.xm'].shape == (2, asciiAttr.XFORM_WIDTH)
+    assert arrays['.xm'][1, 8] == 2.5000000000000004
+    assert arrays['.xm'][:, -1].tolist() == [1, 1]
+    assert arrays['.bp'].tolist() == [1]
+
+
+def test_get_arrays_mesh(tmp_path):
+    path = scenes.write_scene(tmp_path / 'mesh.ma', scenes.get_plane('pPlane1', 4))
+    arrays = asciiAttr.get_arrays(get_details(path)['pPlane1Shape'])
+
+    assert arrays['.vt'].shape == (25, 3)
+    assert arrays['.ed'].shape == (40, 3)
+    counts, edges = arrays['.fc']
+    assert counts.tolist() == [4] * 16
+    assert len(edges) == 64
+    # words of the component data are not decoded
+    assert '.cd' not in arrays
+
+
+def test_to_array_words():
+    detail = b'createNode unknown -n "u";\n\tsetAttr ".a" 1 2 abc 3;\n'
+    statement = next(asciiAttr.iter_statements(detail))
+    assert asciiAttr.to_array(detail, statement) is None
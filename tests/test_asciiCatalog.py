@@ -0,0 +1,45 @@
+import os
+
+from .. import asciiCatalog
+from . import scenes
+
+
+def test_update_extractors(tmp_path):
+    path = scenes.write_scene(
+        tmp_path / 'shot.ma',
+        scenes.get_plane('pPlane1', 4),
+        scenes.ANIM_CURVE,
+        scenes.REFERENCE
+    )
+    catalog = asciiCatalog.Catalog(str(tmp_path / 'library.db'))
+    try:
+        assert catalog.update([path], workers=1) == 1
+
+        assert catalog.find_geometry(25) == [(path, 'pPlane1Shape', 25)]
+        assert catalog.find_geometry(26) == []
+        (scene, ref_node, edits, size), = catalog.find_edits(0)
+        assert (scene, ref_node, edits) == (path, 'rigRN', 2)
+        (scene, redundant, static), = catalog.find_redundant(1)
+        assert scene == path and redundant > 0 and static == 0
+
+        # unchanged files are skipped
+        assert catalog.update([path], workers=1) == 0
+    finally:
+        catalog.close()
+
+
+def test_update_deleted(tmp_path):
+    path = scenes.write_scene(tmp_path / 'shot.ma', scenes.ANIM_CURVE)
+    catalog = asciiCatalog.Catalog(str(tmp_path / 'library.db'))
+    try:
+        catalog.update([path], workers=1)
+        os.remove(path)
+
+        # an explicit path deleted since is removed instead of raising
+        assert catalog.get_stale([path]) == []
+        assert catalog.update([path], workers=1) == 0
+        assert catalog.query('SELECT COUNT(*) FROM scene') == [(0,)]
+        assert catalog.query('SELECT COUNT(*) FROM anim_curve') == [(0,)]
+        assert asciiCatalog.scan(path)['stat'] is None
+    finally:
+        catalog.close()
@@ -0,0 +1,107 @@
+import gzip
+
+import pytest
+
+from .. import asciiCompress, asciiLoader
+from . import scenes
+
+
+# uncompressed bytes of each zstd frame of a multi frame file
+FRAME_SIZE = 64 * 1024
+
+
+@pytest.fixture
+def small_span(monkeypatch):
+    # checkpoints every few kilobytes instead of every few megabytes
+    monkeypatch.setattr(asciiCompress, 'CHECKPOINT_SPAN', 16 * 1024)
+    monkeypatch.setattr(asciiCompress, 'READ_SIZE', 1024)
+
+
+def write_compressed(tmp_path, compression):
+    """
+    Write a scene and its compressed copy
+
+    :return: tuple (str, str). plain and compressed file paths
+    """
+    bodies = [scenes.get_plane('pPlane{}'.format(i), 20) for i in range(6)]
+    path = scenes.write_scene(
+        tmp_path / 'scene.ma', scenes.ANIM_CURVE, *bodies)
+    with open(path, 'rb') as f:
+        data = f.read()
+
+    if compression == 'gzip':
+        compressed = gzip.compress(data)
+        ext = '.gz'
+    else:
+        zstandard = pytest.importorskip('zstandard')
+        compressor = zstandard.ZstdCompressor()
+        size = FRAME_SIZE if compression == 'zstd frames' else len(data)
+        compressed = b''.join(
+            compressor.compress(data[i:i+size])
+            for i in range(0, len(data), size))
+        ext = '.zst'
+
+    compressed_path = path + ext
+    with open(compressed_path, 'wb') as f:
+        f.write(compressed)
+    return path, compressed_path
+
+
+def get_checkpoints(path):
+    """
+    Read a compressed file through once and get its checkpoint positions
+    """
+    index = asciiCompress.SeekIndex()
+    with asciiCompress.open_stream(path, index) as f:
+        for _line in f:
+            pass
+    assert index.is_complete
+    return [checkpoint.position for checkpoint in index.checkpoints]
+
+
+@pytest.mark.parametrize('compression, seekable', [
+    ('gzip', True),
+    # checkpoints only at frame boundaries, none in a single frame
+    ('zstd frames', True),
+    ('zstd', False),
+])
+def test_checkpoints(tmp_path, small_span, compression, seekable):
+    path, compressed_path = write_compressed(tmp_path, compression)
+    with open(path, 'rb') as f:
+        data = f.read()
+
+    # a frame ending the file records a checkpoint at the end
+    positions = [position for position in get_checkpoints(compressed_path)
+                 if 0 < position < len(data)]
+    assert bool(positions) == seekable
+    if compression == 'zstd frames':
+        assert all(position % FRAME_SIZE == 0 for position in positions)
+
+    plain = asciiLoader.Loader().load(path)
+    blocks = asciiLoader.Loader().load(compressed_path)
+    asc = blocks[0].asc
+    assert asc.size == len(data)
+    assert [(b.index, b.offset, b.size) for b in blocks] == \
+        [(b.index, b.offset, b.size) for b in plain]
+
+    # around each checkpoint and across the next one, in any order
+    for position in reversed(positions):
+        for offset in (position - 1, position, position + 1):
+            assert asc.read_bytes(offset, 64) == data[offset:offset+64]
+        start = max(position - 100, 0)
+        size = min(20 * 1024, len(data) - start)
+        assert asc.read_bytes(start, size) == data[start:start+size]
+
+    plain_asc = plain[0].asc
+    for block, expected in zip(blocks, plain):
+        if block.offset < 0:
+            continue
+        assert asc.read_bytes(block.offset, block.size) == \
+            data[block.offset:block.offset+block.size]
+        assert asc.read_detail(block.index) == \
+            plain_asc.read_detail(expected.index)
+
+    views = [(block.offset, bytes(view))
+             for block, view in plain_asc.iter_bytes(plain)]
+    assert [(block.offset, detail)
+            for block, detail in asc.iter_bytes(blocks)] == views
@@ -0,0 +1,62 @@
+from .. import asciiDiff
+from . import scenes
+
+
+SELECT = '''select -ne :time1;
+\tsetAttr ".o" 1;
+'''
+
+
+def get_changes(diffs):
+    return sorted((d.status, d.command, d.name) for d in diffs)
+
+
+def test_diff_renamed(tmp_path):
+    old = scenes.write_scene(
+        tmp_path / 'old.ma', scenes.get_plane('pPlane1', 4), scenes.CURVE)
+    new = scenes.write_scene(
+        tmp_path / 'new.ma', scenes.get_plane('pPlane2', 4), scenes.CURVE)
+    diffs = asciiDiff.diff_files(old, new)
+
+    # renamed nodes are told apart, the untouched curve is aligned
+    assert get_changes(diffs) == [
+        (asciiDiff.ADDED, 'createNode', 'pPlane2'),
+        (asciiDiff.ADDED, 'createNode', 'pPlane2Shape'),
+        (asciiDiff.REMOVED, 'createNode', 'pPlane1'),
+        (asciiDiff.REMOVED, 'createNode', 'pPlane1Shape'),
+    ]
+    assert sum(d.delta for d in diffs) == 0
+    assert all(d.index < 0 for d in diffs if d.status == asciiDiff.REMOVED)
+
+
+def test_diff_duplicated(tmp_path):
+    old = scenes.write_scene(
+        tmp_path / 'old.ma',
+        'createNode transform -n "A";\n',
+        'createNode transform -n "grp" -p "A";\n',
+        SELECT,
+        scenes.ANIM_CURVE
+    )
+    new = scenes.write_scene(
+        tmp_path / 'new.ma',
+        'createNode transform -n "A";\n',
+        'createNode transform -n "grp" -p "A";\n',
+        'createNode transform -n "B";\n',
+        'createNode transform -n "grp" -p "B";\n',
+        SELECT,
+        SELECT,
+        scenes.ANIM_CURVE.replace('30 5', '30 50')
+    )
+    diffs = asciiDiff.diff_files(old, new)
+
+    # same names under other parents and repeated blocks are aligned by
+    # occurrence, only the duplicates are added
+    assert get_changes(diffs) == [
+        (asciiDiff.ADDED, 'createNode', 'B'),
+        (asciiDiff.ADDED, 'createNode', 'grp'),
+        (asciiDiff.ADDED, 'select', 'select -ne :time1;'),
+        (asciiDiff.CHANGED, 'createNode', 'pPlane1_translateX'),
+    ]
+    changed, = [d for d in diffs if d.status == asciiDiff.CHANGED]
+    assert (changed.typ, changed.delta) == ('animCurveTL', 1)
+    assert asciiDiff.get_deltas(diffs)[changed.index] == 1
@@ -0,0 +1,53 @@
+from .. import asciiDuplicate, asciiLoader
+from . import scenes
+
+
+def get_rock(name, uid, divisions=6):
+    plane = scenes.get_plane(name, divisions)
+    # maya writes a uid after each 'createNode'
+    return plane.replace(
+        'createNode mesh -n "{0}Shape" -p "{0}";\n'.format(name),
+        'createNode mesh -n "{0}Shape" -p "{0}";\n'
+        '\trename -uid "{1}";\n'.format(name, uid))
+
+
+def load(tmp_path):
+    return asciiLoader.Loader().load(scenes.write_scene(
+        tmp_path / 'rocks.ma',
+        get_rock('rock1', 'A1D0E7C2-4F3B-8E51-2C6D-93B7F0E1A4C8'),
+        get_rock('rock2', '0B5E2F91-47C3-D6A0-1E8B-5C2A7F4D9E36'),
+        get_rock('rock3', '5C2A7F4D-47C3-D6A0-1E8B-0B5E2F919E36'),
+        get_rock('rock4', '9E365C2A-47C3-D6A0-1E8B-0B5E2F917F4D').replace(
+            '".cuvs" -type "string" "map1"', '".cuvs" -type "string" "map2"'),
+        scenes.get_plane('pPlane1', 7),
+    ))
+
+
+def test_get_body_start():
+    detail = (b'createNode mesh -n "rockShape1";\n'
+              b'\trename -uid "A1D0E7C2";\n'
+              b'\tsetAttr ".v" no;\n')
+    start = asciiDuplicate.get_body_start(memoryview(detail))
+    assert detail[start:] == b'\tsetAttr ".v" no;\n'
+    assert asciiDuplicate.get_body_start(b'createNode mesh;') == 16
+    assert asciiDuplicate.get_body_start(detail[:-18]) == len(detail) - 18
+
+
+def test_duplicates(tmp_path, monkeypatch):
+    blocks = load(tmp_path)
+    duplicates = asciiDuplicate.Duplicate.from_blocks(blocks, workers=0)
+
+    # the uid lines differ, the renamed map does not match
+    duplicate, = duplicates
+    assert (duplicate.name, duplicate.typ, duplicate.copies) == \
+        ('rock1Shape', 'mesh', 3)
+    assert duplicate.nodes == 'rock2Shape, rock3Shape'
+    assert asciiDuplicate.get_savings(duplicates) == duplicate.size * 2
+
+    # runs of a few blocks hashed across threads give the same groups
+    monkeypatch.setattr(asciiDuplicate, 'CHUNK_BYTES', duplicate.size * 2)
+    candidates = asciiDuplicate.get_candidates(blocks, 1024)
+    assert [len(chunk) for chunk in asciiDuplicate.get_chunks(candidates)] \
+        == [2, 2]
+    assert asciiDuplicate.Duplicate.from_blocks(blocks, workers=2) == \
+        duplicates
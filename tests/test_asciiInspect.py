@@ -0,0 +1,50 @@
+import gzip
+import json
+import os
+
+from .. import asciiInspect
+from . import scenes
+
+
+REFERENCE_FILE = '''file -r -ns "rig" -dr 1 -rfn "rigRN" -typ "mayaAscii" "C:/assets/rig.ma";
+'''
+
+
+def test_main_json_glob(tmp_path, capsys):
+    os.mkdir(str(tmp_path / 'sub'))
+    shot = scenes.write_scene(
+        tmp_path / 'shot.ma', REFERENCE_FILE, scenes.get_plane('pPlane1', 4))
+    anim = scenes.write_scene(tmp_path / 'sub' / 'anim.ma', scenes.ANIM_CURVE)
+    with open(anim, 'rb') as f:
+        data = f.read()
+    with open(anim + '.gz', 'wb') as f:
+        f.write(gzip.compress(data))
+    with open(str(tmp_path / 'sub' / 'broken.ma.gz'), 'wb') as f:
+        f.write(b'not compressed')
+    with open(str(tmp_path / 'notes.txt'), 'w') as f:
+        f.write('not a scene')
+
+    pattern = str(tmp_path / '**' / '*.ma*')
+    code = asciiInspect.main([pattern, '--json', '--workers', '2'])
+    reports = json.loads(capsys.readouterr().out)
+
+    # a failing file is reported, the others are still inspected
+    assert code == 1
+    assert [report['path'] for report in reports] == sorted(
+        [shot, anim, anim + '.gz', str(tmp_path / 'sub' / 'broken.ma.gz')])
+    by_path = dict((report['path'], report) for report in reports)
+    assert 'error' in by_path[str(tmp_path / 'sub' / 'broken.ma.gz')]
+
+    report = by_path[shot]
+    assert report['nodes'] == 2
+    assert report['size'] == os.path.getsize(shot)
+    assert [entry['name'] for entry in report['requires']] == ['maya']
+    assert [(entry['namespace'], entry['path'])
+            for entry in report['references']] == [('rig', 'C:/assets/rig.ma')]
+    assert dict(report['types'])['mesh'] > dict(report['types'])['transform']
+
+    # compressed reports match the plain file besides the path
+    plain, compressed = by_path[anim], by_path[anim + '.gz']
+    assert plain['types'] == [['animCurveTL', plain['types'][0][1]]]
+    compressed['path'] = anim
+    assert compressed == plain
@@ -0,0 +1,62 @@
+import pytest
+
+from .. import asciiLoader, asciiSpill
+from ..block import reference, requirement
+from . import scenes
+
+
+# a command on many lines, the first line ends with an unquoted argument
+REQUIRES = '''requires -nodeType "nodeA" -nodeType plugin
+\t\t -nodeType "nodeB" "myPlugin" "1.0";
+'''
+
+# a node description on many lines, trimmed to its first line
+NODE = '''createNode transform -n "wrapped"
+\t\t -p "t0";
+'''
+
+# header commands wrapped by maya are never trimmed
+FILE = '''file -r -ns "rig" -dr 1 -rfn "rigRN"
+\t\t -op "v=0;" -typ "mayaAscii" "C:/assets/rig.ma";
+'''
+
+
+def get_nodes(count):
+    return ''.join(
+        'createNode transform -n "t{}";\n\tsetAttr ".v" no;\n'.format(i)
+        for i in range(count)
+    )
+
+
+@pytest.mark.parametrize('budget, spilled', [
+    # trimmed only, then trimmed and spilled
+    (asciiLoader.BLOCK_COST * 60, False),
+    (asciiLoader.BLOCK_COST * 30, True),
+])
+def test_load_budget(tmp_path, budget, spilled):
+    path = scenes.write_scene(
+        tmp_path / 'budget.ma', get_nodes(40), NODE, REQUIRES, FILE)
+    full = asciiLoader.Loader().load(path)
+    blocks = asciiLoader.Loader().load(path, budget=budget)
+
+    assert isinstance(blocks, asciiSpill.SpilledBlocks) == spilled
+    assert len(blocks) == len(full)
+    for block, expected in zip(blocks, full):
+        assert (block.offset, block.size) == (expected.offset, expected.size)
+        if block.command in ('requires', 'file'):
+            assert block.args == expected.args
+
+    # node descriptions are trimmed to their first line
+    assert full[-3].parent == 't0'
+    assert blocks[-3].args == ['transform', '-n', 'wrapped']
+
+    (name, version), = [
+        (req.name, req.version)
+        for req in requirement.Requirement.from_blocks(blocks)
+        if req.name != 'maya'
+    ]
+    assert (name, version) == ('myPlugin', '1.0')
+    (ref,) = reference.Reference.from_blocks(blocks)
+    assert (ref.namespace, ref.path) == ('rig', 'C:/assets/rig.ma')
+    if spilled:
+        blocks.close()
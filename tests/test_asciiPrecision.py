@@ -0,0 +1,38 @@
+from .. import asciiLoader, asciiPrecision
+from . import scenes
+
+
+def test_get_literals_words():
+    assert asciiPrecision.get_literals(b'f 3 0 4 -3 mu 0 3 0 1 2') is None
+    assert asciiPrecision.get_literals(b'1 3 0 no 3') is None
+
+    lengths, values = asciiPrecision.get_literals(b'1.5 2 -0.25')
+    assert lengths.tolist() == [3, 5]
+    assert values.tolist() == [1.5, -0.25]
+
+
+def test_get_rounded_lengths():
+    # the example of the module docstring
+    lengths, values = asciiPrecision.get_literals(
+        b'-319.18663032960933 136.34364156607776 410.86015622114041')
+    assert lengths.sum() == 55
+    rounded = asciiPrecision.get_rounded_lengths(values, 6)
+    assert rounded.tolist() == [8, 7, 6]
+    assert rounded.sum() == 21
+
+
+def test_get_precision_mesh(tmp_path):
+    path = scenes.write_scene(
+        tmp_path / 'mesh.ma',
+        scenes.get_plane('pPlane1', 10),
+        scenes.CURVE
+    )
+    blocks = asciiLoader.Loader().load(path)
+    profiles = asciiPrecision.get_precision(blocks, digits=3)
+
+    attrs = dict(((p.typ, p.attr), p) for p in profiles)
+    assert ('mesh', '.fc') not in attrs
+    assert attrs[('mesh', '.vt')].count > 0
+    assert attrs[('mesh', '.uvst.uvsp')].savings > 0
+    # curve literals are still counted, around the 'no' flag
+    assert attrs[('nurbsCurve', '.cc')].count == 4
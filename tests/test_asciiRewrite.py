@@ -0,0 +1,88 @@
+from .. import asciiLoader, asciiRewrite
+from . import scenes
+
+
+COLLISION = '''createNode transform -n "A";
+createNode transform -n "B";
+createNode locator -n "grp" -p "A";
+createNode transform -n "grp" -p "B";
+createNode transform -n "kid" -p "|B|grp";
+createNode transform -n "other";
+connectAttr "|B|grp.t" "kid.t";
+connectAttr "|A|grp.wm" "other.opm";
+'''
+
+PLUGIN = '''requires -nodeType "aiOptions" "mtoa" "4.0.0";
+createNode aiOptions -s -n "defaultArnoldRenderOptions";
+createNode transform -n "keep";
+connectAttr "defaultArnoldRenderOptions.msg" ":defaultRenderGlobals.ao";
+'''
+
+NAMESPACE = '''createNode transform -n "rig:root";
+createNode transform -n "rig:arm:ctrl" -p "rig:root";
+createNode transform -n "rigged";
+createNode transform -n "world:root";
+connectAttr "rig:arm:ctrl.t" "rigged.t";
+select -ne ":rig:root";
+\tsetAttr ".v" no;
+'''
+
+
+def get_dropped(tmp_path, body, predicate):
+    blocks = asciiLoader.Loader().load(
+        scenes.write_scene(tmp_path / 'scene.ma', body))
+    return [block.desc.strip()
+            for block in asciiRewrite.get_dropped(blocks, predicate)]
+
+
+def test_dropped_name_collision(tmp_path):
+    dropped = get_dropped(
+        tmp_path, COLLISION, asciiRewrite.drop_types(['locator']))
+
+    # the kept transform sharing the locator short name keeps its children
+    assert dropped == [
+        'createNode locator -n "grp" -p "A";',
+        'connectAttr "|A|grp.wm" "other.opm";',
+    ]
+
+
+def test_dropped_plugin(tmp_path):
+    blocks = asciiLoader.Loader().load(
+        scenes.write_scene(tmp_path / 'scene.ma', PLUGIN))
+    dropped = [block.desc.strip() for block in asciiRewrite.get_dropped(
+        blocks, asciiRewrite.drop_plugin(blocks, 'mtoa'))]
+
+    assert dropped == [
+        'requires -nodeType "aiOptions" "mtoa" "4.0.0";',
+        'createNode aiOptions -s -n "defaultArnoldRenderOptions";',
+        'connectAttr "defaultArnoldRenderOptions.msg" '
+        '":defaultRenderGlobals.ao";',
+    ]
+
+
+def test_dropped_namespace(tmp_path):
+    dropped = get_dropped(
+        tmp_path, NAMESPACE, asciiRewrite.drop_namespace(':rig'))
+
+    # nested namespaces are dropped, a name only starting alike is kept
+    assert [desc.splitlines()[0] for desc in dropped] == [
+        'createNode transform -n "rig:root";',
+        'createNode transform -n "rig:arm:ctrl" -p "rig:root";',
+        'connectAttr "rig:arm:ctrl.t" "rigged.t";',
+        'select -ne ":rig:root";',
+    ]
+
+
+def test_rewrite(tmp_path):
+    path = scenes.write_scene(tmp_path / 'scene.ma', COLLISION)
+    blocks = asciiLoader.Loader().load(path)
+    dst = str(tmp_path / 'slim.ma')
+    dropped = asciiRewrite.rewrite(
+        blocks, dst, asciiRewrite.drop_types(['locator']))
+
+    with open(path, 'rb') as f:
+        content = f.read()
+    for block in dropped:
+        content = content.replace(block.desc.encode(), b'', 1)
+    with open(dst, 'rb') as f:
+        assert f.read() == content
@@ -0,0 +1,62 @@
+import gzip
+
+from .. import asciiLoader, asciiSearch
+from . import scenes
+
+
+def load(tmp_path, compressed=False):
+    path = scenes.write_scene(
+        tmp_path / 'scene.ma', scenes.ANIM_CURVE, scenes.CURVE)
+    if compressed:
+        with open(path, 'rb') as f:
+            data = f.read()
+        path += '.gz'
+        with open(path, 'wb') as f:
+            f.write(gzip.compress(data))
+    return asciiLoader.Loader().load(path)
+
+
+def get_hits(blocks, pattern):
+    return [(hit.name, hit.offset, hit.text)
+            for hit in asciiSearch.iter_hits(blocks, pattern)]
+
+
+def test_hits_block_boundaries(tmp_path):
+    blocks = load(tmp_path)
+    starts = dict((block.offset, block) for block in blocks)
+    with open(blocks[0].asc.path, 'rb') as f:
+        data = f.read()
+
+    # first and last bytes of a block belong to that block
+    hits = get_hits(blocks, r'(?m)^createNode \w+')
+    assert [name for name, _offset, _text in hits] == \
+        ['pPlane1_translateX', 'curve1', 'curveShape1']
+    assert all(offset in starts for _name, offset, _text in hits)
+
+    (name, offset, text), = get_hits(blocks, r'30 5;\n')
+    curve = starts[data.index(b'createNode animCurveTL')]
+    assert (name, text) == \
+        ('pPlane1_translateX', 'setAttr -s 4 ".ktv[0:3]"  1 0 10 0 20 0 30 5;')
+    assert offset + len('30 5;\n') == curve.offset + curve.size
+
+    # a match running into the next block is owned by the block it starts in
+    (name, offset, text), = get_hits(blocks, r'30 5;\s+createNode')
+    assert name == 'pPlane1_translateX'
+    assert text.splitlines() == [
+        'setAttr -s 4 ".ktv[0:3]"  1 0 10 0 20 0 30 5;',
+        'createNode transform -n "curve1";',
+    ]
+
+
+def test_hits_compressed(tmp_path):
+    plain = load(tmp_path)
+    compressed = load(tmp_path, compressed=True)
+
+    for pattern in (r'(?m)^createNode \w+', r'30 5;\n', r'(?m)1\.0+2$'):
+        assert get_hits(compressed, pattern) == get_hits(plain, pattern)
+    assert len(get_hits(plain, r'(?m)1\.0+2$')) == 2
+
+    hit, = asciiSearch.Hit.from_blocks(plain, 'CURVESHAPE', ignore_case=True)
+    assert (hit.name, hit.typ, hit.command) == \
+        ('curveShape1', 'nurbsCurve', 'createNode')
+    assert len(asciiSearch.Hit.from_blocks(plain, r'\d', limit=3)) == 3
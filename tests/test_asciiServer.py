@@ -0,0 +1,75 @@
+import asyncio
+import json
+import os
+import threading
+
+from .. import asciiServer
+from . import scenes
+
+
+def request(server, endpoint, path, **params):
+    query = '&'.join('{}={}'.format(key, value)
+                     for key, value in sorted(dict(params, path=path).items()))
+    line = 'GET /{}?{} HTTP/1.1\r\n'.format(endpoint, query)
+    return server.respond(line.encode('latin-1'))
+
+
+def get_results(responses):
+    assert [status for status, _body in responses] == [200] * len(responses)
+    return [json.loads(body.decode('utf-8'))['result']
+            for _status, body in responses]
+
+
+def test_concurrent_requests(tmp_path, monkeypatch):
+    path = scenes.write_scene(
+        tmp_path / 'scene.ma', scenes.get_plane('pPlane1', 4), scenes.CURVE)
+
+    # loads are held until every request is waiting on one
+    calls = list()
+    release = threading.Event()
+    load = asciiServer.load
+
+    def held_load(scene_path):
+        calls.append(scene_path)
+        assert release.wait(10)
+        return load(scene_path)
+    monkeypatch.setattr(asciiServer, 'load', held_load)
+
+    async def run():
+        server = asciiServer.Server(workers=4)
+        tasks = [
+            asyncio.ensure_future(request(server, 'summary', path)),
+            asyncio.ensure_future(request(server, 'dag', path, node='pPlane1')),
+            asyncio.ensure_future(request(server, 'node', path, name='curve1')),
+            asyncio.ensure_future(request(server, 'search', path, pattern='map1')),
+        ]
+        await asyncio.sleep(0)
+        release.set()
+        first = get_results(await asyncio.gather(*tasks))
+        assert len(calls) == 1
+
+        # answered from the cache
+        again = get_results([await request(server, 'node', path, name='curve1')])
+        assert len(calls) == 1 and again[0] == first[2]
+
+        # reloaded once the file changes
+        scenes.write_scene(
+            path, scenes.get_plane('pPlane1', 4), scenes.CURVE,
+            'createNode transform -n "added";\n')
+        stat = os.stat(path)
+        os.utime(path, (stat.st_atime, stat.st_mtime + 10))
+        added, = get_results([await request(server, 'node', path, name='added')])
+        assert len(calls) == 2
+
+        stats, = get_results([await request(server, 'stats', path)])
+        return first, added, stats
+
+    (summary, dag, node, hits), added, stats = asyncio.run(run())
+
+    assert dag['name'] == 'pPlane1'
+    assert [child['name'] for child in dag['children']] == ['pPlane1Shape']
+    assert (node['typ'], node['parent']) == ('transform', '')
+    assert node['detail'] == 'createNode transform -n "curve1";\n'
+    assert [hit['name'] for hit in hits] == ['pPlane1Shape'] * 2
+    assert summary and added['name'] == 'added'
+    assert stats['scenes'] == [os.path.abspath(path)]
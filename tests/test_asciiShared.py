@@ -0,0 +1,67 @@
+import gzip
+
+from .. import asciiLoader, asciiShared
+from ..dag import dagBuilder, dagNode
+from . import scenes
+
+
+def get_rows(blocks):
+    return [(type(block), block.index, block.desc, block.command, block.args,
+             block.offset, block.size) for block in blocks]
+
+
+def get_tree(root):
+    return [(node.name, node.typ, node.size, node.index, node.upstream_size,
+             node.total_size, node.parent.index)
+            for node in dagNode.get_children(root)]
+
+
+def write_scene(tmp_path):
+    return scenes.write_scene(
+        tmp_path / 'scene.ma',
+        scenes.get_plane('pPlane1', 4),
+        'createNode transform -n "grp";\n',
+        'createNode transform -n "child" -p "grp";\n',
+        'createNode transform -n "leaf" -p "|grp|child";\n',
+        scenes.CURVE,
+        scenes.ANIM_CURVE,
+        'connectAttr "pPlane1_translateX.o" "pPlane1.tx";\n'
+    )
+
+
+def load_local(path):
+    blocks = asciiLoader.Loader().load(path)
+    return blocks, dagBuilder.Builder().build(blocks)
+
+
+def test_shared_load(tmp_path):
+    path = write_scene(tmp_path)
+    blocks, root = load_local(path)
+
+    loader = asciiShared.SharedLoader()
+    events = list()
+    idles = list()
+    loader.event_occurred.connect(events.append)
+    shared = loader.load(path, idle=lambda: idles.append(None))
+
+    assert get_rows(shared) == get_rows(blocks)
+    assert get_tree(loader.root) == get_tree(root)
+    assert all(block.asc is shared[0].asc for block in shared)
+    assert shared[1].asc.read_bytes(shared[1].offset, shared[1].size) == \
+        blocks[1].asc.read_bytes(blocks[1].offset, blocks[1].size)
+    assert events[-1] == 'File Load Complete' and idles
+
+
+def test_shared_load_compressed(tmp_path):
+    path = write_scene(tmp_path)
+    with open(path, 'rb') as f:
+        data = f.read()
+    with open(path + '.gz', 'wb') as f:
+        f.write(gzip.compress(data))
+    blocks, root = load_local(path)
+
+    # compressed files are loaded in the current process
+    loader = asciiShared.SharedLoader()
+    shared = loader.load(path + '.gz')
+    assert get_rows(shared) == get_rows(blocks)
+    assert get_tree(loader.root) == get_tree(root)
@@ -0,0 +1,49 @@
+import pytest
+
+from .. import asciiAttr, asciiBlock, asciiLoader
+from ..bench import benchCore, sceneGenerator
+
+
+# small enough to run every hot path in a few seconds
+SPEC = sceneGenerator.SceneSpec(
+    transforms=200, curves=50, keys=20, meshes=4, vertices=200,
+    references=2, edits=12, poses=2, requires=2, node_types=8
+)
+
+
+@pytest.fixture(scope='module')
+def scene(tmp_path_factory):
+    path = str(tmp_path_factory.mktemp('bench') / 'bench.ma')
+    sceneGenerator.generate(path, SPEC)
+    return path, asciiLoader.Loader().load(path)
+
+
+@pytest.mark.parametrize(
+    'func, on_blocks',
+    [(func, on_blocks) for _, func, on_blocks in benchCore.BENCHMARKS],
+    ids=[name for name, _, _ in benchCore.BENCHMARKS]
+)
+def test_benchmark(scene, func, on_blocks):
+    path, blocks = scene
+    seconds, size, count, peak = benchCore.measure(
+        func, blocks if on_blocks else path, 1)
+    assert size > 0
+    assert count > 0
+
+
+def test_generated_arrays(scene):
+    path, blocks = scene
+    named = dict(
+        (block.name, block) for block in blocks
+        if isinstance(block, asciiBlock.NodeBlock)
+    )
+
+    mesh = asciiAttr.read_arrays(named['mesh0Shape'])
+    counts, edges = mesh['.fc']
+    assert counts.tolist() == [4] * SPEC.vertices
+    assert len(edges) == 4 * SPEC.vertices
+
+    pose = asciiAttr.read_arrays(named['bindPose0'])
+    assert pose['.wm'].shape == (sceneGenerator.POSE_MEMBERS, 4, 4)
+    assert pose['.xm'].shape == (
+        sceneGenerator.POSE_MEMBERS, asciiAttr.XFORM_WIDTH)
@@ -0,0 +1,30 @@
+from .. import asciiLoader
+from ..dag import dagBuilder, dagNode
+from ..dg import dgGraph
+from . import scenes
+
+
+def get_tree(root):
+    return [(node.name, node.parent.name, node.size, node.upstream_size)
+            for node in dagNode.get_children(root)]
+
+
+def test_build_upstream_sizes(tmp_path):
+    blocks = asciiLoader.Loader().load(scenes.write_scene(
+        tmp_path / 'scene.ma',
+        scenes.get_plane('pPlane1', 2),
+        scenes.ANIM_CURVE,
+        'connectAttr "pPlane1_translateX.o" "pPlane1.tx";\n'
+    ))
+    root = dagBuilder.Builder().build(blocks)
+
+    # the transform carries the size of the curve driving it
+    nodes = dict((node.name, node) for node in dagNode.get_children(root))
+    transform, curve = nodes['pPlane1'], nodes['pPlane1_translateX']
+    assert transform.upstream_size == transform.size + curve.size
+    assert nodes['pPlane1Shape'].parent is transform
+
+    # a graph built for another analysis gives the same tree
+    graph = dgGraph.DependGraph(blocks)
+    assert get_tree(dagBuilder.Builder().build(blocks, graph)) == \
+        get_tree(root)
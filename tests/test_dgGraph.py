@@ -0,0 +1,85 @@
+import gc
+import time
+
+from .. import asciiLoader
+from ..dg import dgGraph
+from . import scenes
+
+
+def get_chain(count):
+    """
+    Get a chain of transforms, each one driven by the previous one
+    """
+    nodes = ''.join(
+        'createNode transform -n "n{}";\n'.format(i) for i in range(count))
+    connections = ''.join(
+        'connectAttr "n{}.tx" "n{}.tx";\n'.format(i, i + 1)
+        for i in range(count - 1))
+    return nodes + connections
+
+
+def get_diamond(width):
+    """
+    Get a wide diamond, a source feeding many branches merging into a sink
+    """
+    nodes = ['createNode transform -n "source";\n']
+    connections = list()
+    for i in range(width):
+        nodes.append('createNode transform -n "b{}";\n'.format(i))
+        connections.append('connectAttr "source.tx" "b{}.tx";\n'.format(i))
+        connections.append('connectAttr "b{0}.tx" "sink.ra[{0}]";\n'.format(i))
+    nodes.append('createNode transform -n "sink";\n')
+    return ''.join(nodes + connections)
+
+
+def load_graph(path, body):
+    return dgGraph.DependGraph(
+        asciiLoader.Loader().load(scenes.write_scene(path, body)))
+
+
+def test_get_upstream_sizes_chain(tmp_path):
+    graph = load_graph(tmp_path / 'chain.ma', get_chain(50))
+    sizes = graph.get_upstream_sizes()
+    for index in range(graph.count):
+        assert sizes[index] == sum(graph.size(i) for i in range(index + 1))
+
+
+def test_get_upstream_sizes_diamond(tmp_path):
+    width = 20
+    graph = load_graph(tmp_path / 'diamond.ma', get_diamond(width))
+    sizes = graph.get_upstream_sizes()
+
+    source = graph.find('source')
+    sink = graph.find('sink')
+    branches = [graph.find('b{}'.format(i)) for i in range(width)]
+    for branch in branches:
+        assert sizes[branch] == graph.size(branch) + graph.size(source)
+
+    # the source is counted once per branch, an upper bound of the exact size
+    assert sizes[sink] == graph.size(sink) + sum(sizes[b] for b in branches)
+    exact = sum(graph.size(i) for i in graph.get_upstream(sink))
+    assert sizes[sink] == exact + (width - 1) * graph.size(source)
+
+
+def test_get_upstream_sizes_linear(tmp_path):
+    def measure(count):
+        blocks = asciiLoader.Loader().load(scenes.write_scene(
+            tmp_path / 'chain{}.ma'.format(count), get_chain(count)))
+        best = None
+        # collections of the growing lists would add to the timings
+        gc.disable()
+        try:
+            for _ in range(3):
+                graph = dgGraph.DependGraph(blocks)
+                start = time.perf_counter()
+                graph.get_upstream_sizes()
+                duration = time.perf_counter() - start
+                best = duration if best is None else min(best, duration)
+        finally:
+            gc.enable()
+        return best
+
+    small = measure(10000)
+    large = measure(80000)
+    # 8 times the nodes, a quadratic pass would take 64 times longer
+    assert large < small * 12
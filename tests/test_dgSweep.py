@@ -0,0 +1,33 @@
+from .. import asciiLoader
+from ..dg import dgGraph, dgSweep
+from . import scenes
+
+
+SWEEP = '''createNode animCurveTU -n "orphan_curve";
+\tsetAttr -s 2 ".ktv[0:1]"  1 0 10 1;
+createNode multiplyDivide -n "orphan_md";
+createNode animCurveTU -n "used_curve";
+\tsetAttr -s 2 ".ktv[0:1]"  1 0 10 1;
+createNode groupId -n "groupId1";
+connectAttr "orphan_md.ox" "orphan_curve.i";
+connectAttr "used_curve.o" "pPlane1.v";
+connectAttr "groupId1.id" ":initialShadingGroup.gn" -na;
+'''
+
+
+def test_orphans(tmp_path):
+    blocks = asciiLoader.Loader().load(scenes.write_scene(
+        tmp_path / 'sweep.ma', scenes.get_plane('pPlane1', 2), SWEEP))
+    orphans = dgSweep.Orphan.from_blocks(blocks)
+
+    # nothing downstream of the multiplyDivide is in use either
+    assert sorted(orphan.name for orphan in orphans) == \
+        ['orphan_curve', 'orphan_md']
+    assert orphans[0].size >= orphans[1].size
+    assert dgSweep.get_savings(orphans) == sum(
+        block.size for block in blocks
+        if getattr(block, 'name', '') in ('orphan_curve', 'orphan_md'))
+
+    # a graph built for another analysis gives the same sweep
+    graph = dgGraph.DependGraph(blocks)
+    assert dgSweep.Orphan.from_blocks(blocks, graph) == orphans
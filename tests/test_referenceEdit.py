@@ -0,0 +1,33 @@
+from .. import asciiLoader
+from ..block import referenceEdit
+from . import scenes
+
+
+REFERENCE_FILE = '''file -r -ns "rig" -dr 1 -rfn "rigRN" -typ "mayaAscii" "C:/assets/rig.ma";
+'''
+
+
+def test_reference_edits(tmp_path):
+    blocks = asciiLoader.Loader().load(scenes.write_scene(
+        tmp_path / 'shot.ma', REFERENCE_FILE, scenes.REFERENCE))
+    edits = referenceEdit.get_edits(blocks)
+    assert [(kind, target) for kind, target, _ in edits['rigRN']] == [
+        ('set_attr', '|rig:ctrl'),
+        ('connect_attr', '|rig:ctrl.instObjGroups'),
+    ]
+
+    ref_edit, = referenceEdit.ReferenceEdit.from_blocks(blocks)
+    assert (ref_edit.ref_node, ref_edit.path, ref_edit.namespace) == \
+        ('rigRN', 'C:/assets/rig.ma', 'rig')
+    assert (ref_edit.edits, ref_edit.set_attr, ref_edit.connect_attr) == \
+        (2, 1, 1)
+    assert ref_edit.size == sum(size for _, _, size in edits['rigRN'])
+
+    namespace, = referenceEdit.EditNamespace.from_blocks(blocks)
+    assert namespace == ('rigRN', 'rig', 2, ref_edit.size)
+
+    # edits read once can be shared by both tables
+    assert referenceEdit.ReferenceEdit.from_blocks(blocks, edits) == \
+        [ref_edit]
+    assert referenceEdit.EditNamespace.from_blocks(blocks, edits) == \
+        [namespace]